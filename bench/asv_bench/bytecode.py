@@ -0,0 +1,44 @@
+"""
+Benchmarks of reading and writing large modules in the bytecode format, compared to
+the textual format.
+"""
+
+from io import BytesIO
+
+from xdsl.bytecode import BytecodeReader, BytecodeWriter
+from xdsl.context import MLContext
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.test import Test
+from xdsl.parser import Parser
+
+ADD_OPERATION = "%{i} = arith.addi %{prev}, %{prev} : i32\n"
+
+
+class ReadModule:
+    """Read a module of arithmetic operations."""
+
+    params = [100, 10000]
+    param_names = ["num_operations"]
+
+    def setup(self, num_operations: int) -> None:
+        self.ctx = MLContext()
+        self.ctx.load_dialect(Builtin)
+        self.ctx.load_dialect(Arith)
+        self.ctx.load_dialect(Test)
+        self.program = '%0 = "test.op"() : () -> i32\n' + "".join(
+            ADD_OPERATION.format(i=i + 1, prev=i) for i in range(num_operations)
+        )
+        self.module: ModuleOp = Parser(self.ctx, self.program).parse_module()
+        stream = BytesIO()
+        BytecodeWriter(stream).write_op(self.module)
+        self.bytecode = stream.getvalue()
+
+    def time_parse_text(self, num_operations: int) -> None:
+        Parser(self.ctx, self.program).parse_module()
+
+    def time_read_bytecode(self, num_operations: int) -> None:
+        BytecodeReader(self.ctx, self.bytecode).read_module()
+
+    def time_write_bytecode(self, num_operations: int) -> None:
+        BytecodeWriter(BytesIO()).write_op(self.module)
@@ -10,3 +10,21 @@ def timeraw_import_inspect():
     return """
     from xdsl.xdsl_opt_main import xDSLOptMain
     """
+
+
+def timeraw_run_empty_program():
+    """
+    A benchmark that measures the time to run xdsl-opt on an empty module, including
+    imports, argument parsing, dialect loading, parsing, and printing.
+    """
+    return """
+    import sys
+    from contextlib import redirect_stdout
+    from io import StringIO
+
+    from xdsl.xdsl_opt_main import xDSLOptMain
+
+    sys.stdin = StringIO("builtin.module {\\n}")
+    with redirect_stdout(StringIO()):
+        xDSLOptMain(args=[]).run()
+    """
@@ -0,0 +1,168 @@
+"""
+Benchmarks of the interpreter on loops.
+"""
+
+from xdsl.context import MLContext
+from xdsl.dialects import linalg
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp, TensorType, f64
+from xdsl.dialects.func import Func
+from xdsl.dialects.linalg import Linalg
+from xdsl.dialects.scf import Scf
+from xdsl.interpreter import Interpreter, OpCounter
+from xdsl.interpreters.arith import ArithFunctions
+from xdsl.interpreters.func import FuncFunctions
+from xdsl.interpreters.linalg import LinalgFunctions
+from xdsl.interpreters.ptr import TypedPtr
+from xdsl.interpreters.scf import ScfFunctions
+from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.parser import Parser
+from xdsl.utils.test_value import TestSSAValue
+
+SCF_FOR_PROGRAM = """
+func.func @main() -> index {{
+  %lb = arith.constant 0 : index
+  %ub = arith.constant {num_iterations} : index
+  %step = arith.constant 1 : index
+  %two = arith.constant 2 : index
+  %res = scf.for %i = %lb to %ub step %step iter_args(%acc = %lb) -> (index) {{
+    %double = arith.muli %i, %two : index
+    %next = arith.addi %acc, %double : index
+    scf.yield %next : index
+  }}
+  func.return %res : index
+}}
+"""
+
+
+class InterpretScfFor:
+    """Interpret an `scf.for` loop with a small body."""
+
+    params = ([False, True], [10000])
+    param_names = ["compile_regions", "num_iterations"]
+
+    def setup(self, compile_regions: bool, num_iterations: int) -> None:
+        ctx = MLContext()
+        for dialect in (Builtin, Arith, Func, Scf):
+            ctx.load_dialect(dialect)
+        module = Parser(
+            ctx, SCF_FOR_PROGRAM.format(num_iterations=num_iterations)
+        ).parse_module()
+        self.interpreter = Interpreter(module, compile_regions=compile_regions)
+        self.interpreter.register_implementations(ArithFunctions())
+        self.interpreter.register_implementations(FuncFunctions())
+        self.interpreter.register_implementations(ScfFunctions())
+
+    def time_run(self, compile_regions: bool, num_iterations: int) -> None:
+        self.interpreter.call_op("main", ())
+
+
+SCF_FOR_NEST_PROGRAM = """
+func.func @main() -> index {{
+  %lb = arith.constant 0 : index
+  %ub = arith.constant {num_iterations} : index
+  %step = arith.constant 1 : index
+  %res = scf.for %i = %lb to %ub step %step iter_args(%acc = %lb) -> (index) {{
+    %inner = scf.for %j = %lb to %ub step %step iter_args(%acc2 = %acc) -> (index) {{
+      %prod = arith.muli %i, %j : index
+      %next = arith.addi %acc2, %prod : index
+      scf.yield %next : index
+    }}
+    scf.yield %inner : index
+  }}
+  func.return %res : index
+}}
+"""
+
+
+class InterpretScfForNest(InterpretScfFor):
+    """
+    Interpret two nested `scf.for` loops, where the inner loop uses the induction
+    variable of the outer loop.
+    """
+
+    params = ([False, True], [100])
+
+    def setup(self, compile_regions: bool, num_iterations: int) -> None:
+        ctx = MLContext()
+        for dialect in (Builtin, Arith, Func, Scf):
+            ctx.load_dialect(dialect)
+        module = Parser(
+            ctx, SCF_FOR_NEST_PROGRAM.format(num_iterations=num_iterations)
+        ).parse_module()
+        self.interpreter = Interpreter(module, compile_regions=compile_regions)
+        self.interpreter.register_implementations(ArithFunctions())
+        self.interpreter.register_implementations(FuncFunctions())
+        self.interpreter.register_implementations(ScfFunctions())
+
+
+MATMUL_PROGRAM = """
+func.func @matmul(%a : memref<{n}x{n}xf64>, %b : memref<{n}x{n}xf64>, %c : memref<{n}x{n}xf64>) {{
+  linalg.generic {{
+    indexing_maps = [
+      affine_map<(i, j, k) -> (i, k)>,
+      affine_map<(i, j, k) -> (k, j)>,
+      affine_map<(i, j, k) -> (i, j)>
+    ],
+    iterator_types = ["parallel", "parallel", "reduction"]
+  }} ins(%a, %b : memref<{n}x{n}xf64>, memref<{n}x{n}xf64>) outs(%c : memref<{n}x{n}xf64>) {{
+  ^bb0(%x : f64, %y : f64, %acc : f64):
+    %prod = arith.mulf %x, %y : f64
+    %sum = arith.addf %acc, %prod : f64
+    linalg.yield %sum : f64
+  }}
+  func.return
+}}
+"""
+
+
+class InterpretLinalgMatmul:
+    """
+    Interpret a matrix multiplication as a `linalg.generic`, which is vectorized
+    unless a listener observes the operations of its body.
+    """
+
+    params = ([False, True], [32])
+    param_names = ["vectorized", "n"]
+
+    def setup(self, vectorized: bool, n: int) -> None:
+        ctx = MLContext()
+        for dialect in (Builtin, Arith, Func, Linalg):
+            ctx.load_dialect(dialect)
+        module = Parser(ctx, MATMUL_PROGRAM.format(n=n)).parse_module()
+        listener = Interpreter.Listener() if vectorized else OpCounter()
+        self.interpreter = Interpreter(module, listener=listener)
+        self.interpreter.register_implementations(ArithFunctions())
+        self.interpreter.register_implementations(FuncFunctions())
+        self.interpreter.register_implementations(LinalgFunctions())
+        self.args = tuple(
+            ShapedArray(TypedPtr.new_float64([1.0] * (n * n)), [n, n]) for _ in range(3)
+        )
+
+    def time_run(self, vectorized: bool, n: int) -> None:
+        self.interpreter.call_op("matmul", self.args)
+
+
+class InterpretLinalgNamedOps:
+    """Interpret named `linalg` operations on matrices."""
+
+    params = ([128],)
+    param_names = ["n"]
+
+    def setup(self, n: int) -> None:
+        matrix_type = TensorType(f64, [n, n])
+        operands = (TestSSAValue(matrix_type), TestSSAValue(matrix_type))
+        outputs = (TestSSAValue(matrix_type),)
+        self.add = linalg.AddOp(operands, outputs, (matrix_type,))
+        self.matmul = linalg.MatmulOp(operands, outputs, (matrix_type,))
+        self.interpreter = Interpreter(ModuleOp([]))
+        self.interpreter.register_implementations(LinalgFunctions())
+        self.args = tuple(
+            ShapedArray(TypedPtr.new_float64([1.0] * (n * n)), [n, n]) for _ in range(3)
+        )
+
+    def time_add(self, n: int) -> None:
+        self.interpreter.run_op(self.add, self.args)
+
+    def time_matmul(self, n: int) -> None:
+        self.interpreter.run_op(self.matmul, self.args)
@@ -0,0 +1,33 @@
+"""
+Benchmarks of the throughput of the lexer on generic-format MLIR programs.
+"""
+
+from xdsl.utils.lexer import Input, Lexer, Token
+
+GENERIC_OPERATION = (
+    '%{i} = "arith.addi"(%a{i}, %b{i}) <{{"overflowFlags" = #arith.overflow<none>}}> '
+    '{{"name" = "value_{i}", "scale" = 1.500000e+00 : f32}} : (i32, i32) -> i32 '
+    "// comment\n"
+)
+
+
+def _lex_all(input: Input) -> None:
+    lexer = Lexer(input)
+    while lexer.lex().kind is not Token.Kind.EOF:
+        pass
+
+
+class LexGeneric:
+    """Lex a program of generic-format arithmetic operations."""
+
+    params = [100, 10000]
+    param_names = ["num_operations"]
+
+    def setup(self, num_operations: int) -> None:
+        self.input = Input(
+            "".join(GENERIC_OPERATION.format(i=i) for i in range(num_operations)),
+            "<benchmark>",
+        )
+
+    def time_lex(self, num_operations: int) -> None:
+        _lex_all(self.input)
@@ -0,0 +1,44 @@
+"""
+Benchmarks of the throughput of the parser on large generic-format modules.
+"""
+
+from timeit import default_timer
+
+from xdsl.context import MLContext
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin
+from xdsl.dialects.test import Test
+from xdsl.parser import Parser
+
+OPERATION_NAMES = ("arith.addi", "arith.subi", "arith.muli", "arith.andi")
+
+GENERIC_OPERATION = '%{i} = "{name}"(%{prev}, %{prev}) : (i32, i32) -> i32\n'
+
+
+class ParseGeneric:
+    """Parse a module of generic-format arithmetic operations."""
+
+    params = [100, 10000]
+    param_names = ["num_operations"]
+
+    def setup(self, num_operations: int) -> None:
+        self.ctx = MLContext()
+        self.ctx.load_dialect(Builtin)
+        self.ctx.load_dialect(Arith)
+        self.ctx.load_dialect(Test)
+        self.program = '%0 = "test.op"() : () -> i32\n' + "".join(
+            GENERIC_OPERATION.format(
+                i=i + 1, prev=i, name=OPERATION_NAMES[i % len(OPERATION_NAMES)]
+            )
+            for i in range(num_operations)
+        )
+
+    def time_parse(self, num_operations: int) -> None:
+        Parser(self.ctx, self.program).parse_module()
+
+    def track_operations_per_second(self, num_operations: int) -> float:
+        start = default_timer()
+        Parser(self.ctx, self.program).parse_module()
+        return (num_operations + 1) / (default_timer() - start)
+
+    track_operations_per_second.unit = "operations/s"  # pyright: ignore[reportFunctionMemberAccess]
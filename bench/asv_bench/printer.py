@@ -0,0 +1,37 @@
+"""
+Benchmarks of the throughput of the printer on large modules.
+"""
+
+from io import StringIO
+
+from xdsl.context import MLContext
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.test import Test
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+
+ADD_OPERATION = "%{i} = arith.addi %{prev}, %{prev} : i32\n"
+
+
+class PrintModule:
+    """Print a module of arithmetic operations."""
+
+    params = [100, 10000]
+    param_names = ["num_operations"]
+
+    def setup(self, num_operations: int) -> None:
+        ctx = MLContext()
+        ctx.load_dialect(Builtin)
+        ctx.load_dialect(Arith)
+        ctx.load_dialect(Test)
+        program = '%0 = "test.op"() : () -> i32\n' + "".join(
+            ADD_OPERATION.format(i=i + 1, prev=i) for i in range(num_operations)
+        )
+        self.module: ModuleOp = Parser(ctx, program).parse_module()
+
+    def time_print(self, num_operations: int) -> None:
+        Printer(stream=StringIO()).print_op(self.module)
+
+    def time_print_generic(self, num_operations: int) -> None:
+        Printer(stream=StringIO(), print_generic_format=True).print_op(self.module)
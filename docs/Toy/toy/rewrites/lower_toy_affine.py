@@ -365,7 +365,8 @@ class ConstantOpLowering(RewritePattern):
 
         # Scalar constant values for elements of the tensor
         constants: list[arith.Constant] = [
-            arith.Constant(FloatAttr(i.value.data, f64)) for i in constant_value.data
+            arith.Constant(FloatAttr(value, f64))
+            for value in constant_value.get_values()
         ]
 
         # n-d indices of elements
@@ -1,3 +1,4 @@
+import struct
 from collections.abc import Sequence
 
 import pytest
@@ -19,17 +20,22 @@ from xdsl.dialects.builtin import (
     FloatData,
     IndexType,
     IntAttr,
+    IntegerType,
     MemRefType,
     NoneAttr,
     ShapedType,
+    Signedness,
     StridedLayoutAttr,
     SymbolRefAttr,
+    TensorType,
     UnrealizedConversionCastOp,
     VectorBaseTypeAndRankConstraint,
     VectorBaseTypeConstraint,
     VectorRankConstraint,
     VectorType,
     f32,
+    f64,
+    i8,
     i32,
     i64,
 )
@@ -50,8 +56,8 @@ def test_FloatType_bitwidths():
 def test_DenseIntOrFPElementsAttr_fp_type_conversion():
     check1 = DenseIntOrFPElementsAttr.tensor_from_list([4, 5], f32, [])
 
-    value1 = check1.data.data[0].value.data
-    value2 = check1.data.data[1].value.data
+    value1 = check1.get_attrs()[0].value.data
+    value2 = check1.get_attrs()[1].value.data
 
     # Ensure type conversion happened properly during attribute construction.
     assert isinstance(value1, float)
@@ -64,8 +70,8 @@ def test_DenseIntOrFPElementsAttr_fp_type_conversion():
 
     check2 = DenseIntOrFPElementsAttr.tensor_from_list([t1, t2], f32, [])
 
-    value3 = check2.data.data[0].value.data
-    value4 = check2.data.data[1].value.data
+    value3 = check2.get_attrs()[0].value.data
+    value4 = check2.get_attrs()[1].value.data
 
     # Ensure type conversion happened properly during attribute construction.
     assert isinstance(value3, float)
@@ -77,32 +83,138 @@ def test_DenseIntOrFPElementsAttr_fp_type_conversion():
 def test_DenseIntOrFPElementsAttr_from_list():
     attr = DenseIntOrFPElementsAttr.tensor_from_list([5.5], f32, [])
 
-    assert attr.data == ArrayAttr([FloatAttr(5.5, f32)])
+    assert attr.get_attrs() == (FloatAttr(5.5, f32),)
     assert attr.type == AnyTensorType(f32, [])
 
 
-def test_DenseArrayBase_verifier_failure():
-    # Check that a malformed attribute raises a verify error
+def test_DenseIntOrFPElementsAttr_packed_data():
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1, -2, 255, 0], i8, [2, 2])
 
-    with pytest.raises(VerifyException) as err:
-        DenseArrayBase([f32, ArrayAttr([IntAttr(0)])])
-    assert err.value.args[0] == (
-        "dense array of float element type " "should only contain floats"
+    # Signless values that do not fit in the signed storage wrap around
+    assert attr.data.data == b"\x01\xfe\xff\x00"
+    assert attr.get_values() == (1, -2, -1, 0)
+    assert attr.get_num_elements() == 4
+    assert not attr.is_splat()
+
+    splat = DenseIntOrFPElementsAttr.tensor_from_list([1.5] * 3, f64, [3])
+    assert splat.data.data == struct.pack("<3d", 1.5, 1.5, 1.5)
+    assert splat.get_values() == (1.5, 1.5, 1.5)
+    assert splat.is_splat()
+
+    with pytest.raises(VerifyException, match="Integer value 256 is out of range"):
+        DenseIntOrFPElementsAttr.tensor_from_list([256], i8, [1])
+
+    with pytest.raises(VerifyException, match="multiple of 4 bytes"):
+        DenseIntOrFPElementsAttr(TensorType(i32, [1]), b"\x00\x00")
+
+
+def test_DenseIntOrFPElementsAttr_packed_wide_types():
+    # Wide integers are stored in two's complement with the width of their type
+    i128 = IntegerType(128)
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1, -2], i128, [2])
+    assert attr.data.data == (1).to_bytes(16, "little") + b"\xfe" + b"\xff" * 15
+    assert attr.get_values() == (1, -2)
+
+    ui96 = IntegerType(96, Signedness.UNSIGNED)
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([2**96 - 1, 2**96 - 1], ui96, [2])
+    assert attr.data.data == b"\xff" * 24
+    assert attr.get_values() == (2**96 - 1, 2**96 - 1)
+    assert attr.is_splat()
+
+    with pytest.raises(VerifyException, match="multiple of 16 bytes"):
+        DenseIntOrFPElementsAttr(TensorType(i128, [1]), b"\x00" * 8)
+
+    # Floats are stored in their IEEE layout, and x87 layout for f80
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1.0, -2.5], BFloat16Type(), [2])
+    assert attr.data.data == bytes.fromhex("803F20C0")
+    assert attr.get_values() == (1.0, -2.5)
+
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1.0], Float80Type(), [1])
+    assert attr.data.data == bytes.fromhex("0000000000000080FF3F")
+    assert attr.get_values() == (1.0,)
+
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([-2.5, 0.1], Float128Type(), [2])
+    assert attr.data.data[:16] == bytes.fromhex("000000000000000000000000004000C0")
+    # Values of f64 are widened exactly
+    assert attr.get_values() == (-2.5, 0.1)
+
+    # bf16 values are rounded to the nearest even value, like f16 and f32
+    attr = DenseIntOrFPElementsAttr.tensor_from_list(
+        [0.1, float("inf"), -0.0], BFloat16Type(), [3]
     )
+    assert attr.data.data == bytes.fromhex("CD3D807F0080")
+    assert attr.get_values() == (0.10009765625, float("inf"), -0.0)
 
-    with pytest.raises(VerifyException) as err:
-        DenseArrayBase([IndexType(), ArrayAttr([FloatData(0.0)])])
-    assert err.value.args[0] == (
-        "dense array of integer or index element type " "should only contain integers"
+
+def test_DenseIntOrFPElementsAttr_to_numpy():
+    np = pytest.importorskip("numpy")
+
+    attr = DenseIntOrFPElementsAttr.tensor_from_list(
+        [1.0, 2.0, 3.0, 4.0, 5.0, 6.0], f32, [2, 3]
     )
+    array = attr.to_numpy()
+
+    assert array.dtype == np.float32
+    assert array.shape == (2, 3)
+    assert array.tolist() == [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]
+    # The array shares the buffer of the attribute
+    assert not array.flags.owndata
+    assert not array.flags.writeable
+
+    # Elements that NumPy cannot represent are copied
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1, -2], IntegerType(128), [2])
+    array = attr.to_numpy()
+    assert array.dtype == object
+    assert array.tolist() == [1, -2]
+    assert not array.flags.writeable
+
+    attr = DenseIntOrFPElementsAttr.tensor_from_list([1.0, 2.0], BFloat16Type(), [2])
+    array = attr.to_numpy()
+    assert array.dtype == np.float64
+    assert array.tolist() == [1.0, 2.0]
+    assert not array.flags.writeable
+
+
+def test_DenseArrayBase_verifier_failure():
+    # Check that a malformed attribute raises a verify error
 
     with pytest.raises(VerifyException) as err:
-        DenseArrayBase([i32, ArrayAttr([FloatData(0.0)])])
+        DenseArrayBase(i32, b"\x00\x00")
     assert err.value.args[0] == (
-        "dense array of integer or index element type " "should only contain integers"
+        "dense array of i32 expects a buffer of 4-byte values, but got 2 bytes"
     )
 
 
+def test_DenseArrayBase_packed_data():
+    ints = DenseArrayBase.from_list(i32, [1, -1])
+    assert ints.data.data == struct.pack("<2i", 1, -1)
+    assert ints == DenseArrayBase.from_list(i32, [IntAttr(1), IntAttr(-1)])
+    assert hash(ints) == hash(DenseArrayBase.from_list(i32, (1, -1)))
+    assert ints != DenseArrayBase.from_list(i64, [1, -1])
+
+    floats = DenseArrayBase.from_list(f32, [1.5, 2])
+    assert floats.data.data == struct.pack("<2d", 1.5, 2.0)
+    assert floats == DenseArrayBase.from_list(f32, [FloatData(1.5), FloatData(2.0)])
+
+    # Signless values that do not fit in the signed storage wrap around
+    all_ones = DenseArrayBase.from_list(i64, [-1, 2**64 - 1])
+    assert all_ones.data.data == b"\xff" * 16
+    assert all_ones.as_tuple() == (-1, -1)
+    assert DenseArrayBase.from_list(i8, [255]).as_tuple() == (-1,)
+
+    ui64 = IntegerType(64, Signedness.UNSIGNED)
+    assert DenseArrayBase.from_list(ui64, [2**64 - 1]).as_tuple() == (2**64 - 1,)
+
+    wide = DenseArrayBase.from_list(IntegerType(128), [1, -2, 2**128 - 1])
+    assert len(wide.data.data) == 48
+    assert wide.as_tuple() == (1, -2, -1)
+
+    with pytest.raises(VerifyException, match=r"Value 256 does not fit in array<i8>"):
+        DenseArrayBase.from_list(i8, [1, 256])
+    with pytest.raises(VerifyException, match=r"Value -1 does not fit in array<ui64>"):
+        DenseArrayBase.from_list(ui64, [-1])
+
+
 @pytest.mark.parametrize(
     "ref,expected",
     (
@@ -304,3 +416,19 @@ def test_strides():
     assert ShapedType.strides_for_shape((1,), factor=2) == (2,)
     assert ShapedType.strides_for_shape((2, 3)) == (3, 1)
     assert ShapedType.strides_for_shape((4, 5, 6), factor=2) == (60, 12, 2)
+
+
+def test_parametrized_attribute_hash_is_cached():
+    attr = MemRefType(f32, [2, 3])
+    assert "_hash" not in attr.__dict__
+    assert hash(attr) == hash(MemRefType(f32, [2, 3]))
+    assert attr.__dict__["_hash"] == hash(attr)
+    assert attr == MemRefType(f32, [2, 3])
+    assert attr != MemRefType(f32, [3, 2])
+
+
+def test_float_data_bitwise_equality():
+    assert FloatData(0.0) != FloatData(-0.0)
+    assert FloatData(float("nan")) == FloatData(float("nan"))
+    assert hash(FloatData(float("nan"))) == hash(FloatData(float("nan")))
+    assert FloatData(1) == FloatData(1.0)
@@ -137,8 +137,30 @@
   "func.func"() ({}) {function_type = () -> (),
                       value1 = dense<"0xCAFEBABE"> : tensor<2xf32>,
                       value2 = dense<"0xCAFEBABEB00BAABE"> : tensor<1xf64>,
+                      value3 = dense<"0x003C0040"> : tensor<2xf16>,
                       sym_name = "dense_tensor_attr_hex_float"} : () -> ()
-  // CHECK: "value1" = dense<-3.652251e-01> : tensor<2xf32>, "value2" = dense<-7.762213e-07> : tensor<1xf64>
+  // CHECK: "value1" = dense<-3.652251e-01> : tensor<2xf32>, "value2" = dense<-7.762213e-07> : tensor<1xf64>, "value3" = dense<[1.000000e+00, 2.000000e+00]> : tensor<2xf16>
+
+  "func.func"() ({}) {function_type = () -> (),
+                      value1 = dense<[0.1, 1.0e+38]> : tensor<2xbf16>,
+                      value2 = dense<[1.0, -2.5]> : tensor<2xf80>,
+                      value3 = dense<[1.0, -2.5]> : tensor<2xf128>,
+                      sym_name = "dense_tensor_attr_packed_float"} : () -> ()
+  // CHECK: "value1" = dense<[1.000977e-01, 9.969210e+37]> : tensor<2xbf16>, "value2" = dense<[1.000000e+00, -2.500000e+00]> : tensor<2xf80>, "value3" = dense<[1.000000e+00, -2.500000e+00]> : tensor<2xf128>
+
+  "func.func"() ({}) {function_type = () -> (),
+                      value1 = dense<[1, -2]> : tensor<2xi128>,
+                      value2 = dense<[1, 340282366920938463463374607431768211455]> : tensor<2xui128>,
+                      value3 = dense<[-1, 39614081257132168796771975167]> : tensor<2xi96>,
+                      sym_name = "dense_tensor_attr_wide_int"} : () -> ()
+  // CHECK: "value1" = dense<[1, -2]> : tensor<2xi128>, "value2" = dense<[1, 340282366920938463463374607431768211455]> : tensor<2xui128>, "value3" = dense<[-1, 39614081257132168796771975167]> : tensor<2xi96>
+
+  "func.func"() ({}) {function_type = () -> (),
+                      value1 = dense<"0x803F20C0"> : tensor<2xbf16>,
+                      value2 = dense<"0x0000000000000000000000000000FF3F"> : tensor<2xf128>,
+                      value3 = dense<"0xFEFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF"> : tensor<1xi128>,
+                      sym_name = "dense_tensor_attr_hex_packed"} : () -> ()
+  // CHECK: "value1" = dense<[1.000000e+00, -2.500000e+00]> : tensor<2xbf16>, "value2" = dense<1.000000e+00> : tensor<2xf128>, "value3" = dense<-2> : tensor<1xi128>
 
   "func.func"() ({}) {function_type = () -> (),
                       value1 = dense<[0]> : vector<1xi32>,
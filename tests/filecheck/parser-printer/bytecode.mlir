@@ -0,0 +1,69 @@
+// RUN: xdsl-opt %s --allow-unregistered-dialect -t bytecode | xdsl-opt -f xdslbc --allow-unregistered-dialect | filecheck %s
+
+func.func @sum(%arg : i32, %n : index) -> i32 {
+  %zero = arith.constant 0 : index
+  %one = arith.constant 1 : index
+  %res = scf.for %i = %zero to %n step %one iter_args(%acc = %arg) -> (i32) {
+    %next = arith.addi %acc, %acc : i32
+    scf.yield %next : i32
+  }
+  func.return %res : i32
+}
+
+func.func @branch(%cond : i1) {
+  cf.br ^bb2(%cond : i1)
+^bb1:
+  func.return
+^bb2(%c : i1):
+  cf.cond_br %c, ^bb1, ^bb2(%c : i1)
+}
+
+"test.graph_region"() ({
+  "test.op"(%later) : (i64) -> ()
+  %later = "test.op"() {"attr" = #test.type_attr, "array" = array<i32: 1, 2>} : () -> i64
+}) : () -> ()
+
+%0 = "unregistered.op"() {"attr" = #unregistered.attr<"value">} : () -> !unregistered.type
+
+"test.op"() {"blob" = dense_resource<blob1> : tensor<2xi32>} : () -> ()
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob1: "0x040000000100000002000000"
+    }
+  }
+#-}
+
+// CHECK:       builtin.module {
+// CHECK-NEXT:    func.func @sum(%arg : i32, %n : index) -> i32 {
+// CHECK-NEXT:      %zero = arith.constant 0 : index
+// CHECK-NEXT:      %one = arith.constant 1 : index
+// CHECK-NEXT:      %res = scf.for %i = %zero to %n step %one iter_args(%acc = %arg) -> (i32) {
+// CHECK-NEXT:        %next = arith.addi %acc, %acc : i32
+// CHECK-NEXT:        scf.yield %next : i32
+// CHECK-NEXT:      }
+// CHECK-NEXT:      func.return %res : i32
+// CHECK-NEXT:    }
+// CHECK-NEXT:    func.func @branch(%cond : i1) {
+// CHECK-NEXT:      cf.br ^0(%cond : i1)
+// CHECK-NEXT:    ^1:
+// CHECK-NEXT:      func.return
+// CHECK-NEXT:    ^0(%c : i1):
+// CHECK-NEXT:      cf.cond_br %c, ^1, ^0(%c : i1)
+// CHECK-NEXT:    }
+// CHECK-NEXT:    "test.graph_region"() ({
+// CHECK-NEXT:      "test.op"(%later) : (i64) -> ()
+// CHECK-NEXT:      %later = "test.op"() {"attr" = #test.type_attr, "array" = array<i32: 1, 2>} : () -> i64
+// CHECK-NEXT:    }) : () -> ()
+// CHECK-NEXT:    %0 = "unregistered.op"() {"attr" = #unregistered.attr<"value">} : () -> !unregistered.type
+// CHECK-NEXT:    "test.op"() {"blob" = dense_resource<blob1> : tensor<2xi32>} : () -> ()
+// CHECK-NEXT:  }
+
+// CHECK:       {-#
+// CHECK-NEXT:    dialect_resources: {
+// CHECK-NEXT:      builtin: {
+// CHECK-NEXT:        blob1: "0x040000000100000002000000"
+// CHECK-NEXT:      }
+// CHECK-NEXT:    }
+// CHECK-NEXT:  #-}
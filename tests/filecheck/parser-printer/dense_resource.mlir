@@ -0,0 +1,31 @@
+// RUN: xdsl-opt %s | filecheck %s
+// RUN: xdsl-opt %s | xdsl-opt | filecheck %s
+
+"test.op"() {attr = dense_resource<blob1> : tensor<3xi64>} : () -> ()
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob1: "0x08000000010000000000000002000000000000000300000000000000",
+      unused: "0x0400000001000000"
+    },
+    test: {
+      other: "0x0100000001"
+    }
+  }
+#-}
+
+// CHECK:      builtin.module {
+// CHECK-NEXT:   "test.op"() {"attr" = dense_resource<blob1> : tensor<3xi64>} : () -> ()
+// CHECK-NEXT: }
+// CHECK-EMPTY:
+// CHECK-NEXT: {-#
+// CHECK-NEXT:   dialect_resources: {
+// CHECK-NEXT:     builtin: {
+// CHECK-NEXT:       blob1: "0x08000000010000000000000002000000000000000300000000000000"
+// CHECK-NEXT:     },
+// CHECK-NEXT:     test: {
+// CHECK-NEXT:       other: "0x0100000001"
+// CHECK-NEXT:     }
+// CHECK-NEXT:   }
+// CHECK-NEXT: #-}
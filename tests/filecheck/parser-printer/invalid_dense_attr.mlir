@@ -1,8 +1,8 @@
 // RUN: xdsl-opt %s --parsing-diagnostics --split-input-file | filecheck %s
 
-"func.func"() ({}) {function_type = () -> (), value1 = dense<"0x0BAD"> : tensor<2xf16>, sym_name = "unsupported_float"} : () -> ()
+"func.func"() ({}) {function_type = () -> (), value1 = dense<"0x0BAD"> : tensor<2xindex>, sym_name = "unsupported_index"} : () -> ()
 
-// CHECK: Hex strings for dense literals are only supported for int, f32 and f64 types
+// CHECK: Hex strings for dense literals are only supported for int and float types
 
 // -----
 
@@ -0,0 +1,37 @@
+// RUN: xdsl-opt %s --parsing-diagnostics --split-input-file | filecheck %s
+
+"test.op"() : () -> ()
+
+{-#
+  external_resources: {}
+#-}
+
+// CHECK: Unsupported file metadata section 'external_resources', only 'dialect_resources' is supported
+
+// -----
+
+"test.op"() : () -> ()
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: "0x01"
+    }
+  }
+#-}
+
+// CHECK: Expected a hex string of the form 0x<alignment><data>
+
+// -----
+
+"test.op"() : () -> ()
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: 1
+    }
+  }
+#-}
+
+// CHECK: Expected hex string for resource blob
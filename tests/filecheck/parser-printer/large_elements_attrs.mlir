@@ -0,0 +1,49 @@
+// RUN: xdsl-opt %s --elide-elementsattrs-if-larger 2 | filecheck %s --check-prefix=ELIDE
+// RUN: xdsl-opt %s --print-elementsattrs-with-hex-if-larger 2 | filecheck %s --check-prefix=HEX
+// RUN: xdsl-opt %s --print-elementsattrs-with-hex-if-larger 2 | xdsl-opt | filecheck %s
+
+"test.op"() {
+  "small" = dense<[1, 2]> : tensor<2xi32>,
+  "ints" = dense<[1, -2, 3]> : tensor<3xi32>,
+  "floats" = dense<[1.0, 2.0, 3.0]> : tensor<3xf32>,
+  "splat" = dense<7> : tensor<4xi32>,
+  "index" = dense<[1, 2, 3]> : tensor<3xindex>,
+  "bf16" = dense<[1.0, -2.5, 3.0]> : tensor<3xbf16>,
+  "f80" = dense<[1.0, -2.5, 3.0]> : tensor<3xf80>,
+  "f128" = dense<[1.0, -2.5, 3.0]> : tensor<3xf128>,
+  "i128" = dense<[1, -2, 3]> : tensor<3xi128>,
+  "i24" = dense<[1, -2, 3]> : tensor<3xi24>
+} : () -> ()
+
+// ELIDE:      "small" = dense<[1, 2]> : tensor<2xi32>
+// ELIDE-SAME: "ints" = dense_resource<__elided__> : tensor<3xi32>
+// ELIDE-SAME: "floats" = dense_resource<__elided__> : tensor<3xf32>
+// ELIDE-SAME: "splat" = dense<7> : tensor<4xi32>
+// ELIDE-SAME: "index" = dense_resource<__elided__> : tensor<3xindex>
+// ELIDE-SAME: "bf16" = dense_resource<__elided__> : tensor<3xbf16>
+// ELIDE-SAME: "f80" = dense_resource<__elided__> : tensor<3xf80>
+// ELIDE-SAME: "f128" = dense_resource<__elided__> : tensor<3xf128>
+// ELIDE-SAME: "i128" = dense_resource<__elided__> : tensor<3xi128>
+// ELIDE-SAME: "i24" = dense_resource<__elided__> : tensor<3xi24>
+
+// HEX:      "small" = dense<[1, 2]> : tensor<2xi32>
+// HEX-SAME: "ints" = dense<"0x01000000FEFFFFFF03000000"> : tensor<3xi32>
+// HEX-SAME: "floats" = dense<"0x0000803F0000004000004040"> : tensor<3xf32>
+// HEX-SAME: "splat" = dense<7> : tensor<4xi32>
+// HEX-SAME: "index" = dense<[1, 2, 3]> : tensor<3xindex>
+// HEX-SAME: "bf16" = dense<"0x803F20C04040"> : tensor<3xbf16>
+// HEX-SAME: "f80" = dense<"0x0000000000000080FF3F00000000000000A000C000000000000000C00040"> : tensor<3xf80>
+// HEX-SAME: "f128" = dense<"0x0000000000000000000000000000FF3F000000000000000000000000004000C000000000000000000000000000800040"> : tensor<3xf128>
+// HEX-SAME: "i128" = dense<"0x01000000000000000000000000000000FEFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF03000000000000000000000000000000"> : tensor<3xi128>
+// HEX-SAME: "i24" = dense<[1, -2, 3]> : tensor<3xi24>
+
+// CHECK:      "small" = dense<[1, 2]> : tensor<2xi32>
+// CHECK-SAME: "ints" = dense<[1, -2, 3]> : tensor<3xi32>
+// CHECK-SAME: "floats" = dense<[1.000000e+00, 2.000000e+00, 3.000000e+00]> : tensor<3xf32>
+// CHECK-SAME: "splat" = dense<7> : tensor<4xi32>
+// CHECK-SAME: "index" = dense<[1, 2, 3]> : tensor<3xindex>
+// CHECK-SAME: "bf16" = dense<[1.000000e+00, -2.500000e+00, 3.000000e+00]> : tensor<3xbf16>
+// CHECK-SAME: "f80" = dense<[1.000000e+00, -2.500000e+00, 3.000000e+00]> : tensor<3xf80>
+// CHECK-SAME: "f128" = dense<[1.000000e+00, -2.500000e+00, 3.000000e+00]> : tensor<3xf128>
+// CHECK-SAME: "i128" = dense<[1, -2, 3]> : tensor<3xi128>
+// CHECK-SAME: "i24" = dense<[1, -2, 3]> : tensor<3xi24>
@@ -0,0 +1,31 @@
+// RUN: xdsl-opt %s --print-aliases | filecheck %s
+// RUN: xdsl-opt %s --print-aliases | xdsl-opt --no-implicit-module | filecheck %s --check-prefix=ROUNDTRIP
+
+%0 = "test.op"() : () -> !stencil.field<[-4,68]x[-4,68]x[-4,68]xf64>
+%1 = "test.op"(%0) : (!stencil.field<[-4,68]x[-4,68]x[-4,68]xf64>) -> memref<8x8xf32, strided<[16, 1], offset: 4>>
+"test.op"(%1) {"attr" = memref<8x8xf32, strided<[16, 1], offset: 4>>} : (memref<8x8xf32, strided<[16, 1], offset: 4>>) -> ()
+"test.op"() {"a" = dense<[1, 2, 3, 4]> : tensor<4xi32>, "b" = dense<[1, 2, 3, 4]> : tensor<4xi32>} : () -> ()
+"test.op"() {"a" = dense<[5, 6, 7, 8]> : tensor<4xi32>, "b" = dense<[5, 6, 7, 8]> : tensor<4xi32>} : () -> ()
+"test.op"() {"short" = i32, "other" = i32} : () -> ()
+
+// CHECK:      !stencil_field = !stencil.field<[-4,68]x[-4,68]x[-4,68]xf64>
+// CHECK-NEXT: !memref = memref<8x8xf32, strided<[16, 1], offset: 4>>
+// CHECK-NEXT: #dense = dense<[1, 2, 3, 4]> : tensor<4xi32>
+// CHECK-NEXT: #dense1 = dense<[5, 6, 7, 8]> : tensor<4xi32>
+// CHECK-NEXT: builtin.module {
+// CHECK-NEXT:   %0 = "test.op"() : () -> !stencil_field
+// CHECK-NEXT:   %1 = "test.op"(%0) : (!stencil_field) -> !memref
+// CHECK-NEXT:   "test.op"(%1) {"attr" = !memref} : (!memref) -> ()
+// CHECK-NEXT:   "test.op"() {"a" = #dense, "b" = #dense} : () -> ()
+// CHECK-NEXT:   "test.op"() {"a" = #dense1, "b" = #dense1} : () -> ()
+// CHECK-NEXT:   "test.op"() {"short" = i32, "other" = i32} : () -> ()
+// CHECK-NEXT: }
+
+// ROUNDTRIP:      builtin.module {
+// ROUNDTRIP-NEXT:   %0 = "test.op"() : () -> !stencil.field<[-4,68]x[-4,68]x[-4,68]xf64>
+// ROUNDTRIP-NEXT:   %1 = "test.op"(%0) : (!stencil.field<[-4,68]x[-4,68]x[-4,68]xf64>) -> memref<8x8xf32, strided<[16, 1], offset: 4>>
+// ROUNDTRIP-NEXT:   "test.op"(%1) {"attr" = memref<8x8xf32, strided<[16, 1], offset: 4>>} : (memref<8x8xf32, strided<[16, 1], offset: 4>>) -> ()
+// ROUNDTRIP-NEXT:   "test.op"() {"a" = dense<[1, 2, 3, 4]> : tensor<4xi32>, "b" = dense<[1, 2, 3, 4]> : tensor<4xi32>} : () -> ()
+// ROUNDTRIP-NEXT:   "test.op"() {"a" = dense<[5, 6, 7, 8]> : tensor<4xi32>, "b" = dense<[5, 6, 7, 8]> : tensor<4xi32>} : () -> ()
+// ROUNDTRIP-NEXT:   "test.op"() {"short" = i32, "other" = i32} : () -> ()
+// ROUNDTRIP-NEXT: }
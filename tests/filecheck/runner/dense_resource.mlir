@@ -0,0 +1,21 @@
+// RUN: xdsl-run --verbose %s | filecheck %s
+
+builtin.module {
+  "memref.global"() {"sym_name" = "g", "type" = memref<3xi64>, "initial_value" = dense_resource<blob1> : tensor<3xi64>, "sym_visibility" = "public", "constant"} : () -> ()
+  func.func @main() -> i64 {
+    %m = "memref.get_global"() {"name" = @g} : () -> memref<3xi64>
+    %c = arith.constant 2 : index
+    %v = memref.load %m[%c] : memref<3xi64>
+    func.return %v : i64
+  }
+}
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob1: "0x08000000010000000000000002000000000000000300000000000000"
+    }
+  }
+#-}
+
+// CHECK: result: 3
@@ -0,0 +1,28 @@
+// RUN: xdsl-run --profile %s 2>&1 | filecheck %s
+// RUN: xdsl-run --compile-regions --profile-output %t --profile-format collapsed %s && filecheck %s --check-prefix=STACKS < %t
+
+builtin.module {
+  func.func @double(%x : i64) -> i64 {
+    %r = arith.addi %x, %x : i64
+    func.return %r : i64
+  }
+  func.func @main() -> i64 {
+    %one = arith.constant 1 : i64
+    %a = func.call @double(%one) : (i64) -> i64
+    %b = func.call @double(%a) : (i64) -> i64
+    func.return %b : i64
+  }
+}
+
+// CHECK:      operation {{ +}}count {{ +}}inclusive {{ +}}exclusive
+// CHECK-DAG:  func.call {{ +}}2 {{ +}}
+// CHECK-DAG:  arith.addi {{ +}}2 {{ +}}
+// CHECK-DAG:  func.return {{ +}}3 {{ +}}
+// CHECK:      function {{ +}}count {{ +}}inclusive {{ +}}exclusive
+// CHECK-DAG:  main {{ +}}1 {{ +}}
+// CHECK-DAG:  double {{ +}}2 {{ +}}
+
+// STACKS-DAG: @main;arith.constant {{[0-9]+}}
+// STACKS-DAG: @main;func.call {{[0-9]+}}
+// STACKS-DAG: @main;func.call;@double;arith.addi {{[0-9]+}}
+// STACKS-DAG: @main;func.call;@double;func.return {{[0-9]+}}
@@ -0,0 +1,32 @@
+// RUN: xdsl-opt --split-input-file --verify-diagnostics -j 2 %s | filecheck %s
+
+"test.op"() : () -> ()
+
+// CHECK:       builtin.module {
+// CHECK-NEXT:    "test.op"() : () -> ()
+// CHECK-NEXT:  }
+
+// -----
+
+"test.op"() {"attr" = 1 : i32} : () -> ()
+
+// CHECK:       // {{-----}}
+// CHECK-NEXT:  builtin.module {
+// CHECK-NEXT:    "test.op"() {"attr" = 1 : i32} : () -> ()
+// CHECK-NEXT:  }
+
+// -----
+
+%clk = "test.op"() : () -> !seq.clock
+%div_clk = seq.clock_div %clk by 5
+
+// CHECK:       // {{-----}}
+// CHECK-NEXT:  Operation does not verify: divider value 5 is not a power of 2
+// CHECK:       // {{-----}}
+// CHECK-NEXT:  builtin.module {
+// CHECK-NEXT:    %0 = "test.op"() : () -> i32
+// CHECK-NEXT:  }
+
+// -----
+
+%0 = "test.op"() : () -> i32
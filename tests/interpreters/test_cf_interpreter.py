@@ -54,8 +54,8 @@ def sum_to_op():
     )
 
 
-def sum_to_interp(n: int) -> int:
-    interpreter = Interpreter(sum_to_op)
+def sum_to_interp(n: int, compile_regions: bool = False) -> int:
+    interpreter = Interpreter(sum_to_op, compile_regions=compile_regions)
     interpreter.register_implementations(CfFunctions())
     interpreter.register_implementations(FuncFunctions())
     interpreter.register_implementations(ArithFunctions())
@@ -64,5 +64,6 @@ def sum_to_interp(n: int) -> int:
 
 
 @pytest.mark.parametrize("n", (0, 1, 2, 3, 4))
-def test_sum_to(n: int):
-    assert sum_to_fn(n) == sum_to_interp(n)
+@pytest.mark.parametrize("compile_regions", (False, True))
+def test_sum_to(n: int, compile_regions: bool):
+    assert sum_to_fn(n) == sum_to_interp(n, compile_regions)
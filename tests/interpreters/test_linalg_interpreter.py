@@ -1,3 +1,5 @@
+import struct
+
 import pytest
 
 from xdsl.builder import ImplicitBuilder
@@ -7,15 +9,18 @@ from xdsl.dialects.builtin import (
     DenseArrayBase,
     DenseIntOrFPElementsAttr,
     FloatAttr,
+    IntegerType,
     MemRefType,
     ModuleOp,
     StringAttr,
     TensorType,
     f32,
+    f64,
     i32,
     i64,
 )
-from xdsl.interpreter import Interpreter
+from xdsl.interpreter import Interpreter, OpCounter
+from xdsl.interpreters import linalg as linalg_interpreter
 from xdsl.interpreters.arith import ArithFunctions
 from xdsl.interpreters.linalg import LinalgFunctions
 from xdsl.interpreters.ptr import TypedPtr
@@ -171,6 +176,142 @@ def test_linalg_generic_reduction():
     assert c.data == [32]
 
 
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_linalg_generic_matmul(vectorized: bool):
+    # The body is run for each point when its operations are observed
+    counter = OpCounter()
+    interpreter = Interpreter(
+        ModuleOp([]), listener=Interpreter.Listener() if vectorized else counter
+    )
+    interpreter.register_implementations(LinalgFunctions())
+    if not vectorized:
+        # The implementations are only used to run the body for each point
+        interpreter.register_implementations(ArithFunctions())
+
+    op = linalg.Generic(
+        (
+            TestSSAValue(MemRefType(f32, [3, 2])),
+            TestSSAValue(MemRefType(f32, [3, 2])),
+        ),
+        (TestSSAValue(MemRefType(f32, [3, 3])),),
+        Region(Block(arg_types=(f32, f32, f32))),
+        (
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (i, k))),
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (j, k))),
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (i, j))),
+        ),
+        (
+            linalg.IteratorTypeAttr.parallel(),
+            linalg.IteratorTypeAttr.parallel(),
+            linalg.IteratorTypeAttr.reduction(),
+        ),
+    )
+
+    with ImplicitBuilder(op.body) as (lhs, rhs, acc):
+        prod = arith.Mulf(lhs, rhs).result
+        new_acc = arith.Addf(acc, prod).result
+        linalg.YieldOp(new_acc)
+
+    a = ShapedArray(TypedPtr.new_float32([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]), [3, 2])
+    b = ShapedArray(TypedPtr.new_float32([4.0, 1.0, 3.0, 2.0, 5.0, 8.0]), [3, 2])
+    c = ShapedArray(TypedPtr.new_float32([1.0] * 9), [3, 3])
+
+    interpreter.run_op(op, (a, b, c))
+
+    assert c == ShapedArray(
+        TypedPtr.new_float32([7.0, 8.0, 22.0, 17.0, 18.0, 48.0, 27.0, 28.0, 74.0]),
+        [3, 3],
+    )
+    if not vectorized:
+        assert counter.ops["arith.mulf"] == 18
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_linalg_generic_outer_value(vectorized: bool):
+    counter = OpCounter()
+    interpreter = Interpreter(
+        ModuleOp([]), listener=Interpreter.Listener() if vectorized else counter
+    )
+    interpreter.register_implementations(LinalgFunctions())
+    if not vectorized:
+        interpreter.register_implementations(ArithFunctions())
+
+    # The body yields a constant defined outside of it
+    one = arith.Constant(FloatAttr(1.0, f32))
+    interpreter.set_values(((one.result, 1.0),))
+
+    op = linalg.Generic(
+        (TestSSAValue(MemRefType(f32, [3])),),
+        (TestSSAValue(MemRefType(f32, [3])),),
+        Region(Block(arg_types=(f32, f32))),
+        (
+            AffineMapAttr(AffineMap.identity(1)),
+            AffineMapAttr(AffineMap.identity(1)),
+        ),
+        (linalg.IteratorTypeAttr.parallel(),),
+    )
+
+    with ImplicitBuilder(op.body):
+        linalg.YieldOp(one.result)
+
+    a = ShapedArray(TypedPtr.new_float32([1.0, 2.0, 3.0]), [3])
+    b = ShapedArray(TypedPtr.new_float32([0.0] * 3), [3])
+
+    interpreter.run_op(op, (a, b))
+
+    assert b.data == [1.0, 1.0, 1.0]
+    if not vectorized:
+        assert counter.ops["linalg.yield"] == 3
+
+
+def _integer_add_generic(element_type: IntegerType) -> linalg.Generic:
+    op = linalg.Generic(
+        (
+            TestSSAValue(MemRefType(element_type, [2])),
+            TestSSAValue(MemRefType(element_type, [2])),
+        ),
+        (TestSSAValue(MemRefType(element_type, [2])),),
+        Region(Block(arg_types=(element_type,) * 3)),
+        (AffineMapAttr(AffineMap.identity(1)),) * 3,
+        (linalg.IteratorTypeAttr.parallel(),),
+    )
+    with ImplicitBuilder(op.body) as (lhs, rhs, _out):
+        linalg.YieldOp(arith.Addi(lhs, rhs).result)
+    return op
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_linalg_generic_narrow_integer_overflow(vectorized: bool):
+    interpreter = Interpreter(
+        ModuleOp([]),
+        listener=Interpreter.Listener() if vectorized else OpCounter(),
+    )
+    interpreter.register_implementations(LinalgFunctions())
+    interpreter.register_implementations(ArithFunctions())
+
+    a = ShapedArray(TypedPtr.new_int32([1, 2**31 - 1]), [2])
+    b = ShapedArray(TypedPtr.new_int32([1, 1]), [2])
+    c = ShapedArray(TypedPtr.new_int32([0, 0]), [2])
+
+    # Narrow integer outputs are not vectorized, so overflows fail when stored
+    with pytest.raises(struct.error):
+        interpreter.run_op(_integer_add_generic(i32), (a, b, c))
+
+
+def test_linalg_generic_vectorized_i64_wraps_around():
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(LinalgFunctions())
+
+    a = ShapedArray(TypedPtr.new_int64([1, 2**63 - 1]), [2])
+    b = ShapedArray(TypedPtr.new_int64([1, 1]), [2])
+    c = ShapedArray(TypedPtr.new_int64([0, 0]), [2])
+
+    # 64-bit integers are computed with NumPy, which wraps around on overflow
+    interpreter.run_op(_integer_add_generic(i64), (a, b, c))
+
+    assert c.data == [2, -(2**63)]
+
+
 def test_linalg_add():
     interpreter = Interpreter(ModuleOp([]))
     interpreter.register_implementations(LinalgFunctions())
@@ -370,3 +511,99 @@ def test_linalg_conv_2d_nchw_fchw():
         TypedPtr.new_float32([54, 63, 72, 99, 108, 117, 144, 153, 162]),
         [1, 1, 3, 3],
     )
+
+
+@pytest.fixture(params=[True, False], ids=["numpy", "python"])
+def use_numpy(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> bool:
+    """Run the test with NumPy, and element by element as if it was not installed."""
+    if not request.param:
+        monkeypatch.setattr(linalg_interpreter, "_to_ndarrays", lambda *arrays: None)
+    return request.param
+
+
+def test_linalg_matmul_accumulate(use_numpy: bool):
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(LinalgFunctions())
+    op = linalg.MatmulOp(
+        (
+            TestSSAValue(TensorType(f64, [2, 3])),
+            TestSSAValue(TensorType(f64, [3, 2])),
+        ),
+        (TestSSAValue(TensorType(f64, [2, 2])),),
+        (TensorType(f64, [2, 2]),),
+    )
+
+    a = ShapedArray(TypedPtr.new_float64([0.0, 1.0, 2.0, 3.0, 4.0, 5.0]), [2, 3])
+    b = ShapedArray(TypedPtr.new_float64([-2.0, -1.0, 0.0, 1.0, 2.0, 3.0]), [3, 2])
+    c = ShapedArray(TypedPtr.new_float64([1.0] * 4), [2, 2])
+
+    assert interpreter.run_op(op, (a, b, c)) == (c,)
+    assert c.data == [5.0, 8.0, 5.0, 17.0]
+
+
+def test_linalg_transpose_view(use_numpy: bool):
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(LinalgFunctions())
+    op = linalg.TransposeOp(
+        TestSSAValue(TensorType(i32, [4, 3, 2])),
+        TestSSAValue(TensorType(i32, [2, 4, 3])),
+        DenseArrayBase.from_list(i64, [2, 0, 1]),
+        TensorType(i32, [2, 4, 3]),
+    )
+
+    # The input is itself a transposed view
+    a = ShapedArray(TypedPtr.new_int32(list(range(24))), [2, 3, 4]).transpose([2, 1, 0])
+    b = ShapedArray(TypedPtr.new_int32([0] * 24), [2, 4, 3])
+
+    interpreter.run_op(op, (a, b))
+    assert b.data == [
+        *(0, 4, 8, 1, 5, 9, 2, 6, 10, 3, 7, 11),
+        *(12, 16, 20, 13, 17, 21, 14, 18, 22, 15, 19, 23),
+    ]
+
+
+def test_linalg_pooling_nchw_max_channels(use_numpy: bool):
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(LinalgFunctions())
+    op = linalg.PoolingNchwMaxOp(
+        DenseIntOrFPElementsAttr.tensor_from_list([2], i64, [2]),
+        DenseIntOrFPElementsAttr.tensor_from_list([1], i64, [2]),
+        (
+            TestSSAValue(TensorType(f32, [1, 2, 4, 4])),
+            TestSSAValue(TensorType(f32, [2, 2])),
+        ),
+        (TestSSAValue(TensorType(f32, [1, 2, 2, 2])),),
+        (TensorType(f32, [1, 2, 2, 2]),),
+    )
+    a = ShapedArray(TypedPtr.new_float32([-x for x in range(1, 33)]), [1, 2, 4, 4])
+    b = ShapedArray(TypedPtr.new_float32([0.0] * 4), [2, 2])
+    c = ShapedArray(TypedPtr.new_float32([float("-inf")] * 8), [1, 2, 2, 2])
+
+    interpreter.run_op(op, (a, b, c))
+    assert c.data == [-1, -2, -5, -6, -17, -18, -21, -22]
+
+
+def test_linalg_conv_2d_nchw_fchw_channels(use_numpy: bool):
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(LinalgFunctions())
+    op = linalg.Conv2DNchwFchwOp(
+        DenseIntOrFPElementsAttr.tensor_from_list([1], i64, [2]),
+        DenseIntOrFPElementsAttr.tensor_from_list([2], i64, [2]),
+        (
+            TestSSAValue(TensorType(f64, [1, 2, 4, 4])),
+            TestSSAValue(TensorType(f64, [2, 2, 2, 2])),
+        ),
+        (TestSSAValue(TensorType(f64, [1, 2, 2, 2])),),
+        (TensorType(f64, [1, 2, 2, 2]),),
+    )
+    a = ShapedArray(TypedPtr.new_float64([x - 10 for x in range(32)]), [1, 2, 4, 4])
+    b = ShapedArray(
+        TypedPtr.new_float64(
+            [1, 0, 0, 1, 0, 1, 1, 0, 1, 1, 1, 1, -1, 0, 0, -1],
+        ),
+        [2, 2, 2, 2],
+    )
+    c = ShapedArray(TypedPtr.new_float64([0.5] * 8), [1, 2, 2, 2])
+
+    interpreter.run_op(op, (a, b, c))
+    assert c.data == [2.5, 10.5, 34.5, 42.5, -46.5, -42.5, -30.5, -26.5]
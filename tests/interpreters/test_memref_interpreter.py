@@ -1,9 +1,12 @@
+from typing import cast
+
 from xdsl.builder import ImplicitBuilder
 from xdsl.dialects import arith, func, memref
 from xdsl.dialects.builtin import (
     DenseIntOrFPElementsAttr,
     IndexType,
     ModuleOp,
+    StridedLayoutAttr,
     StringAttr,
     TensorType,
     i32,
@@ -13,6 +16,7 @@ from xdsl.interpreters.arith import ArithFunctions
 from xdsl.interpreters.memref import MemrefFunctions
 from xdsl.interpreters.ptr import TypedPtr
 from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.ir import Attribute
 
 interpreter = Interpreter(ModuleOp([]), index_bitwidth=32)
 interpreter.register_implementations(ArithFunctions())
@@ -70,3 +74,37 @@ def test_memref_get_global():
         TypedPtr.new_index([1, 2, 3, 4], index_bitwidth=interpreter.index_bitwidth),
         [2, 2],
     )
+
+
+def test_memref_subview():
+    alloc_op = memref.Alloc.get(i32, None, (3, 4))
+    offset_op = arith.Constant.from_int_and_width(1, index)
+    subview_op = memref.Subview.get(
+        alloc_op.memref,
+        [offset_op.result, 0],
+        [2, 2],
+        [1, 2],
+        memref.MemRefType(i32, (2, 2), StridedLayoutAttr((4, 2), None)),
+    )
+    row_op = memref.Subview.from_static_parameters(
+        subview_op.result,
+        cast(memref.MemRefType[Attribute], subview_op.result.type),
+        [1, 0],
+        [1, 2],
+        [1, 1],
+        reduce_rank=True,
+    )
+
+    source = ShapedArray(
+        TypedPtr.new_index(list(range(12)), interpreter.index_bitwidth), [3, 4]
+    )
+    (subview,) = interpreter.run_op(subview_op, (source, 1))
+    assert subview.data == [4, 6, 8, 10]
+
+    (row,) = interpreter.run_op(row_op, (subview,))
+    assert row.shape == [2]
+    assert row.data == [8, 10]
+
+    # The subviews share the memory of the source
+    row.store((1,), 42)
+    assert source.load((2, 2)) == 42
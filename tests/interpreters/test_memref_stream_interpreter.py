@@ -6,6 +6,8 @@ from xdsl.dialects.builtin import (
     AffineMapAttr,
     ArrayAttr,
     Float32Type,
+    Float64Type,
+    FloatAttr,
     IndexType,
     IntAttr,
     IntegerAttr,
@@ -13,7 +15,7 @@ from xdsl.dialects.builtin import (
     ModuleOp,
     i32,
 )
-from xdsl.interpreter import Interpreter
+from xdsl.interpreter import Interpreter, OpCounter
 from xdsl.interpreters.arith import ArithFunctions
 from xdsl.interpreters.memref_stream import MemrefStreamFunctions
 from xdsl.interpreters.ptr import TypedPtr
@@ -280,6 +282,106 @@ def test_memref_stream_generic_reduction_with_initial_value():
     )
 
 
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_memref_stream_generic_transposed_max(vectorized: bool):
+    # The body is run for each point when its operations are observed
+    counter = OpCounter()
+    interpreter = Interpreter(
+        ModuleOp([]), listener=Interpreter.Listener() if vectorized else counter
+    )
+    interpreter.register_implementations(MemrefStreamFunctions())
+    if not vectorized:
+        # The implementations are only used to run the body for each point
+        interpreter.register_implementations(ArithFunctions())
+
+    f64 = Float64Type()
+
+    op = memref_stream.GenericOp(
+        (
+            TestSSAValue(MemRefType(f64, [2, 3])),
+            TestSSAValue(f64),
+        ),
+        (TestSSAValue(MemRefType(f64, [3, 2])),),
+        (),
+        Region(Block(arg_types=(f64, f64, f64))),
+        ArrayAttr(
+            (
+                AffineMapAttr(AffineMap.from_callable(lambda i, j: (j, i))),
+                AffineMapAttr(AffineMap.from_callable(lambda i, j: ())),
+                AffineMapAttr(AffineMap.identity(2)),
+            )
+        ),
+        ArrayAttr(
+            (
+                memref_stream.IteratorTypeAttr.parallel(),
+                memref_stream.IteratorTypeAttr.parallel(),
+            )
+        ),
+        ArrayAttr((index(3), index(2))),
+        ArrayAttr(()),
+    )
+
+    with ImplicitBuilder(op.body) as (a, b, _c_init):
+        zero = arith.Constant(FloatAttr(0.0, f64)).result
+        c = arith.Maximumf(arith.Subf(a, b).result, zero).result
+        memref_stream.YieldOp(c)
+
+    op.verify()
+
+    a = ShapedArray(TypedPtr.new_float64([1, 2, 3, 4, 5, 6]), [2, 3])
+    c = ShapedArray(TypedPtr.new_float64([-1] * 6), [3, 2])
+
+    interpreter.run_op(op, (a, 2.5, c))
+
+    assert c.data == [0, 1.5, 0, 2.5, 0.5, 3.5]
+    if not vectorized:
+        assert counter.ops["arith.maximumf"] == 6
+
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_memref_stream_generic_outer_value(vectorized: bool):
+    counter = OpCounter()
+    interpreter = Interpreter(
+        ModuleOp([]), listener=Interpreter.Listener() if vectorized else counter
+    )
+    interpreter.register_implementations(MemrefStreamFunctions())
+    if not vectorized:
+        interpreter.register_implementations(ArithFunctions())
+
+    f64 = Float64Type()
+
+    # The body yields a constant defined outside of it
+    zero = arith.Constant(FloatAttr(0.0, f64))
+    interpreter.set_values(((zero.result, 0.0),))
+
+    op = memref_stream.GenericOp(
+        (),
+        (TestSSAValue(MemRefType(f64, [2, 3])),),
+        (),
+        Region(Block(arg_types=(f64,))),
+        ArrayAttr((AffineMapAttr(AffineMap.identity(2)),)),
+        ArrayAttr(
+            (
+                memref_stream.IteratorTypeAttr.parallel(),
+                memref_stream.IteratorTypeAttr.parallel(),
+            )
+        ),
+        ArrayAttr((index(2), index(3))),
+        ArrayAttr(()),
+    )
+
+    with ImplicitBuilder(op.body):
+        memref_stream.YieldOp(zero.result)
+
+    op.verify()
+
+    c = ShapedArray(TypedPtr.new_float64([-1] * 6), [2, 3])
+
+    interpreter.run_op(op, (c,))
+
+    assert c.data == [0.0] * 6
+
+
 def test_memref_stream_interleaved_reduction_with_initial_value():
     interpreter = Interpreter(ModuleOp([]))
     interpreter.register_implementations(MemrefStreamFunctions())
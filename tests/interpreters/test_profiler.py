@@ -0,0 +1,154 @@
+from collections.abc import Callable
+
+import pytest
+
+from xdsl.context import MLContext
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.func import Func
+from xdsl.dialects.scf import Scf
+from xdsl.interpreter import Interpreter
+from xdsl.interpreters.arith import ArithFunctions
+from xdsl.interpreters.func import FuncFunctions
+from xdsl.interpreters.profiler import ProfileStats, ProfilingListener
+from xdsl.interpreters.scf import ScfFunctions
+from xdsl.parser import Parser
+
+PROGRAM = """
+func.func @double(%x : i64) -> i64 {
+  %r = arith.addi %x, %x : i64
+  func.return %r : i64
+}
+func.func @factorial(%n : i64) -> i64 {
+  %one = arith.constant 1 : i64
+  %done = arith.cmpi sle, %n, %one : i64
+  %res = scf.if %done -> (i64) {
+    scf.yield %one : i64
+  } else {
+    %m = arith.subi %n, %one : i64
+    %rec = func.call @factorial(%m) : (i64) -> i64
+    %prod = arith.muli %n, %rec : i64
+    scf.yield %prod : i64
+  }
+  func.return %res : i64
+}
+func.func @main() -> i64 {
+  %one = arith.constant 1 : i64
+  %a = func.call @double(%one) : (i64) -> i64
+  %b = func.call @double(%a) : (i64) -> i64
+  func.return %b : i64
+}
+"""
+
+
+def counting_clock() -> Callable[[], int]:
+    """A clock advancing by one nanosecond each time it is read."""
+    time = 0
+
+    def clock() -> int:
+        nonlocal time
+        time += 1
+        return time
+
+    return clock
+
+
+def create_interpreter(compile_regions: bool) -> Interpreter:
+    ctx = MLContext()
+    for dialect in (Builtin, Arith, Func, Scf):
+        ctx.load_dialect(dialect)
+    module = Parser(ctx, PROGRAM).parse_module()
+    assert isinstance(module, ModuleOp)
+    interpreter = Interpreter(module, compile_regions=compile_regions)
+    interpreter.register_implementations(ArithFunctions())
+    interpreter.register_implementations(FuncFunctions())
+    interpreter.register_implementations(ScfFunctions())
+    return interpreter
+
+
+@pytest.mark.parametrize("compile_regions", [False, True])
+def test_profile_calls(compile_regions: bool):
+    interpreter = create_interpreter(compile_regions)
+    # The listener can be installed after the regions are compiled
+    assert interpreter.call_op("main") == (4,)
+    profiler = ProfilingListener(clock=counting_clock())
+    interpreter.listener = profiler
+    assert interpreter.call_op("main") == (4,)
+
+    # Each call measures the two reads of the clock of its two operations
+    assert profiler.to_collapsed_stacks() == (
+        "@main;arith.constant 1\n"
+        "@main;func.call 6\n"
+        "@main;func.call;@double;arith.addi 2\n"
+        "@main;func.call;@double;func.return 2\n"
+        "@main;func.return 1\n"
+    )
+    assert profiler.ops == {
+        "arith.constant": ProfileStats(1, 1, 1),
+        "func.call": ProfileStats(2, 10, 6),
+        "arith.addi": ProfileStats(2, 2, 2),
+        "func.return": ProfileStats(3, 3, 3),
+    }
+    assert profiler.functions == {
+        "main": ProfileStats(1, 12, 8),
+        "double": ProfileStats(2, 4, 4),
+    }
+
+
+@pytest.mark.parametrize("compile_regions", [False, True])
+def test_profile_recursion(compile_regions: bool):
+    interpreter = create_interpreter(compile_regions)
+    profiler = ProfilingListener(clock=counting_clock())
+    interpreter.listener = profiler
+    assert interpreter.call_op("factorial", (3,)) == (6,)
+
+    # Recursive calls are counted once in the inclusive time
+    total_ns = profiler.root.children["@factorial"].total_ns
+    assert profiler.functions["factorial"].count == 3
+    assert profiler.functions["factorial"].inclusive_ns == total_ns
+    assert profiler.functions["factorial"].exclusive_ns == total_ns
+    outer_if = profiler.root.children["@factorial"].children["scf.if"]
+    assert profiler.ops["scf.if"].count == 3
+    assert profiler.ops["scf.if"].inclusive_ns == outer_if.total_ns
+    assert sum(stats.exclusive_ns for stats in profiler.ops.values()) == total_ns
+
+    stacks = profiler.to_collapsed_stacks().splitlines()
+    innermost = ("@factorial", "scf.if", "func.call") * 2 + ("@factorial", "scf.if")
+    assert f"{';'.join(innermost)};scf.yield 1" in stacks
+
+
+def test_profile_exports():
+    interpreter = create_interpreter(False)
+    profiler = ProfilingListener(clock=counting_clock())
+    interpreter.listener = profiler
+    interpreter.call_op("main")
+
+    speedscope = profiler.to_speedscope("main")
+    frames = [frame["name"] for frame in speedscope["shared"]["frames"]]
+    assert frames == [
+        "@main",
+        "arith.constant",
+        "func.call",
+        "@double",
+        "arith.addi",
+        "func.return",
+    ]
+    (profile,) = speedscope["profiles"]
+    assert profile["samples"] == [[0, 1], [0, 2], [0, 2, 3, 4], [0, 2, 3, 5], [0, 5]]
+    assert profile["weights"] == [1, 6, 2, 2, 1]
+    assert profile["endValue"] == 12
+
+    events = profiler.to_chrome_trace()["traceEvents"]
+    assert [(e["name"], e["ts"] * 1000, e["dur"] * 1000) for e in events] == [
+        ("@main", 0, 12),
+        ("arith.constant", 0, 1),
+        ("func.call", 1, 10),
+        ("@double", 1, 4),
+        ("arith.addi", 1, 2),
+        ("func.return", 3, 2),
+        ("func.return", 11, 1),
+    ]
+
+    summary = profiler.summary().splitlines()
+    assert summary[0].split() == ["operation", "count", "inclusive", "exclusive"]
+    assert summary[1].split() == ["func.call", "2", "0.000", "0.000"]
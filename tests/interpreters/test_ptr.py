@@ -1,3 +1,7 @@
+import struct
+
+import pytest
+
 from xdsl.interpreters import ptr
 
 
@@ -10,3 +14,19 @@ def test_ptr():
     assert ptr.int32.size == 4
     assert ptr.int64.format == "<q"
     assert ptr.int64.size == 8
+
+
+def test_typed_ptr_offset():
+    typed = ptr.TypedPtr.new_int32([0, 1, 2, 3])
+    offset = ptr.TypedPtr(typed.raw + 8, xtype=ptr.int32)
+    assert offset[0] == 2
+    assert offset[1] == 3
+    assert offset[-1] == 1
+
+    offset[-2] = 42
+    assert typed.get_list(4) == [42, 1, 2, 3]
+
+    with pytest.raises(IndexError, match="Negative offset into memory"):
+        offset[-3]
+    with pytest.raises(struct.error):
+        offset[2]
@@ -40,9 +40,11 @@ def sum_to_for_op():
         func.Return(result)
 
 
-def scf_interp(module_op: ModuleOp, func_name: str, n: int) -> int:
+def scf_interp(
+    module_op: ModuleOp, func_name: str, n: int, compile_regions: bool = False
+) -> int:
     module_op.verify()
-    interpreter = Interpreter(module_op)
+    interpreter = Interpreter(module_op, compile_regions=compile_regions)
     interpreter.register_implementations(ScfFunctions())
     interpreter.register_implementations(FuncFunctions())
     interpreter.register_implementations(ArithFunctions())
@@ -51,8 +53,9 @@ def scf_interp(module_op: ModuleOp, func_name: str, n: int) -> int:
 
 
 @pytest.mark.parametrize("n,res", ((0, 0), (1, 0), (2, 1), (3, 3), (4, 6), (5, 10)))
-def test_sum_to(n: int, res: int):
-    assert res == scf_interp(sum_to_for_op, "sum_to", n)
+@pytest.mark.parametrize("compile_regions", (False, True))
+def test_sum_to(n: int, res: int, compile_regions: bool):
+    assert res == scf_interp(sum_to_for_op, "sum_to", n, compile_regions)
 
 
 def test_if():
@@ -79,9 +82,12 @@ def test_if():
     assert scf_interp(module_op, "indicator", False) == 0
 
 
-def test_tracer():
+@pytest.mark.parametrize("compile_regions", (False, True))
+def test_tracer(compile_regions: bool):
     tracer = OpCounter()
-    interpreter = Interpreter(sum_to_for_op.clone(), listener=tracer)
+    interpreter = Interpreter(
+        sum_to_for_op.clone(), listener=tracer, compile_regions=compile_regions
+    )
     interpreter.register_implementations(ScfFunctions())
     interpreter.register_implementations(FuncFunctions())
     interpreter.register_implementations(ArithFunctions())
@@ -1,3 +1,5 @@
+import pytest
+
 from xdsl.interpreters.ptr import TypedPtr
 from xdsl.interpreters.shaped_array import ShapedArray
 
@@ -40,3 +42,54 @@ def test_transposed():
     destination = ShapedArray(TypedPtr.new_int32([0, 3, 1, 4, 2, 5]), [3, 2])
 
     assert source.transposed(0, 1) == destination
+
+
+def test_transpose_view():
+    source = ShapedArray(TypedPtr.new_int32([0, 1, 2, 3, 4, 5]), [2, 3])
+    view = source.transpose([1, 0])
+
+    assert view.shape == [3, 2]
+    assert view.strides == [1, 3]
+    assert view.data == [0, 3, 1, 4, 2, 5]
+    assert view.copy() == ShapedArray(TypedPtr.new_int32([0, 3, 1, 4, 2, 5]), [3, 2])
+
+    # The view shares the memory of the source
+    view.store((2, 0), 42)
+    assert source.load((0, 2)) == 42
+
+    with pytest.raises(ValueError, match="Invalid permutation"):
+        source.transpose([0, 0])
+
+
+def test_subview():
+    source = ShapedArray(TypedPtr.new_int32(list(range(12))), [3, 4])
+
+    # Every other element of the last two rows
+    view = source.subview([1, 0], [2, 2], [1, 2])
+    assert view.shape == [2, 2]
+    assert view.strides == [4, 2]
+    assert view.data == [4, 6, 8, 10]
+    assert f"{view}" == "[[4, 6], [8, 10]]"
+
+    view.store((1, 1), 42)
+    assert source.load((2, 2)) == 42
+
+    # Subviews of contiguous elements do not need strides
+    row = view.subview([1, 0], [1, 2], [1, 1]).transpose([1, 0])
+    assert row.data == [8, 42]
+    assert source.subview([1, 0], [2, 4], [1, 1]).strides is None
+
+    with pytest.raises(ValueError, match="out of bounds"):
+        source.subview([2, 0], [2, 2], [1, 1])
+
+
+def test_to_ndarray():
+    source = ShapedArray(TypedPtr.new_float64([0, 1, 2, 3, 4, 5]), [2, 3])
+    view = source.subview([0, 1], [2, 2], [1, 1]).transpose([1, 0])
+
+    array = view.to_ndarray()
+    assert array.tolist() == [[1, 4], [2, 5]]
+
+    # The NumPy array shares the memory of the source
+    array[0, 1] = 42
+    assert source.data == [0, 1, 2, 3, 42, 5]
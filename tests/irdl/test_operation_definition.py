@@ -310,6 +310,56 @@ def test_operand_accessors():
     assert len(op.var_operand) == 0
 
 
+def test_operand_accessors_after_modification():
+    """Test that accessors reflect changes of the operands and segment sizes."""
+    operand1 = TestSSAValue(i32)
+    operand2 = TestSSAValue(i32)
+    operand3 = TestSSAValue(i32)
+
+    op = OperandOp.build(operands=[operand1, [], [operand2]])
+    assert op.opt_operand is None
+    assert op.var_operand == (operand2,)
+
+    op.operands = [operand1, operand2, operand3]
+    op.attributes["operandSegmentSizes"] = DenseArrayBase.from_list(i32, [1, 1, 1])
+    assert op.opt_operand is operand2
+    assert op.var_operand == (operand3,)
+
+    op.operands[2] = operand1
+    assert op.var_operand == (operand1,)
+
+    op.attributes["operandSegmentSizes"] = DenseArrayBase.from_list(i32, [1, 0, 2])
+    assert op.opt_operand is None
+    assert op.var_operand == (operand2, operand1)
+
+
+@irdl_op_definition
+class BinaryOp(IRDLOperation):
+    name = "test.binary_op"
+
+    lhs = operand_def()
+    rhs = operand_def()
+    res = result_def()
+
+
+def test_fixed_operand_accessors():
+    """Test accessors of operations without variadic operands."""
+    operand1 = TestSSAValue(i32)
+    operand2 = TestSSAValue(i32)
+
+    op = BinaryOp.build(operands=[operand1, operand2], result_types=[i32])
+    assert op.lhs is operand1
+    assert op.rhs is operand2
+
+    op.operands = [operand2, operand1]
+    assert op.lhs is operand2
+    assert op.rhs is operand1
+
+    op.operands = [operand1]
+    with pytest.raises(VerifyException, match="Expected 2 operand, but got 1"):
+        op.lhs
+
+
 @irdl_op_definition
 class OpResultOp(IRDLOperation):
     name = "test.op_result_op"
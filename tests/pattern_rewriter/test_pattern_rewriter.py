@@ -1,5 +1,6 @@
 import re
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
+from functools import wraps
 
 import pytest
 from conftest import assert_print_op
@@ -307,6 +308,131 @@ def test_recursive_rewriter_reversed():
     )
 
 
+class DecrementConstantRewrite(RewritePattern):
+    """Rewrite a constant `n` into `(n - 1) + 1`, until `n` is 1."""
+
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: Constant, rewriter: PatternRewriter):
+        if not isa(op_val := op.value, IntegerAttr):
+            return
+        val = op_val.value.data
+        if val == 0 or val == 1:
+            return
+        constant_op = Constant(IntegerAttr.from_int_and_width(val - 1, 32), i32)
+        constant_one = Constant(IntegerAttr.from_int_and_width(1, 32), i32)
+        add_op = Addi(constant_op, constant_one)
+        rewriter.replace_matched_op([constant_op, constant_one, add_op])
+
+
+def test_incremental_rewriter():
+    """Test that the incremental walker reaches the same fixpoint."""
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 5 : i32}> : () -> i32
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %1 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) : (i32, i32) -> i32
+  %3 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %4 = "arith.addi"(%2, %3) : (i32, i32) -> i32
+  %5 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %6 = "arith.addi"(%4, %5) : (i32, i32) -> i32
+  %7 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %8 = "arith.addi"(%6, %7) : (i32, i32) -> i32
+}) : () -> ()"""
+
+    walker = PatternRewriteWalker(DecrementConstantRewrite(), incremental=True)
+    rewrite_and_compare(
+        prog,
+        expected,
+        walker,
+        op_inserted=12,
+        op_removed=4,
+        op_replaced=4,
+        op_modified=3,
+    )
+    assert walker.converged
+
+
+@pytest.mark.parametrize("incremental", [True, False])
+def test_rewriter_max_num_rewrites(incremental: bool):
+    """Test that the walker stops once its rewrite budget is exhausted."""
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 5 : i32}> : () -> i32
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 3 : i32}> : () -> i32
+  %1 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) : (i32, i32) -> i32
+  %3 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %4 = "arith.addi"(%2, %3) : (i32, i32) -> i32
+}) : () -> ()"""
+
+    walker = PatternRewriteWalker(
+        DecrementConstantRewrite(), incremental=incremental, max_num_rewrites=2
+    )
+    rewrite_and_compare(
+        prog,
+        expected,
+        walker,
+        op_inserted=6,
+        op_removed=2,
+        op_replaced=2,
+        op_modified=1,
+    )
+    assert not walker.converged
+
+
+def test_rewriter_max_iterations():
+    """Test that the walker stops after the given number of walks."""
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 5 : i32}> : () -> i32
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %1 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) : (i32, i32) -> i32
+  %3 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %4 = "arith.addi"(%2, %3) : (i32, i32) -> i32
+  %5 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %6 = "arith.addi"(%4, %5) : (i32, i32) -> i32
+  %7 = "arith.constant"() <{"value" = 1 : i32}> : () -> i32
+  %8 = "arith.addi"(%6, %7) : (i32, i32) -> i32
+}) : () -> ()"""
+
+    # All rewrites happen during the first walk, and the second walk is needed to
+    # check that the fixpoint is reached.
+    walker = PatternRewriteWalker(DecrementConstantRewrite(), max_iterations=1)
+    rewrite_and_compare(
+        prog,
+        expected,
+        walker,
+        op_inserted=12,
+        op_removed=4,
+        op_replaced=4,
+        op_modified=3,
+    )
+    assert not walker.converged
+
+    walker = PatternRewriteWalker(DecrementConstantRewrite(), max_iterations=2)
+    rewrite_and_compare(
+        prog,
+        expected,
+        walker,
+        op_inserted=12,
+        op_removed=4,
+        op_replaced=4,
+        op_modified=3,
+    )
+    assert walker.converged
+
+
 def test_greedy_rewrite_pattern_applier():
     """Test GreedyRewritePatternApplier."""
 
@@ -344,6 +470,80 @@ def test_greedy_rewrite_pattern_applier():
     )
 
 
+def test_greedy_rewrite_pattern_applier_dispatch():
+    """
+    Test that GreedyRewritePatternApplier only calls typed patterns on the operations
+    they match, and keeps the order of the patterns.
+    """
+
+    prog = """"builtin.module"() ({
+  %0 = "arith.constant"() <{"value" = 42 : i32}> : () -> i32
+  %1 = "arith.addi"(%0, %0) : (i32, i32) -> i32
+}) : () -> ()"""
+
+    calls: list[tuple[str, str]] = []
+
+    def counted(
+        name: str,
+    ) -> Callable[[Callable[..., None]], Callable[..., None]]:
+        """Record each call to the pattern, before it filters the operation type."""
+
+        def decorator(func: Callable[..., None]) -> Callable[..., None]:
+            @wraps(func)
+            def wrapper(self: RewritePattern, op: Operation, rewriter: PatternRewriter):
+                calls.append((name, op.name))
+                func(self, op, rewriter)
+
+            return wrapper
+
+        return decorator
+
+    class ConstantPattern(RewritePattern):
+        @counted("constant")
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Constant, rewriter: PatternRewriter):
+            pass
+
+    class AnyOpPattern(RewritePattern):
+        @counted("any")
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            pass
+
+    class AddiOrMuliPattern(RewritePattern):
+        @counted("addi_or_muli")
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: Addi | Muli, rewriter: PatternRewriter):
+            pass
+
+    class TestOpPattern(RewritePattern):
+        @counted("test")
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestOp, rewriter: PatternRewriter):
+            pass
+
+    applier = GreedyRewritePatternApplier(
+        [ConstantPattern(), AnyOpPattern(), AddiOrMuliPattern(), TestOpPattern()]
+    )
+    # The patterns cannot be modified once the patterns of an operation are cached
+    assert isinstance(applier.rewrite_patterns, tuple)
+
+    rewrite_and_compare(
+        prog,
+        prog,
+        PatternRewriteWalker(applier, apply_recursively=False, walk_regions_first=True),
+        expect_rewrite=False,
+    )
+
+    # Typed patterns are not called on operations of other types
+    assert calls == [
+        ("constant", "arith.constant"),
+        ("any", "arith.constant"),
+        ("any", "arith.addi"),
+        ("addi_or_muli", "arith.addi"),
+        ("any", "builtin.module"),
+    ]
+
+
 def test_insert_op_before_matched_op():
     """Test rewrites where operations are inserted before the matched operation."""
 
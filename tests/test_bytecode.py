@@ -0,0 +1,123 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+from xdsl.bytecode import BytecodeError, BytecodeReader, BytecodeWriter
+from xdsl.context import MLContext
+from xdsl.dialects.arith import Arith
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.dialects.func import Func, FuncOp
+from xdsl.dialects.test import Test
+from xdsl.ir import Operation
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+from xdsl.resources import ResourceBlob
+
+
+def _context(allow_unregistered: bool = False) -> MLContext:
+    ctx = MLContext(allow_unregistered=allow_unregistered)
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Arith)
+    ctx.load_dialect(Func)
+    ctx.load_dialect(Test)
+    return ctx
+
+
+def _print(op: Operation) -> str:
+    stream = StringIO()
+    Printer(stream=stream).print_op(op)
+    return stream.getvalue()
+
+
+def _write(op: Operation, ctx: MLContext | None = None) -> bytes:
+    stream = BytesIO()
+    BytecodeWriter(stream, None if ctx is None else ctx.resources).write_op(op)
+    return stream.getvalue()
+
+
+@pytest.mark.parametrize(
+    "program",
+    [
+        '%0 = "test.op"() {"a" = 1 : i64, "b" = [-3, 2.5, "s", @sym]} : () -> i32',
+        "func.func @f(%x : i32) -> i32 {\n  func.return %x : i32\n}",
+        # Value used before its definition in a graph region
+        '"test.op"(%0) : (i32) -> ()\n%0 = "test.op"() : () -> i32',
+        # Successors, and block arguments used before their definition
+        '"test.op"() ({\n  "test.termop"() [^1] : () -> ()\n'
+        '^0(%a : i32):\n  "test.termop"(%b) : (i32) -> ()\n'
+        '^1(%b : i32):\n  "test.termop"(%a) [^0] : (i32) -> ()\n}) : () -> ()',
+        '"test.op"() <{"prop" = 1 : i32}> : () -> ()',
+        '%0 = "test.op"() : () -> memref<2x?xf32, strided<[?, 1], offset: 4>>',
+        '"test.op"() {"a" = affine_map<(d0) -> (d0 + 1)>, "b" = array<i32: 1>} : () -> ()',
+        '"test.op"() {"bytes" = "\\00\\FF"} : () -> ()',
+    ],
+)
+def test_round_trip(program: str):
+    ctx = _context()
+    module = Parser(ctx, program).parse_module()
+
+    read = BytecodeReader(_context(), _write(module)).read_module()
+    assert _print(read) == _print(module)
+
+
+def test_round_trip_unregistered():
+    program = (
+        '%0 = "unregistered.op"() {"attr" = #unregistered.attr<"v">} '
+        ": () -> !unregistered.type"
+    )
+    module = Parser(_context(True), program).parse_module()
+
+    read = BytecodeReader(_context(True), _write(module)).read_module()
+    assert _print(read) == _print(module)
+
+    with pytest.raises(BytecodeError, match="is not registered"):
+        BytecodeReader(_context(), _write(module)).read_module()
+
+
+def test_round_trip_resources():
+    ctx = _context()
+    program = '"test.op"() {"blob" = dense_resource<b> : tensor<1xi32>} : () -> ()'
+    module = Parser(ctx, program).parse_module()
+    ctx.resources.insert("builtin", "b", ResourceBlob.from_bytes(b"\x01\0\0\0", 4))
+    ctx.resources.insert("builtin", "unused", ResourceBlob.from_bytes(b"\x02"))
+
+    read_ctx = _context()
+    BytecodeReader(read_ctx, _write(module, ctx)).read_module()
+    blob = read_ctx.resources.get("builtin", "b")
+    assert blob is not None
+    assert (bytes(blob.data), blob.alignment) == (b"\x01\0\0\0", 4)
+    assert read_ctx.resources.get("builtin", "unused") is None
+
+
+def test_read_lazily():
+    program = (
+        "func.func @f() {\n  func.return\n}\n"
+        "func.func @g(%x : i32) -> i32 {\n  func.return %x : i32\n}"
+    )
+    module = Parser(_context(), program).parse_module()
+    data = _write(module)
+
+    reader = BytecodeReader(_context(), data, lazy=True)
+    read = reader.read_module()
+    funcs = list(read.ops)
+    assert all(isinstance(func, FuncOp) for func in funcs)
+    assert reader.unmaterialized_ops == (*funcs,)
+    assert all(not func.body.blocks for func in funcs)
+
+    reader.materialize(funcs[1])
+    assert reader.unmaterialized_ops == (funcs[0],)
+    assert len(funcs[1].body.blocks) == 1
+
+    reader.materialize_all()
+    assert _print(read) == _print(module)
+
+
+def test_read_invalid():
+    with pytest.raises(BytecodeError, match="magic number"):
+        BytecodeReader(_context(), b"module").read_op()
+
+    data = _write(ModuleOp([]))
+    with pytest.raises(BytecodeError, match="Unexpected end"):
+        BytecodeReader(_context(), data[:-1]).read_op()
+    with pytest.raises(BytecodeError, match="Unexpected data"):
+        BytecodeReader(_context(), data + b"\0").read_op()
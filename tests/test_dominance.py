@@ -1,9 +1,17 @@
 import pytest
 
 from xdsl.context import MLContext
-from xdsl.dialects import get_all_dialects
-from xdsl.irdl.dominance import strictly_dominates
+from xdsl.dialects import get_all_dialects, test
+from xdsl.ir import Block, Region
+from xdsl.irdl.dominance import (
+    Dominance,
+    DominanceInfo,
+    PostDominanceInfo,
+    strictly_dominates,
+)
 from xdsl.parser import Parser
+from xdsl.pattern_rewriter import PatternRewriter
+from xdsl.rewriter import InsertPoint
 
 ctx = MLContext()
 ctx.register_dialect("test", get_all_dialects()["test"])
@@ -64,4 +72,144 @@ def test_region_strictly_dominates_block(a: int, b: int, expected: bool):
     """
     Test in-region block dominance.
     """
-    assert strictly_dominates(blocks[a - 1], blocks[b - 1]) == expected
+    with pytest.deprecated_call():
+        assert strictly_dominates(blocks[a - 1], blocks[b - 1]) == expected
+    info = Dominance().get_info(op.regions[0])
+    assert info.strictly_dominates(blocks[a - 1], blocks[b - 1]) == expected
+
+
+@pytest.mark.parametrize(
+    ("block", "expected"),
+    ((1, None), (2, 1), (3, 2), (4, 2), (5, 2), (6, 2)),
+)
+def test_immediate_dominator(block: int, expected: int | None):
+    info = DominanceInfo(op.regions[0])
+    idom = info.immediate_dominator(blocks[block - 1])
+    assert idom is (None if expected is None else blocks[expected - 1])
+
+
+@pytest.mark.parametrize(
+    ("a", "b", "expected"),
+    (
+        (6, 1, True),
+        (6, 5, True),
+        (2, 1, True),
+        (2, 3, True),
+        (2, 5, True),
+        (2, 6, False),
+        (5, 3, True),
+        (5, 4, True),
+        (5, 2, False),
+        (3, 4, False),
+        (1, 2, False),
+    ),
+)
+def test_region_post_dominates_block(a: int, b: int, expected: bool):
+    """
+    Test in-region block post-dominance.
+    """
+    info = PostDominanceInfo(op.regions[0])
+    assert info.dominates(blocks[a - 1], blocks[b - 1]) == expected
+
+
+def test_unreachable_block():
+    """
+    Test that unreachable blocks are only dominated by themselves.
+    """
+    entry = Block((test.TestTermOp(),))
+    unreachable = Block()
+    unreachable.add_op(test.TestTermOp(successors=(entry,)))
+    info = DominanceInfo(Region((entry, unreachable)))
+
+    assert info.dominates(unreachable, unreachable)
+    assert not info.dominates(entry, unreachable)
+    assert not info.dominates(unreachable, entry)
+    assert not info.is_reachable(unreachable)
+
+
+nested_op = Parser(
+    ctx,
+    """
+"test.op"() ({
+^0:
+  %0 = "test.op"() : () -> i32
+  %1 = "test.op"() ({
+  ^1(%arg : i32):
+    %2 = "test.op"(%0) : (i32) -> i32
+    "test.op"()[^2] : () -> ()
+  ^2:
+    %3 = "test.op"(%arg) : (i32) -> i32
+    "test.op"() : () -> ()
+  }) : () -> i32
+  %4 = "test.op"(%1) : (i32) -> i32
+}) : () -> ()
+""",
+).parse_op()
+
+
+def test_operation_dominance():
+    """
+    Test dominance between operations and values nested in different regions.
+    """
+    op0, op1, op4 = nested_op.regions[0].block.ops
+    block1, block2 = op1.regions[0].blocks
+    op2 = block1.first_op
+    op3 = block2.first_op
+    assert op2 is not None
+    assert op3 is not None
+    arg = block1.args[0]
+
+    dominance = Dominance()
+
+    assert dominance.properly_dominates(op0, op1)
+    assert dominance.properly_dominates(op0, op2)
+    assert dominance.properly_dominates(op0, op3)
+    assert dominance.properly_dominates(op2, op3)
+    assert dominance.properly_dominates(op1, op4)
+    assert dominance.properly_dominates(op1, op2)
+    assert not dominance.properly_dominates(op1, op2, enclosing_op_ok=False)
+    assert not dominance.properly_dominates(op3, op2)
+    assert not dominance.properly_dominates(op4, op0)
+    assert not dominance.properly_dominates(op2, op4)
+    assert not dominance.properly_dominates(op0, op0)
+    assert dominance.dominates(op0, op0)
+
+    assert dominance.value_properly_dominates(op0.results[0], op3)
+    assert dominance.value_properly_dominates(arg, op3)
+    assert not dominance.value_properly_dominates(op1.results[0], op2)
+    assert not dominance.value_properly_dominates(arg, op4)
+    assert dominance.value_dominates(op1.results[0], op1)
+
+    post_dominance = Dominance(post=True)
+    assert post_dominance.properly_dominates(op4, op0)
+    assert post_dominance.properly_dominates(op3, op2)
+    assert not post_dominance.properly_dominates(op0, op4)
+
+
+def test_dominance_invalidation():
+    """
+    Test that the cached dominator trees are invalidated by rewrites.
+    """
+    entry = Block()
+    exit = Block()
+    entry.add_op(test.TestTermOp(successors=(exit,)))
+    exit.add_op(test.TestTermOp())
+    region = Region((entry, exit))
+
+    dominance = Dominance()
+    assert dominance.block_dominates(entry, exit)
+
+    # Make `exit` reachable from the entry block only through a new block
+    middle = Block()
+    middle.add_op(test.TestTermOp(successors=(exit,)))
+    region.insert_block_after(middle, entry)
+
+    old_terminator = entry.first_op
+    assert old_terminator is not None
+    rewriter = PatternRewriter(old_terminator)
+    rewriter.extend_from_listener(dominance.get_listener())
+    rewriter.insert_op(test.TestTermOp(successors=(middle,)), InsertPoint.at_end(entry))
+    rewriter.erase_op(old_terminator)
+
+    assert dominance.block_dominates(middle, exit)
+    assert dominance.get_info(region).immediate_dominator(exit) is middle
@@ -16,16 +16,19 @@ from xdsl.dialects.builtin import (
 )
 from xdsl.interpreter import (
     Interpreter,
+    InterpreterContext,
     InterpreterFunctions,
     PythonValues,
+    ReturnedValues,
     impl,
     impl_attr,
     impl_cast,
     impl_external,
+    impl_terminator,
     register_impls,
 )
 from xdsl.interpreters.builtin import BuiltinFunctions
-from xdsl.ir import Attribute, Operation
+from xdsl.ir import Attribute, Block, Operation, Region
 from xdsl.utils.exceptions import InterpretationError
 from xdsl.utils.test_value import TestSSAValue
 
@@ -243,3 +246,104 @@ def test_mixed_values():
 
     assert i.value_for_attribute(IntegerAttr(1, i32), i32) == 1
     assert i.value_for_attribute(IntegerAttr(1, i32), index) == 1
+
+
+def test_compiled_regions():
+    @dataclass
+    @register_impls
+    class TestFunctions(InterpreterFunctions):
+        offset: int
+
+        @impl(test.TestOp)
+        def run_test(
+            self, interpreter: Interpreter, op: test.TestOp, args: PythonValues
+        ) -> PythonValues:
+            return (sum(args) + self.offset,)
+
+        @impl_terminator(test.TestTermOp)
+        def run_term(
+            self, interpreter: Interpreter, op: test.TestTermOp, args: PythonValues
+        ):
+            return ReturnedValues(args), ()
+
+    outer = TestSSAValue(i32)
+    entry = Block(arg_types=(i32,))
+    add = test.TestOp((entry.args[0], outer), (i32,))
+    entry.add_ops((add, test.TestTermOp((add.results[0],))))
+    # A block that is never run, with an operation without implementation
+    unreachable = Block((test.TestPureOp(), test.TestTermOp()))
+    region = Region((entry, unreachable))
+
+    interpreter = Interpreter(ModuleOp([]), compile_regions=True)
+    interpreter.register_implementations(TestFunctions(0))
+    interpreter.push_scope()
+    interpreter.set_values(((outer, 10),))
+
+    assert interpreter.run_ssacfg_region(region, (1,)) == (11,)
+    assert interpreter.run_ssacfg_region(region, (2,)) == (12,)
+
+    # Registering implementations invalidates the compiled regions
+    interpreter.register_implementations(TestFunctions(100), override=True)
+    assert interpreter.run_ssacfg_region(region, (1,)) == (111,)
+
+    with pytest.raises(
+        InterpretationError,
+        match="Could not find interpretation function for op test.pureop",
+    ):
+        interpreter.run_ssacfg_region(
+            Region(Block((test.TestPureOp(), test.TestTermOp()))), ()
+        )
+
+
+@pytest.mark.parametrize("compile_regions", [False, True])
+def test_compiled_region_scopes(compile_regions: bool):
+    scopes: list[InterpreterContext] = []
+
+    @register_impls
+    class LoopFunctions(InterpreterFunctions):
+        @impl(test.TestOp)
+        def run_test(
+            self, interpreter: Interpreter, op: test.TestOp, args: PythonValues
+        ) -> PythonValues:
+            if not op.regs:
+                scopes.append(interpreter._ctx)  # pyright: ignore[reportPrivateUsage]
+                return (sum(args),)
+            # Sum the results of the region over three iterations
+            return (
+                sum(
+                    interpreter.run_ssacfg_region(op.regs[0], (i,), "loop")[0]
+                    for i in range(3)
+                ),
+            )
+
+        @impl_terminator(test.TestTermOp)
+        def run_term(
+            self, interpreter: Interpreter, op: test.TestTermOp, args: PythonValues
+        ):
+            return ReturnedValues(args), ()
+
+    outer = Block(arg_types=(i32,))
+    inner = Block(arg_types=(i32,))
+    innermost = Block(arg_types=(i32,))
+    (a,) = outer.args
+    (i,) = inner.args
+    (j,) = innermost.args
+    # The innermost region uses values of the two enclosing regions
+    leaf = test.TestOp((j, a, i), (i32,))
+    innermost.add_ops((leaf, test.TestTermOp((leaf.res[0],))))
+    add = test.TestOp((i, a), (i32,))
+    nested = test.TestOp((), (i32,), regions=(Region(innermost),))
+    total = test.TestOp((add.res[0], nested.res[0]), (i32,))
+    inner.add_ops((add, nested, total, test.TestTermOp((total.res[0],))))
+    loop = test.TestOp((), (i32,), regions=(Region(inner),))
+    outer.add_ops((loop, test.TestTermOp((loop.res[0],))))
+    region = Region(outer)
+
+    interpreter = Interpreter(ModuleOp([]), compile_regions=compile_regions)
+    interpreter.register_implementations(LoopFunctions())
+    assert interpreter.run_ssacfg_region(region, (1,)) == (33,)
+    assert interpreter.run_ssacfg_region(region, (2,)) == (45,)
+
+    # Compiled regions reuse their scope for each run, instead of one scope for each
+    # of the 6 runs of the inner region and 18 runs of the innermost region
+    assert len({id(scope) for scope in scopes}) == (2 if compile_regions else 24)
@@ -1,7 +1,7 @@
 import pytest
 
 from xdsl.utils.exceptions import ParseError
-from xdsl.utils.lexer import Input, Lexer, Token
+from xdsl.utils.lexer import Input, Lexer, Span, Token
 
 
 def get_token(input: str) -> Token:
@@ -191,11 +191,42 @@ def test_whitespace_skip(text: str):
     assert_single_token(text, Token.Kind.INTEGER_LIT, "0")
 
 
-@pytest.mark.parametrize("text", ["", "   ", "\n\n", "// Comment\n"])
+@pytest.mark.parametrize("text", ["", "   ", "\n\n", "// Comment\n", "// Comment"])
 def test_eof(text: str):
     assert_single_token(text, Token.Kind.EOF, "")
 
 
+def test_lex_token_sequence():
+    text = '%0 = "test.op"(%arg) {a = @sym, b = 0x1F} : (i32) -> f32 // comment\n'
+    lexer = Lexer(Input(text, "<unknown>"))
+    tokens: list[tuple[Token.Kind, str]] = []
+    while (token := lexer.lex()).kind != Token.Kind.EOF:
+        tokens.append((token.kind, token.text))
+    assert tokens == [
+        (Token.Kind.PERCENT_IDENT, "%0"),
+        (Token.Kind.EQUAL, "="),
+        (Token.Kind.STRING_LIT, '"test.op"'),
+        (Token.Kind.L_PAREN, "("),
+        (Token.Kind.PERCENT_IDENT, "%arg"),
+        (Token.Kind.R_PAREN, ")"),
+        (Token.Kind.L_BRACE, "{"),
+        (Token.Kind.BARE_IDENT, "a"),
+        (Token.Kind.EQUAL, "="),
+        (Token.Kind.AT_IDENT, "@sym"),
+        (Token.Kind.COMMA, ","),
+        (Token.Kind.BARE_IDENT, "b"),
+        (Token.Kind.EQUAL, "="),
+        (Token.Kind.INTEGER_LIT, "0x1F"),
+        (Token.Kind.R_BRACE, "}"),
+        (Token.Kind.COLON, ":"),
+        (Token.Kind.L_PAREN, "("),
+        (Token.Kind.BARE_IDENT, "i32"),
+        (Token.Kind.R_PAREN, ")"),
+        (Token.Kind.ARROW, "->"),
+        (Token.Kind.BARE_IDENT, "f32"),
+    ]
+
+
 @pytest.mark.parametrize(
     "text, expected",
     [
@@ -247,3 +278,26 @@ def test_token_get_string_literal_value(text: str, expected: float):
     token = get_token(text)
     assert token.kind == Token.Kind.STRING_LIT
     assert token.get_string_literal_value() == expected
+
+
+@pytest.mark.parametrize(
+    "start,end,expected",
+    [
+        (0, 1, (["ab"], 0, 1)),
+        (3, 4, (["cd"], 3, 2)),
+        (2, 2, (["ab"], 0, 1)),
+        (4, 7, (["cd", "", ""], 3, 2)),
+        (7, 7, ([""], 7, 4)),
+        (8, 8, None),
+    ],
+)
+def test_get_lines_containing(
+    start: int, end: int, expected: tuple[list[str], int, int] | None
+):
+    input = Input("ab\ncd\n\n", "<unknown>")
+    assert input.get_lines_containing(Span(start, end, input)) == expected
+
+
+def test_get_line_col_with_line_offset():
+    input = Input("a\nb\nc", "<unknown>")
+    assert Span(4, 5, input, line_offset=10).get_line_col() == (13, 0)
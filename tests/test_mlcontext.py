@@ -1,9 +1,18 @@
 import pytest
 
-from xdsl.context import MLContext
-from xdsl.dialects.builtin import UnregisteredAttr, UnregisteredOp
+from xdsl.context import AttributeUniquer, MLContext
+from xdsl.dialects.builtin import (
+    Builtin,
+    DictionaryAttr,
+    FloatAttr,
+    MemRefType,
+    UnregisteredAttr,
+    UnregisteredOp,
+    f32,
+)
 from xdsl.ir import Dialect, ParametrizedAttribute, TypeAttribute
 from xdsl.irdl import IRDLOperation, irdl_attr_definition, irdl_op_definition
+from xdsl.parser import Parser
 
 
 @irdl_op_definition
@@ -204,3 +213,32 @@ def test_get_optional_attr_registered():
     assert ctx.get_optional_attr("test.dummy_attr2") is None
     assert list(ctx.loaded_dialects) == [testDialect]
     assert list(ctx.registered_dialect_names) == ["test"]
+
+
+def test_attribute_uniquer():
+    uniquer = AttributeUniquer()
+    a = uniquer.unique(MemRefType(f32, [2, 3]))
+    assert uniquer.unique(MemRefType(f32, [2, 3])) is a
+    assert uniquer.unique(MemRefType(f32, [3, 2])) is not a
+    assert uniquer.get(MemRefType, a.parameters) is a
+
+    # Attributes with unhashable data are not uniqued
+    dictionary = DictionaryAttr({"a": a})
+    assert uniquer.unique(dictionary) is dictionary
+
+    # -0.0 and 0.0 are different attributes
+    zero = uniquer.unique(FloatAttr(0.0, f32))
+    assert uniquer.unique(FloatAttr(-0.0, f32)) is not zero
+
+
+def test_parser_uniques_attributes():
+    ctx = MLContext(uniquer=AttributeUniquer())
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(testDialect)
+    parser = Parser(
+        ctx, "memref<2x?xf32> memref<2x?xf32> #test.dummy_attr #test.dummy_attr"
+    )
+    first, second = parser.parse_type(), parser.parse_type()
+    assert first is second
+    assert parser.parse_attribute() is parser.parse_attribute()
+    assert ctx.clone().uniquer is ctx.uniquer
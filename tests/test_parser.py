@@ -3,19 +3,24 @@ from typing import cast
 
 import pytest
 
-from xdsl.context import MLContext
+from xdsl.context import AttributeUniquer, MLContext
 from xdsl.dialects.builtin import (
     ArrayAttr,
     Builtin,
     DictionaryAttr,
+    IndexType,
     IntAttr,
     IntegerAttr,
     IntegerType,
     LocationAttr,
+    MemRefType,
+    Signedness,
     StringAttr,
     SymbolRefAttr,
+    f32,
     i32,
 )
+from xdsl.dialects.func import Func
 from xdsl.dialects.test import Test
 from xdsl.ir import Attribute, ParametrizedAttribute
 from xdsl.irdl import (
@@ -920,3 +925,63 @@ def test_parse_singleton_enum_fail():
     parser = Parser(MLContext(), "b")
     with pytest.raises(ParseError, match="Expected `a`"):
         parser.parse_str_enum(MySingletonEnum)
+
+
+def test_parse_aliases_before_explicit_module():
+    ctx = MLContext()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Test)
+    text = '!t = i32\n"builtin.module"() ({\n  "test.op"() : () -> !t\n}) : () -> ()'
+    module = Parser(ctx, text).parse_module(allow_implicit_module=False)
+    op = module.ops.first
+    assert op is not None
+    assert op.result_types == (i32,)
+
+
+def test_alias_followed_by_opaque_body():
+    ctx = MLContext(allow_unregistered=True)
+    parser = Parser(ctx, "!test = i32\n!test !test<foo>")
+    parser._parse_alias_def()  # pyright: ignore[reportPrivateUsage]
+    assert parser.parse_type() == i32
+    assert parser.parse_type() != i32
+
+
+def test_op_names_resolved_with_dialect_stack_are_not_cached():
+    ctx = MLContext()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(Func)
+    ctx.load_dialect(Test)
+    text = 'func.func @f() {\n  return\n}\n"test.op"() ({\n  return\n}) : () -> ()'
+    with pytest.raises(ParseError, match="unregistered operation return!"):
+        Parser(ctx, text).parse_module()
+
+
+def test_parse_repeated_types():
+    ctx = MLContext()
+    ctx.load_dialect(Builtin)
+    parser = Parser(ctx, "i32 i32 si32 f32 f32 index")
+    types = [parser.parse_type() for _ in range(6)]
+    assert types == [
+        i32,
+        i32,
+        IntegerType(32, Signedness.SIGNED),
+        f32,
+        f32,
+        IndexType(),
+    ]
+    assert types[0] is types[1]
+
+    # Each parser has its own types, which are not kept after parsing
+    assert Parser(ctx, "i32").parse_type() is not types[0]
+
+
+def test_parse_repeated_types_with_uniquer():
+    uniquer = AttributeUniquer()
+    ctx = MLContext(uniquer=uniquer)
+    ctx.load_dialect(Builtin)
+    unique_i32 = uniquer.unique(IntegerType(32))
+    parser = Parser(ctx, "i32 memref<i32>")
+    assert parser.parse_type() is unique_i32
+    memref = parser.parse_type()
+    assert isinstance(memref, MemRefType)
+    assert memref.element_type is unique_i32
@@ -11,12 +11,15 @@ from xdsl.dialects import test
 from xdsl.dialects.arith import Addi, Arith, Constant
 from xdsl.dialects.builtin import (
     Builtin,
+    DenseIntOrFPElementsAttr,
     FunctionType,
     IntAttr,
     IntegerType,
     ModuleOp,
     SymbolRefAttr,
+    TensorType,
     UnitAttr,
+    i1,
     i32,
 )
 from xdsl.dialects.func import Func
@@ -281,6 +284,35 @@ def test_op_message_with_region_and_overflow():
     assert_print_op(module, expected, diagnostic)
 
 
+def test_op_message_after_buffer_flush():
+    """
+    Test that the position of an operation message is correct after the printer
+    wrote its buffer to the stream.
+    """
+    module = ModuleOp([test.TestOp() for _ in range(3000)])
+    last_op = module.ops.last
+    assert last_op is not None
+    diagnostic = Diagnostic()
+    diagnostic.add_message(last_op, "Test")
+
+    stream = StringIO()
+    Printer(stream=stream, diagnostic=diagnostic).print_op(module)
+    assert stream.getvalue().endswith(
+        """\
+  "test.op"() : () -> ()
+  ^^^^^^^^^
+  | Test
+  ---------
+}"""
+    )
+
+
+def test_print_op_writes_to_current_stdout(capsys: pytest.CaptureFixture[str]):
+    """Test that the printed operation is written to stdout when it is printed."""
+    Printer().print_op(test.TestOp())
+    assert capsys.readouterr().out == '"test.op"() : () -> ()'
+
+
 def test_diagnostic():
     """
     Test that an operation message can be printed on an operation with a region,
@@ -761,6 +793,26 @@ def test_densearray_attr():
     assert_print_op(parsed, prog, None)
 
 
+def test_densearray_attr_packed_values():
+    """Test that dense arrays of any integer width are parsed and then printed."""
+
+    prog = """
+"test.op"() {"all_ones" = array<i64: -1, 18446744073709551615>, "unsigned" = array<ui64: 18446744073709551615>, "wide" = array<i128: 1, -2, 340282366920938463463374607431768211455>} : () -> ()
+    """
+    expected = """
+"test.op"() {"all_ones" = array<i64: -1, -1>, "unsigned" = array<ui64: 18446744073709551615>, "wide" = array<i128: 1, -2, -1>} : () -> ()
+    """
+
+    ctx = MLContext()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(test.Test)
+
+    parser = Parser(ctx, prog)
+    parsed = parser.parse_op()
+
+    assert_print_op(parsed, expected, None)
+
+
 def test_print_function_type():
     io = StringIO()
     printer = Printer(stream=io)
@@ -923,3 +975,37 @@ raw print!
 """
 
     assert output.getvalue() == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "attr,expected",
+    [
+        (
+            DenseIntOrFPElementsAttr.create_dense_int(TensorType(i32, [3]), [1, 2, 3]),
+            'dense<"0x010000000200000003000000"> : tensor<3xi32>',
+        ),
+        (
+            DenseIntOrFPElementsAttr.create_dense_int(TensorType(i32, [2]), [1, 2]),
+            "dense<[1, 2]> : tensor<2xi32>",
+        ),
+        (
+            DenseIntOrFPElementsAttr.create_dense_int(TensorType(i1, [3]), [1, 0, 1]),
+            "dense<[1, 0, 1]> : tensor<3xi1>",
+        ),
+    ],
+)
+def test_print_elementsattrs_with_hex(attr: DenseIntOrFPElementsAttr, expected: str):
+    stream = StringIO()
+    Printer(stream=stream, print_elementsattrs_with_hex_if_larger=2).print_attribute(
+        attr
+    )
+    assert stream.getvalue() == expected
+
+
+def test_elide_elementsattrs():
+    stream = StringIO()
+    printer = Printer(stream=stream, elide_elementsattrs_if_larger=2)
+    printer.print_attribute(
+        DenseIntOrFPElementsAttr.create_dense_int(TensorType(i32, [3]), [1, 2, 3])
+    )
+    assert stream.getvalue() == "dense_resource<__elided__> : tensor<3xi32>"
@@ -0,0 +1,90 @@
+from io import StringIO
+from pathlib import Path
+
+import pytest
+
+from xdsl.context import MLContext
+from xdsl.dialects.builtin import DenseResourceAttr, TensorType, i8
+from xdsl.dialects.test import Test
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+from xdsl.resources import ResourceBlob, ResourceManager
+
+PROGRAM = """
+"test.op"() {attr = dense_resource<blob> : tensor<2xi32>} : () -> ()
+
+{-#
+  dialect_resources: {
+    builtin: {
+      blob: "0x040000000100000002000000"
+    }
+  }
+#-}
+"""
+
+
+def test_parsed_blob_is_lazy():
+    ctx = MLContext()
+    ctx.load_dialect(Test)
+    Parser(ctx, PROGRAM).parse_module()
+
+    blob = ctx.resources.get("builtin", "blob")
+    assert blob is not None
+    assert blob.alignment == 4
+    assert not blob.is_materialized
+    assert blob.to_hex() == "0x040000000100000002000000"
+    assert not blob.is_materialized
+
+    assert blob.data.tobytes() == bytes([1, 0, 0, 0, 2, 0, 0, 0])
+    assert blob.is_materialized
+    assert blob.data.readonly
+
+
+def test_blob_from_bytes():
+    blob = ResourceBlob.from_bytes(b"\x01\x02", alignment=2)
+    assert blob.data.tobytes() == b"\x01\x02"
+    assert blob.to_hex() == "0x020000000102"
+
+
+def test_blob_from_file(tmp_path: Path):
+    path = tmp_path / "weights.bin"
+    path.write_bytes(bytes(range(16)))
+
+    blob = ResourceBlob.from_file(path, offset=4, size=8)
+    assert not blob.is_materialized
+    assert blob.data.tobytes() == bytes(range(4, 12))
+    assert blob.data.readonly
+
+    assert ResourceBlob.from_file(path, offset=12).data.tobytes() == bytes(
+        range(12, 16)
+    )
+    with pytest.raises(ValueError, match="out of bounds"):
+        ResourceBlob.from_file(path, offset=12, size=8).data
+
+
+def test_resource_manager():
+    manager = ResourceManager()
+    blob = ResourceBlob.from_bytes(b"\x00")
+    manager.insert("builtin", "a", blob)
+    assert manager.get("builtin", "a") is blob
+    assert manager.get("builtin", "b") is None
+    assert manager.get("test", "a") is None
+    assert list(manager.dialects) == ["builtin"]
+
+    clone = manager.clone()
+    clone.insert("builtin", "b", blob)
+    assert manager.get("builtin", "b") is None
+    assert dict(clone.get_dialect_resources("builtin")) == {"a": blob, "b": blob}
+
+
+def test_print_only_used_builtin_resources():
+    manager = ResourceManager()
+    manager.insert("builtin", "used", ResourceBlob.from_bytes(b"\x01"))
+    manager.insert("builtin", "unused", ResourceBlob.from_bytes(b"\x02"))
+
+    stream = StringIO()
+    printer = Printer(stream=stream)
+    printer.print_attribute(DenseResourceAttr.from_params("used", TensorType(i8, [1])))
+    printer.print_resources(manager)
+    assert '"0x0100000001"' in stream.getvalue()
+    assert "unused" not in stream.getvalue()
@@ -10,11 +10,14 @@ from dataclasses import dataclass
 
 import pytest
 
-from xdsl.dialects import test
+from xdsl.context import MLContext
+from xdsl.dialects import func, test
 from xdsl.dialects.builtin import (
     AnyIntegerAttr,
+    Builtin,
     IntegerAttr,
     IntegerType,
+    ModuleOp,
     StringAttr,
     SymbolRefAttr,
     i1,
@@ -36,6 +39,9 @@ from xdsl.irdl import (
     result_def,
     traits_def,
 )
+from xdsl.parser import Parser
+from xdsl.pattern_rewriter import PatternRewriter
+from xdsl.rewriter import InsertPoint
 from xdsl.traits import (
     AlwaysSpeculatable,
     ConditionallySpeculatable,
@@ -45,6 +51,7 @@ from xdsl.traits import (
     RecursivelySpeculatable,
     SymbolOpInterface,
     SymbolTable,
+    SymbolTableCollection,
     is_speculatable,
 )
 from xdsl.utils.exceptions import VerifyException
@@ -545,3 +552,74 @@ def test_speculability(
         assert optrait is None
 
     assert is_speculatable(op) is speculatability
+
+
+def test_symbol_table_collection():
+    ctx = MLContext()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(func.Func)
+    module = Parser(
+        ctx,
+        """
+builtin.module {
+  func.func @f() {
+    func.return
+  }
+  func.func @g() {
+    func.call @f() : () -> ()
+    func.return
+  }
+  "builtin.module"() <{"sym_name" = "inner"}> ({
+    func.func @f() {
+      func.call @f() : () -> ()
+      func.return
+    }
+  }) : () -> ()
+}
+""",
+    ).parse_module()
+    f, g, inner = module.ops
+    assert isinstance(g, func.FuncOp)
+    assert isinstance(inner, ModuleOp)
+    (inner_f,) = inner.ops
+    call = g.body.block.first_op
+    assert isinstance(call, func.Call)
+
+    symbol_tables = SymbolTableCollection()
+
+    # Lookups, including nested references
+    assert symbol_tables.lookup_symbol(call, "f") is f
+    assert symbol_tables.lookup_symbol_in(module, StringAttr("g")) is g
+    assert symbol_tables.lookup_symbol_in(module, SymbolRefAttr("inner", ["f"])) is (
+        inner_f
+    )
+    assert symbol_tables.lookup_symbol_in(module, SymbolRefAttr("f", ["f"])) is None
+    assert symbol_tables.lookup_symbol_in(module, "h") is None
+
+    # Uses nested in other symbol tables are not uses of the outer symbols
+    assert symbol_tables.get_symbol_uses(module, "f") == (call,)
+    assert symbol_tables.get_symbol_uses(inner, "f") == (inner_f.body.block.first_op,)
+
+    # The index is kept up to date by rewrites
+    rewriter = PatternRewriter(call)
+    rewriter.extend_from_listener(symbol_tables.get_listener())
+    rewriter.erase_op(call)
+    assert symbol_tables.get_symbol_uses(module, "f") == ()
+
+    new_func = func.FuncOp.external("h", [], [])
+    rewriter.insert_op(new_func, InsertPoint.at_end(module.body.block))
+    assert symbol_tables.lookup_symbol_in(module, "h") is new_func
+
+    new_func.sym_name = StringAttr("k")
+    rewriter.handle_operation_modification(new_func)
+    assert symbol_tables.lookup_symbol_in(module, "h") is None
+    assert symbol_tables.lookup_symbol_in(module, "k") is new_func
+
+    rewriter.erase_op(inner)
+    assert symbol_tables.lookup_symbol_in(module, "inner") is None
+
+    # Insertion or update
+    new_f = func.FuncOp.external("f", [], [])
+    assert symbol_tables.insert_or_update(module, new_f) is f
+    assert symbol_tables.lookup_symbol_in(module, "f") is new_f
+    assert SymbolTable.lookup_symbol(module, "f") is new_f
@@ -0,0 +1,31 @@
+from xdsl.dialects import test
+from xdsl.dialects.builtin import IntAttr, i32
+from xdsl.transforms.common_subexpression_elimination import KnownOps
+
+
+def test_known_ops_scopes():
+    """Test that changes done in a scope of KnownOps are undone when leaving it."""
+    op_a = test.TestPureOp(result_types=(i32,), attributes={"a": IntAttr(0)})
+    op_a2 = test.TestPureOp(result_types=(i32,), attributes={"a": IntAttr(0)})
+    op_b = test.TestPureOp(result_types=(i32,), attributes={"b": IntAttr(0)})
+
+    known_ops = KnownOps()
+    known_ops[op_a] = op_a
+
+    known_ops.push_scope()
+    # Operations are looked up structurally
+    assert known_ops.get(op_a2) is op_a
+    known_ops[op_b] = op_b
+    known_ops[op_a2] = op_a2
+    assert known_ops[op_a] is op_a2
+
+    known_ops.push_scope()
+    known_ops.pop(op_b)
+    assert op_b not in known_ops
+    known_ops.pop_scope()
+
+    assert known_ops[op_b] is op_b
+    known_ops.pop_scope()
+
+    assert known_ops[op_a] is op_a
+    assert op_b not in known_ops
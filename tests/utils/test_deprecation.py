@@ -0,0 +1,38 @@
+from io import StringIO
+
+import pytest
+
+from xdsl.ir import Block, Region
+from xdsl.printer import Printer
+from xdsl.utils.deprecation import deprecated
+
+
+def test_deprecated_warning():
+    region = Region(Block())
+    with pytest.deprecated_call(match="region.blocks") as record:
+        assert region.block_at_index(0) is region.blocks[0]
+    # The warning is attributed to the caller
+    assert [warning.filename for warning in record] == [__file__]
+
+    stream = StringIO()
+    with pytest.deprecated_call(match="print_string_raw"):
+        Printer(stream=stream).print_string_raw("text")
+    assert stream.getvalue() == "text"
+
+
+def test_deprecated_keeps_metadata():
+    assert Region.block_at_index.__name__ == "block_at_index"
+    assert Region.block_at_index.__doc__ == (
+        "Returns the block at the index, or raises IndexError"
+    )
+    assert Printer.print_string_raw.__name__ == "print_string_raw"
+
+    @deprecated("Use something else")
+    def function(x: int) -> int:
+        """Doc."""
+        return x
+
+    assert function.__qualname__.endswith("function")
+    assert function.__doc__ == "Doc."
+    with pytest.deprecated_call(match="Use something else"):
+        assert function(1) == 1
@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from xdsl.utils.mapped_text import MappedTextIO
+
+
+def test_read_file(tmp_path: Path):
+    path = tmp_path / "input.mlir"
+    path.write_text("first\nsecond\n")
+
+    stream = MappedTextIO.from_file(path)
+    assert stream.readline() == "first\n"
+    assert stream.read() == "second\n"
+    assert stream.read() == ""
+
+
+def test_read_empty_file(tmp_path: Path):
+    path = tmp_path / "empty.mlir"
+    path.write_text("")
+
+    assert MappedTextIO.from_file(path).read() == ""
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_split(encode: bool):
+    text = "a\nb\n// -----\nc\n// -----é\n// -----"
+    stream = MappedTextIO(text.encode() if encode else text)
+
+    chunks = [(chunk.read(), offset) for chunk, offset in stream.split("// -----")]
+    assert chunks == [("a\nb\n", 0), ("\nc\n", 2), ("é\n", 4), ("", 5)]
+
+
+@pytest.mark.parametrize("encode", [False, True])
+def test_read_bytes(encode: bool):
+    text = "aé// -----b"
+    stream = MappedTextIO(text.encode() if encode else text)
+
+    (first, _), (second, _) = stream.split("// -----")
+    assert first.read_bytes() == "aé".encode()
+    assert first.read_bytes() == b""
+    assert second.read_bytes() == b"b"
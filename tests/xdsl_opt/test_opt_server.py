@@ -0,0 +1,76 @@
+import threading
+from collections.abc import Iterator, Sequence
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from xdsl.utils.opt_server import OptServer, run_client
+from xdsl.xdsl_opt_main import xDSLOptMain
+
+
+@pytest.fixture(scope="module")
+def socket_path(tmp_path_factory: pytest.TempPathFactory) -> Iterator[str]:
+    """Run a server in a background thread, and return the path of its socket."""
+    path = str(tmp_path_factory.mktemp("server") / "xdsl-opt.sock")
+
+    def create_main(args: Sequence[str]) -> xDSLOptMain:
+        return xDSLOptMain(args=args)
+
+    with OptServer(path, create_main) as server:
+        thread = threading.Thread(target=server.serve_forever, args=(0.01,))
+        thread.start()
+        try:
+            yield path
+        finally:
+            server.shutdown()
+            thread.join()
+    assert not Path(path).exists()
+
+
+def run(socket_path: str, args: list[str], stdin: bytes = b"") -> tuple[int, str, str]:
+    stdout = BytesIO()
+    stderr = BytesIO()
+    exit_code = run_client(socket_path, args, BytesIO(stdin), stdout, stderr)
+    return exit_code, stdout.getvalue().decode(), stderr.getvalue().decode()
+
+
+def test_input_file(socket_path: str):
+    filename = "tests/xdsl_opt/empty_program.mlir"
+    assert run(socket_path, [filename]) == (0, "builtin.module {\n}\n\n", "")
+
+
+def test_stdin(socket_path: str):
+    program = '"test.op"() : () -> ()'
+    exit_code, output, errors = run(
+        socket_path, ["--allow-unregistered-dialect", "-p", "dce"], program.encode()
+    )
+    assert exit_code == 0
+    assert output == 'builtin.module {\n  "test.op"() : () -> ()\n}\n\n'
+    assert errors == ""
+
+
+def test_binary_target(socket_path: str):
+    exit_code, output, _ = run(socket_path, ["-t", "bytecode"], b"builtin.module {}")
+    assert exit_code == 0
+    assert output.startswith("xDSLbc")
+
+
+def test_errors(socket_path: str):
+    exit_code, output, errors = run(socket_path, ["--unknown-argument"])
+    assert exit_code == 2
+    assert output == ""
+    assert "unrecognized arguments: --unknown-argument" in errors
+
+    exit_code, output, errors = run(socket_path, [], b"test.unknown")
+    assert exit_code == 1
+    assert "unregistered operation test.unknown!" in errors
+
+
+def test_main_with_context():
+    main = xDSLOptMain(args=["--allow-unregistered-dialect"])
+    main.ctx.load_registered_dialect("arith")
+    other = xDSLOptMain(args=[], ctx=main.ctx)
+    assert other.ctx is not main.ctx
+    assert other.ctx.get_optional_op("arith.constant") is not None
+    assert not other.ctx.allow_unregistered
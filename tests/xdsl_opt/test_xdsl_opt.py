@@ -1,5 +1,8 @@
+import subprocess
+import sys
 from contextlib import redirect_stdout
 from io import StringIO
+from pathlib import Path
 
 import pytest
 
@@ -170,3 +173,55 @@ def test_split_input():
         expected = file.read()
 
     assert inp.strip() == expected.strip()
+
+
+def test_split_input_jobs(capsys: pytest.CaptureFixture[str]):
+    filename_in = "tests/filecheck/dialects/seq/seq_invalid.mlir"
+    flags = ["--split-input-file", "--verify-diagnostics", "--parsing-diagnostics"]
+
+    xDSLOptMain(args=[filename_in, *flags]).run()
+    serial_output = capsys.readouterr().out
+
+    xDSLOptMain(args=[filename_in, *flags, "-j", "2"]).run()
+    assert capsys.readouterr().out == serial_output
+
+
+def test_bytecode_round_trip(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    filename_in = "tests/xdsl_opt/simple_program.mlir"
+    filename_bytecode = str(tmp_path / "simple_program.xdslbc")
+
+    xDSLOptMain(args=[filename_in]).run()
+    text_output = capsys.readouterr().out
+
+    xDSLOptMain(args=[filename_in, "-t", "bytecode", "-o", filename_bytecode]).run()
+    xDSLOptMain(args=[filename_bytecode]).run()
+    assert capsys.readouterr().out == text_output
+
+
+def test_bytecode_split_input():
+    filename_in = "tests/filecheck/dialects/seq/seq_invalid.mlir"
+    opt = xDSLOptMain(args=[filename_in, "--split-input-file", "-t", "bytecode"])
+
+    with pytest.raises(Exception) as e:
+        opt.run()
+
+    assert e.value.args[0] == "Target 'bytecode' does not support split input files"
+
+
+def test_startup_imports():
+    """Check that running xdsl-opt on a small program does not import slow modules."""
+    code = """
+import sys
+from xdsl.xdsl_opt_main import xDSLOptMain
+xDSLOptMain(args=["tests/xdsl_opt/empty_program.mlir"]).run()
+print(" ".join(sorted(sys.modules)))
+"""
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    modules = set(result.stdout.split())
+    for module in ("asyncio", "multiprocessing", "importlib.metadata"):
+        assert module not in modules
+    assert {m for m in modules if m.startswith("xdsl.dialects.")} == {
+        "xdsl.dialects.builtin"
+    }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 import warnings
 from collections.abc import Iterable
 from contextlib import contextmanager
@@ -248,7 +249,7 @@ class CslPrintContext:
             case UnitAttr():
                 return ""
             case DenseIntOrFPElementsAttr():
-                data = init.data.data
+                data = init.get_attrs()
                 assert (
                     len(data) == 1
                 ), f"Memref global initialiser has to have 1 value, got {len(data)}"
@@ -443,6 +444,17 @@ class CslPrintContext:
                 return str(bool(val.data)).lower()
             case IntegerAttr(value=val):
                 return str(val.data)
+            case FloatAttr(value=val, type=Float16Type() | Float32Type() as typ):
+                # Print the shortest literal that denotes the same value in the
+                # precision of the type, as values read from packed dense
+                # elements are rounded to it
+                format = "<e" if isinstance(typ, Float16Type) else "<f"
+                packed = struct.pack(format, val.data)
+                for precision in range(1, 17):
+                    literal = float(f"{val.data:.{precision}g}")
+                    if struct.pack(format, literal) == packed:
+                        return str(literal)
+                return str(val.data)
             case FloatAttr(value=val):
                 return str(val.data)
             case StringAttr() as s:
@@ -283,16 +283,16 @@ class ConvertMemrefGlobalOp(RewritePattern):
                     raise DiagnosticException(
                         f"Unsupported memref element type for riscv lowering: {element_type}"
                     )
-                ints = [d.value.data for d in initial_value.data]
+                ints = list(initial_value.get_values())
                 for i in ints:
                     assert isinstance(i, int)
                 ints = cast(list[int], ints)
                 ptr = TypedPtr.new_int32(ints).raw
             case Float32Type():
-                floats = [d.value.data for d in initial_value.data]
+                floats = list(initial_value.get_values())
                 ptr = TypedPtr.new_float32(floats).raw
             case Float64Type():
-                floats = [d.value.data for d in initial_value.data]
+                floats = list(initial_value.get_values())
                 ptr = TypedPtr.new_float64(floats).raw
             case _:
                 raise DiagnosticException(
@@ -385,8 +385,7 @@ class ConvertMemrefSubviewOp(RewritePattern):
             index_ops: list[Operation] = []
 
             dynamic_offset_index = 0
-            for static_offset_attr in op.static_offsets.data:
-                static_offset = static_offset_attr.data
+            for static_offset in op.static_offsets.as_tuple():
                 assert isinstance(static_offset, int)
                 if static_offset == memref.Subview.DYNAMIC_INDEX:
                     index_ops.append(
@@ -0,0 +1,754 @@
+"""
+A compact binary serialization format for xDSL IR.
+
+The format is not compatible with MLIR bytecode. It is meant to exchange IR between
+xDSL tools, and is much faster to read than the textual format, as it does not need
+to be lexed. A file is laid out as follows, where all integers are encoded as
+unsigned LEB128 varints:
+
+```
+file        ::= magic version string-table attribute-table resources operation
+string-table    ::= count (size utf8-bytes)*
+attribute-table ::= count attribute*
+resources       ::= count (dialect-string count (key-string alignment size bytes)*)*
+```
+
+Attributes reference strings and previously defined attributes by their index in
+the tables, so that each distinct attribute is only encoded once. Builtin data
+attributes have a binary encoding, and other data attributes are encoded in their
+textual format.
+
+Operations reference their name, types, and attributes by index. SSA values are
+numbered in order of definition within each region isolated from above, and are
+referenced by their number. The regions of operations that are isolated from above
+are prefixed by their size, so that they can be loaded lazily.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from io import StringIO
+from typing import IO, TypeVar, cast
+
+from xdsl.context import MLContext
+from xdsl.dialects import builtin
+from xdsl.dialects.builtin import (
+    ArrayAttr,
+    Builtin,
+    BytesAttr,
+    DenseResourceAttr,
+    DictionaryAttr,
+    FloatData,
+    IntAttr,
+    ModuleOp,
+    StringAttr,
+    UnregisteredAttr,
+    UnregisteredOp,
+)
+from xdsl.ir import (
+    Attribute,
+    Block,
+    Data,
+    Operation,
+    ParametrizedAttribute,
+    Region,
+    SSAValue,
+)
+from xdsl.parser import AttrParser, ForwardDeclaredValue, ParserState
+from xdsl.printer import Printer
+from xdsl.resources import ResourceBlob, ResourceManager
+from xdsl.traits import IsolatedFromAbove
+from xdsl.utils.lexer import Input, Lexer
+
+_T = TypeVar("_T")
+
+BYTECODE_MAGIC = b"xDSLbc\x00"
+"""The bytes starting every bytecode file."""
+
+BYTECODE_VERSION = 1
+"""The version of the bytecode format written by `BytecodeWriter`."""
+
+
+class BytecodeError(Exception):
+    """An error raised when reading an invalid bytecode file."""
+
+
+class _AttrKind(IntEnum):
+    """The kind of an entry in the attribute table."""
+
+    PARAMETRIZED = 0
+    UNREGISTERED = 1
+    DATA = 2
+    INT = 3
+    STRING = 4
+    FLOAT = 5
+    BYTES = 6
+    ARRAY = 7
+    DICTIONARY = 8
+
+
+class _OpFlags(IntEnum):
+    """Flags describing which optional parts of an operation are encoded."""
+
+    SUCCESSORS = 1
+    PROPERTIES = 2
+    ATTRIBUTES = 4
+    REGIONS = 8
+    ISOLATED = 16
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Write an unsigned integer in the LEB128 format."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_signed_varint(out: bytearray, value: int) -> None:
+    """Write a signed integer in the LEB128 format, after zigzag encoding."""
+    _write_varint(out, value << 1 if value >= 0 else ((-value) << 1) - 1)
+
+
+_BUILTIN_ATTRIBUTE_KEYS: dict[type[Attribute], str] = {
+    value: f"builtin.{value.__name__}"
+    for value in vars(builtin).values()
+    if isinstance(value, type)
+    and issubclass(value, Attribute)
+    and value.__module__ == builtin.__name__
+}
+"""
+The keys identifying the builtin attributes, which are not all registered in the
+builtin dialect, and do not all have distinct names.
+"""
+
+_BUILTIN_ATTRIBUTES = {key: attr for attr, key in _BUILTIN_ATTRIBUTE_KEYS.items()}
+
+
+def _is_isolated(op: Operation) -> bool:
+    return bool(op.regions) and op.has_trait(IsolatedFromAbove)
+
+
+@dataclass(eq=False)
+class BytecodeWriter:
+    """Writes an operation and its nested IR to a stream, in the bytecode format."""
+
+    stream: IO[bytes]
+    """The binary stream the bytecode is written to."""
+
+    resources: ResourceManager | None = field(default=None)
+    """
+    The resource manager containing the blobs of the written `dense_resource`
+    attributes, and the blobs of other dialects, which are written along the IR.
+    """
+
+    _strings: dict[str, int] = field(default_factory=dict, init=False)
+    """The index of each string in the string table."""
+
+    _attributes: dict[Attribute, int] = field(default_factory=dict, init=False)
+    """The index of each hashable attribute in the attribute table."""
+
+    _num_attributes: int = field(default=0, init=False)
+    """The number of entries in the attribute table."""
+
+    _attribute_data: bytearray = field(default_factory=bytearray, init=False)
+    """The encoded entries of the attribute table."""
+
+    _resource_handles: set[str] = field(default_factory=set, init=False)
+    """The handles of the written `dense_resource` attributes."""
+
+    _values: dict[SSAValue, int] = field(default_factory=dict, init=False)
+    """The number of each SSA value of the current isolated scope."""
+
+    _num_defined_values: int = field(default=0, init=False)
+    """The number of SSA values of the current scope that were already written."""
+
+    _blocks: dict[Block, int] = field(default_factory=dict, init=False)
+    """The index of each block of the region being written."""
+
+    def write_op(self, op: Operation) -> None:
+        """Write an operation and its nested IR, with the tables they use."""
+        ir = bytearray()
+        self._values = {}
+        self._num_defined_values = 0
+        self._number_op_values(op)
+        self._write_op(op, ir)
+        resources = self._encode_resources()
+
+        out = bytearray(BYTECODE_MAGIC)
+        _write_varint(out, BYTECODE_VERSION)
+        _write_varint(out, len(self._strings))
+        for string in self._strings:
+            encoded = string.encode("utf-8", "surrogatepass")
+            _write_varint(out, len(encoded))
+            out += encoded
+        _write_varint(out, self._num_attributes)
+        out += self._attribute_data
+        out += resources
+        out += ir
+        self.stream.write(out)
+
+    def _intern_string(self, string: str) -> int:
+        index = self._strings.get(string)
+        if index is None:
+            index = len(self._strings)
+            self._strings[string] = index
+        return index
+
+    def _intern_attribute(self, attr: Attribute) -> int:
+        """Get the index of an attribute in the table, adding it if necessary."""
+        try:
+            index = self._attributes.get(attr)
+            hashable = True
+        except TypeError:
+            index = None
+            hashable = False
+        if index is not None:
+            return index
+
+        # Nested attributes are added to the table before the attribute itself
+        entry = bytearray()
+        attr_type = type(attr)
+        if isinstance(attr, UnregisteredAttr):
+            entry.append(_AttrKind.UNREGISTERED)
+            _write_varint(entry, self._intern_string(attr.attr_name.data))
+            _write_varint(entry, attr.is_type.data | (attr.is_opaque.data << 1))
+            _write_varint(entry, self._intern_string(attr.value.data))
+        elif isinstance(attr, ParametrizedAttribute):
+            if isinstance(attr, DenseResourceAttr):
+                self._resource_handles.add(attr.resource_handle.data)
+            params = [self._intern_attribute(param) for param in attr.parameters]
+            entry.append(_AttrKind.PARAMETRIZED)
+            key = _BUILTIN_ATTRIBUTE_KEYS.get(type(attr), attr.name)
+            _write_varint(entry, self._intern_string(key))
+            _write_varint(entry, len(params))
+            for param in params:
+                _write_varint(entry, param)
+        elif attr_type is IntAttr:
+            entry.append(_AttrKind.INT)
+            _write_signed_varint(entry, cast(IntAttr, attr).data)
+        elif attr_type is StringAttr:
+            entry.append(_AttrKind.STRING)
+            _write_varint(entry, self._intern_string(cast(StringAttr, attr).data))
+        elif attr_type is FloatData:
+            entry.append(_AttrKind.FLOAT)
+            entry += struct.pack("<d", cast(FloatData, attr).data)
+        elif attr_type is BytesAttr:
+            data = cast(BytesAttr, attr).data
+            entry.append(_AttrKind.BYTES)
+            _write_varint(entry, len(data))
+            entry += data
+        elif attr_type is ArrayAttr:
+            elements = [
+                self._intern_attribute(elem)
+                for elem in cast(ArrayAttr[Attribute], attr).data
+            ]
+            entry.append(_AttrKind.ARRAY)
+            _write_varint(entry, len(elements))
+            for elem in elements:
+                _write_varint(entry, elem)
+        elif attr_type is DictionaryAttr:
+            entry.append(_AttrKind.DICTIONARY)
+            self._encode_attr_dict(cast(DictionaryAttr, attr).data, entry)
+        elif isinstance(attr, Data):
+            text = StringIO()
+            Printer(stream=text).print_attribute(attr)
+            entry.append(_AttrKind.DATA)
+            _write_varint(entry, self._intern_string(text.getvalue()))
+        else:
+            raise ValueError(f"Cannot write attribute {attr} in bytecode")
+
+        index = self._num_attributes
+        self._num_attributes += 1
+        self._attribute_data += entry
+        if hashable:
+            self._attributes[attr] = index
+        return index
+
+    def _encode_attr_dict(self, attrs: dict[str, Attribute], out: bytearray) -> None:
+        # Intern all the values first, as they may add entries to the table
+        entries = [
+            (self._intern_string(name), self._intern_attribute(value))
+            for name, value in attrs.items()
+        ]
+        _write_varint(out, len(entries))
+        for name, value in entries:
+            _write_varint(out, name)
+            _write_varint(out, value)
+
+    def _encode_resources(self) -> bytearray:
+        out = bytearray()
+        if self.resources is None:
+            _write_varint(out, 0)
+            return out
+        dialect_blobs = {
+            dialect: {
+                key: blob
+                for key, blob in self.resources.get_dialect_resources(dialect).items()
+                if dialect != "builtin" or key in self._resource_handles
+            }
+            for dialect in self.resources.dialects
+        }
+        dialect_blobs = {
+            dialect: blobs for dialect, blobs in dialect_blobs.items() if blobs
+        }
+        _write_varint(out, len(dialect_blobs))
+        for dialect, blobs in dialect_blobs.items():
+            _write_varint(out, self._intern_string(dialect))
+            _write_varint(out, len(blobs))
+            for key, blob in blobs.items():
+                data = blob.data
+                _write_varint(out, self._intern_string(key))
+                _write_varint(out, blob.alignment)
+                _write_varint(out, len(data))
+                out += data
+        return out
+
+    def _number_values(self, regions: Sequence[Region]) -> None:
+        """
+        Number the SSA values defined in regions, in the order in which they are
+        written. The values of nested regions isolated from above are not numbered.
+        """
+        values = self._values
+        for region in regions:
+            for block in region.blocks:
+                for arg in block.args:
+                    values[arg] = len(values)
+            for block in region.blocks:
+                for op in block.ops:
+                    self._number_op_values(op)
+
+    def _number_op_values(self, op: Operation) -> None:
+        """Number the results of an operation, and the values of its regions."""
+        values = self._values
+        for result in op.results:
+            values[result] = len(values)
+        if op.regions and not _is_isolated(op):
+            self._number_values(op.regions)
+
+    def _write_value_name(self, value: SSAValue, out: bytearray) -> None:
+        if value.name_hint is None:
+            out.append(0)
+        else:
+            _write_varint(out, self._intern_string(value.name_hint) + 1)
+
+    def _write_op(self, op: Operation, out: bytearray) -> None:
+        if isinstance(op, UnregisteredOp):
+            name = op.op_name.data
+            attributes = {
+                key: value for key, value in op.attributes.items() if key != "op_name__"
+            }
+        else:
+            name = op.name
+            attributes = op.attributes
+        isolated = _is_isolated(op)
+        flags = (
+            (_OpFlags.SUCCESSORS if op.successors else 0)
+            | (_OpFlags.PROPERTIES if op.properties else 0)
+            | (_OpFlags.ATTRIBUTES if attributes else 0)
+            | (_OpFlags.REGIONS if op.regions else 0)
+            | (_OpFlags.ISOLATED if isolated else 0)
+        )
+        _write_varint(out, self._intern_string(name))
+        out.append(flags)
+
+        # Results
+        _write_varint(out, len(op.results))
+        for result in op.results:
+            _write_varint(out, self._intern_attribute(result.type))
+            self._write_value_name(result, out)
+
+        # Operands, with their type if they are defined later
+        _write_varint(out, len(op.operands))
+        for operand in op.operands:
+            index = self._values.get(operand)
+            if index is None:
+                raise ValueError(
+                    f"Operand of {name} is not defined in the written operation"
+                )
+            if index < self._num_defined_values:
+                _write_varint(out, index << 1)
+            else:
+                _write_varint(out, (index << 1) | 1)
+                _write_varint(out, self._intern_attribute(operand.type))
+        self._num_defined_values += len(op.results)
+
+        if op.successors:
+            _write_varint(out, len(op.successors))
+            for successor in op.successors:
+                _write_varint(out, self._blocks[successor])
+        if op.properties:
+            self._encode_attr_dict(op.properties, out)
+        if attributes:
+            self._encode_attr_dict(attributes, out)
+        if not op.regions:
+            return
+
+        _write_varint(out, len(op.regions))
+        if not isolated:
+            for region in op.regions:
+                self._write_region(region, out)
+            return
+
+        # Isolated regions have their own value numbering, and are prefixed by their
+        # size so that they can be skipped
+        outer_values, outer_num_defined = self._values, self._num_defined_values
+        self._values = {}
+        self._num_defined_values = 0
+        self._number_values(op.regions)
+        regions = bytearray()
+        for region in op.regions:
+            self._write_region(region, regions)
+        self._values, self._num_defined_values = outer_values, outer_num_defined
+        _write_varint(out, len(regions))
+        out += regions
+
+    def _write_region(self, region: Region, out: bytearray) -> None:
+        outer_blocks = self._blocks
+        self._blocks = {block: index for index, block in enumerate(region.blocks)}
+        _write_varint(out, len(self._blocks))
+        for block in region.blocks:
+            _write_varint(out, len(block.args))
+            for arg in block.args:
+                _write_varint(out, self._intern_attribute(arg.type))
+                self._write_value_name(arg, out)
+            self._num_defined_values += len(block.args)
+        for block in region.blocks:
+            _write_varint(out, len(block.ops))
+            for op in block.ops:
+                self._write_op(op, out)
+        self._blocks = outer_blocks
+
+
+_BUILTIN_OPERATIONS = {op.name: op for op in Builtin.operations}
+
+
+@dataclass(eq=False)
+class BytecodeReader:
+    """
+    Reads IR written in the bytecode format.
+
+    If `lazy` is set, the regions of nested operations that are isolated from above
+    are left empty when reading, and are only read when calling `materialize`.
+    """
+
+    ctx: MLContext
+    """The context used to get the operation and attribute definitions."""
+
+    data: bytes
+    """The bytecode to read."""
+
+    lazy: bool = field(default=False)
+    """Whether the regions isolated from above are only read on demand."""
+
+    _pos: int = field(default=0, init=False)
+    _strings: list[str] = field(default_factory=list, init=False)
+    _attributes: list[Attribute] = field(default_factory=list, init=False)
+    _op_types: dict[int, type[Operation]] = field(default_factory=dict, init=False)
+    _values: list[SSAValue] = field(default_factory=list, init=False)
+    """The SSA values of the current isolated scope, in order of definition."""
+    _forward_values: dict[int, ForwardDeclaredValue] = field(
+        default_factory=dict, init=False
+    )
+    """The SSA values of the current scope that are used before their definition."""
+    _blocks: list[Block] = field(default_factory=list, init=False)
+    """The blocks of the region being read."""
+    _unmaterialized: dict[Operation, int] = field(default_factory=dict, init=False)
+    """The position of the regions of operations that were not read yet."""
+
+    def __post_init__(self):
+        self.data = bytes(self.data)
+
+    def read_op(self) -> Operation:
+        """Read the operation contained in the bytecode."""
+        self._pos = 0
+        if not self.data.startswith(BYTECODE_MAGIC):
+            raise BytecodeError("Invalid bytecode magic number")
+        self._pos = len(BYTECODE_MAGIC)
+        if (version := self._read_varint()) != BYTECODE_VERSION:
+            raise BytecodeError(f"Unsupported bytecode version {version}")
+        try:
+            self._read_strings()
+            self._read_attributes()
+            self._read_resources()
+            op = self._read_scope(self._read_op)
+            # The regions of the top-level operation are always read
+            self.materialize(op)
+        except IndexError as e:
+            raise BytecodeError("Unexpected end of bytecode") from e
+        if self._pos != len(self.data):
+            raise BytecodeError("Unexpected data after the operation")
+        return op
+
+    def read_module(self) -> ModuleOp:
+        """Read the module contained in the bytecode."""
+        op = self.read_op()
+        if not isinstance(op, ModuleOp):
+            raise BytecodeError(f"builtin.module operation expected, got {op.name}")
+        return op
+
+    @property
+    def unmaterialized_ops(self) -> tuple[Operation, ...]:
+        """The operations whose regions were not read yet."""
+        return tuple(self._unmaterialized)
+
+    def materialize(self, op: Operation) -> None:
+        """Read the regions of an operation that were skipped by lazy reading."""
+        if (pos := self._unmaterialized.pop(op, None)) is None:
+            return
+        outer_pos, outer_blocks = self._pos, self._blocks
+        self._pos = pos
+        try:
+            self._read_varint()
+            self._read_scope(lambda: self._read_regions(op.regions))
+        except IndexError as e:
+            raise BytecodeError("Unexpected end of bytecode") from e
+        self._pos, self._blocks = outer_pos, outer_blocks
+
+    def materialize_all(self) -> None:
+        """Read all the regions that were skipped by lazy reading."""
+        while self._unmaterialized:
+            self.materialize(next(iter(self._unmaterialized)))
+
+    def _read_varint(self) -> int:
+        data = self.data
+        pos = self._pos
+        byte = data[pos]
+        pos += 1
+        if byte < 0x80:
+            self._pos = pos
+            return byte
+        result = byte & 0x7F
+        shift = 7
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                self._pos = pos
+                return result
+            shift += 7
+
+    def _read_bytes(self, size: int) -> bytes:
+        end = self._pos + size
+        if end > len(self.data):
+            raise IndexError
+        data = self.data[self._pos : end]
+        self._pos = end
+        return data
+
+    def _read_strings(self) -> None:
+        self._strings = [
+            self._read_bytes(self._read_varint()).decode("utf-8", "surrogatepass")
+            for _ in range(self._read_varint())
+        ]
+
+    def _get_attr_def(
+        self, name: str, create_unregistered_as_type: bool = False
+    ) -> type[Attribute]:
+        if (attr_def := _BUILTIN_ATTRIBUTES.get(name)) is not None:
+            return attr_def
+        try:
+            attr_def = self.ctx.get_optional_attr(name, create_unregistered_as_type)
+        except ValueError:
+            attr_def = None
+        if attr_def is None:
+            raise BytecodeError(f"'{name}' is not registered")
+        return attr_def
+
+    def _read_attributes(self) -> None:
+        strings = self._strings
+        attributes = self._attributes = []
+        uniquer = self.ctx.uniquer
+        read_varint = self._read_varint
+        for _ in range(read_varint()):
+            kind = self.data[self._pos]
+            self._pos += 1
+            attr: Attribute
+            match kind:
+                case _AttrKind.PARAMETRIZED:
+                    attr_def = self._get_attr_def(strings[read_varint()])
+                    params = [attributes[read_varint()] for _ in range(read_varint())]
+                    if not issubclass(attr_def, ParametrizedAttribute):
+                        raise BytecodeError(f"{attr_def.name} is not parametrized")
+                    if uniquer is not None:
+                        attr = uniquer.get(attr_def, params)
+                    else:
+                        attr = attr_def.new(params)
+                case _AttrKind.UNREGISTERED:
+                    name = strings[read_varint()]
+                    flags = read_varint()
+                    attr_def = self._get_attr_def(name, bool(flags & 1))
+                    if not issubclass(attr_def, UnregisteredAttr):
+                        raise BytecodeError(f"'{name}' is unexpectedly registered")
+                    attr = attr_def(
+                        name, bool(flags & 1), bool(flags & 2), strings[read_varint()]
+                    )
+                case _AttrKind.DATA:
+                    lexer = Lexer(Input(strings[read_varint()], "<bytecode>"))
+                    attr = AttrParser(ParserState(lexer), self.ctx).parse_attribute()
+                case _AttrKind.INT:
+                    value = read_varint()
+                    attr = IntAttr(value >> 1 if not value & 1 else -((value + 1) >> 1))
+                case _AttrKind.STRING:
+                    attr = StringAttr(strings[read_varint()])
+                case _AttrKind.FLOAT:
+                    (value,) = struct.unpack("<d", self._read_bytes(8))
+                    attr = FloatData(value)
+                case _AttrKind.BYTES:
+                    attr = BytesAttr(self._read_bytes(read_varint()))
+                case _AttrKind.ARRAY:
+                    attr = ArrayAttr(
+                        tuple(attributes[read_varint()] for _ in range(read_varint()))
+                    )
+                case _AttrKind.DICTIONARY:
+                    attr = DictionaryAttr(self._read_attr_dict())
+                case _:
+                    raise BytecodeError(f"Invalid attribute kind {kind}")
+            if uniquer is not None and kind != _AttrKind.PARAMETRIZED:
+                attr = uniquer.unique(attr)
+            attributes.append(attr)
+
+    def _read_attr_dict(self) -> dict[str, Attribute]:
+        strings = self._strings
+        attributes = self._attributes
+        read_varint = self._read_varint
+        return {
+            strings[read_varint()]: attributes[read_varint()]
+            for _ in range(read_varint())
+        }
+
+    def _read_resources(self) -> None:
+        strings = self._strings
+        for _ in range(self._read_varint()):
+            dialect = strings[self._read_varint()]
+            for _ in range(self._read_varint()):
+                key = strings[self._read_varint()]
+                alignment = self._read_varint()
+                blob = ResourceBlob.from_bytes(
+                    self._read_bytes(self._read_varint()), alignment
+                )
+                self.ctx.resources.insert(dialect, key, blob)
+
+    def _get_op_type(self, name_index: int) -> type[Operation]:
+        if (op_type := self._op_types.get(name_index)) is not None:
+            return op_type
+        name = self._strings[name_index]
+        op_type = _BUILTIN_OPERATIONS.get(name) or self.ctx.get_optional_op(name)
+        if op_type is None:
+            raise BytecodeError(f"unregistered operation {name}!")
+        self._op_types[name_index] = op_type
+        return op_type
+
+    def _read_scope(self, read: Callable[[], _T]) -> _T:
+        """Read IR with its own SSA value numbering."""
+        outer_values, outer_forward_values = self._values, self._forward_values
+        self._values = []
+        self._forward_values = {}
+        result = read()
+        if self._forward_values:
+            raise BytecodeError("Use of undefined SSA values")
+        self._values, self._forward_values = outer_values, outer_forward_values
+        return result
+
+    def _define_values(self, values: Sequence[SSAValue]) -> None:
+        start = len(self._values)
+        self._values.extend(values)
+        if self._forward_values:
+            for index, value in enumerate(values, start):
+                if (forward := self._forward_values.pop(index, None)) is not None:
+                    forward.replace_by(value)
+
+    def _read_op(self) -> Operation:
+        read_varint = self._read_varint
+        attributes = self._attributes
+        op_type = self._get_op_type(read_varint())
+        flags = self.data[self._pos]
+        self._pos += 1
+
+        result_types: list[Attribute] = []
+        result_names: list[int] = []
+        for _ in range(read_varint()):
+            result_types.append(attributes[read_varint()])
+            result_names.append(read_varint())
+
+        values = self._values
+        operands: list[SSAValue] = []
+        for _ in range(read_varint()):
+            index = read_varint()
+            if not index & 1:
+                operands.append(values[index >> 1])
+                continue
+            index >>= 1
+            if (forward := self._forward_values.get(index)) is None:
+                forward = ForwardDeclaredValue(attributes[read_varint()])
+                self._forward_values[index] = forward
+            else:
+                read_varint()
+            operands.append(forward)
+
+        successors = (
+            [self._blocks[read_varint()] for _ in range(read_varint())]
+            if flags & _OpFlags.SUCCESSORS
+            else ()
+        )
+        properties = self._read_attr_dict() if flags & _OpFlags.PROPERTIES else {}
+        attrs = self._read_attr_dict() if flags & _OpFlags.ATTRIBUTES else {}
+        regions = (
+            [Region() for _ in range(read_varint())] if flags & _OpFlags.REGIONS else ()
+        )
+        op = op_type.create(
+            operands=operands,
+            result_types=result_types,
+            properties=properties,
+            attributes=attrs,
+            successors=successors,
+            regions=regions,
+        )
+        for result, name_index in zip(op.results, result_names):
+            if name_index:
+                result.name_hint = self._strings[name_index - 1]
+        self._define_values(op.results)
+
+        if not regions:
+            return op
+        if not flags & _OpFlags.ISOLATED:
+            self._read_regions(regions)
+        elif self.lazy:
+            self._unmaterialized[op] = self._pos
+            size = read_varint()
+            self._pos += size
+        else:
+            read_varint()
+            self._read_scope(lambda: self._read_regions(regions))
+        return op
+
+    def _read_regions(self, regions: Sequence[Region]) -> None:
+        read_varint = self._read_varint
+        attributes = self._attributes
+        strings = self._strings
+        outer_blocks = self._blocks
+        for region in regions:
+            # The arguments of all blocks are defined before the operations, as
+            # blocks may be used before they appear in the region
+            blocks: list[Block] = []
+            for _ in range(read_varint()):
+                arg_types: list[Attribute] = []
+                arg_names: list[int] = []
+                for _ in range(read_varint()):
+                    arg_types.append(attributes[read_varint()])
+                    arg_names.append(read_varint())
+                block = Block(arg_types=arg_types)
+                for arg, name_index in zip(block.args, arg_names):
+                    if name_index:
+                        arg.name_hint = strings[name_index - 1]
+                self._define_values(block.args)
+                blocks.append(block)
+            self._blocks = blocks
+            for block in blocks:
+                block.add_ops([self._read_op() for _ in range(read_varint())])
+            region.add_block(blocks)
+        self._blocks = outer_blocks
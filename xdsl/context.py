@@ -1,11 +1,63 @@
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Sequence
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar, cast
 
-from xdsl.ir import Dialect
+from xdsl.ir import Attribute, Dialect, ParametrizedAttribute
+from xdsl.resources import ResourceManager
 
 if TYPE_CHECKING:
-    from xdsl.ir import Attribute, Operation
+    from xdsl.ir import Operation
+
+_AttributeT = TypeVar("_AttributeT", bound=Attribute)
+_ParametrizedAttributeT = TypeVar(
+    "_ParametrizedAttributeT", bound=ParametrizedAttribute
+)
+
+
+@dataclass
+class AttributeUniquer:
+    """
+    Hash-conses attributes, so that equal attributes are represented by the same
+    object.
+    Uniqued attributes are compared by identity first, and their hash is only computed
+    once. Parametrized attributes created with `get` are only verified once.
+    """
+
+    _attributes: dict[Attribute, Attribute] = field(default_factory=dict)
+    """The unique instance of each attribute."""
+
+    _parametrized: dict[
+        tuple[type[ParametrizedAttribute], tuple[Attribute, ...]],
+        ParametrizedAttribute,
+    ] = field(default_factory=dict)
+    """The unique parametrized attributes, indexed by their type and parameters."""
+
+    def unique(self, attr: _AttributeT) -> _AttributeT:
+        """
+        Get the unique attribute equal to `attr`, registering `attr` if there is none.
+        Attributes with unhashable data are returned as is.
+        """
+        try:
+            return cast(_AttributeT, self._attributes.setdefault(attr, attr))
+        except TypeError:
+            return attr
+
+    def get(
+        self, attr_type: type[_ParametrizedAttributeT], params: Sequence[Attribute]
+    ) -> _ParametrizedAttributeT:
+        """
+        Get the unique attribute of type `attr_type` with the given parameters.
+        The attribute is only created and verified if it does not exist yet.
+        """
+        key = (attr_type, tuple(params))
+        try:
+            attr = self._parametrized.get(key)
+        except TypeError:
+            return attr_type.new(params)
+        if attr is None:
+            attr = self.unique(attr_type.new(params))
+            self._parametrized[key] = attr
+        return cast(_ParametrizedAttributeT, attr)
 
 
 @dataclass
@@ -24,6 +76,13 @@ class MLContext:
     A dictionary of all registered dialects that are not yet loaded. This is used to
     only load the respective Python files when the dialect is actually used.
     """
+    resources: ResourceManager = field(default_factory=ResourceManager)
+    """The resource blobs referenced by the IR, such as `dense_resource` data."""
+    uniquer: AttributeUniquer | None = field(default=None)
+    """
+    If set, the attributes created by the parser are uniqued, so that equal
+    attributes are the same object.
+    """
 
     def clone(self) -> "MLContext":
         return MLContext(
@@ -32,6 +91,8 @@ class MLContext:
             self._loaded_ops.copy(),
             self._loaded_attrs.copy(),
             self._registered_dialects.copy(),
+            self.resources.clone(),
+            self.uniquer,
         )
 
     @property
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import math
+import struct
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
@@ -10,6 +12,7 @@ from typing import (
     Annotated,
     Any,
     Generic,
+    NamedTuple,
     TypeAlias,
     TypeVar,
     cast,
@@ -72,6 +75,8 @@ from xdsl.utils.exceptions import DiagnosticException, VerifyException
 from xdsl.utils.isattr import isattr
 
 if TYPE_CHECKING:
+    import numpy.typing as npt
+
     from xdsl.parser import AttrParser, Parser
     from xdsl.printer import Printer
 
@@ -614,6 +619,16 @@ class FloatData(Data[float]):
     def print_parameter(self, printer: Printer) -> None:
         printer.print_string(f"{self.data}")
 
+    def __eq__(self, other: object) -> bool:
+        # Floats are compared bitwise, so that `-0.0` and `0.0` are different
+        # attributes, and NaN attributes are equal to themselves.
+        if not isinstance(other, FloatData):
+            return NotImplemented
+        return struct.pack("<d", self.data) == struct.pack("<d", other.data)
+
+    def __hash__(self) -> int:
+        return hash(struct.pack("<d", self.data))
+
 
 _FloatAttrType = TypeVar("_FloatAttrType", bound=AnyFloat, covariant=True)
 
@@ -922,45 +937,59 @@ class DenseArrayBase(ParametrizedAttribute):
     name = "array"
 
     elt_type: ParameterDef[IntegerType | IndexType | AnyFloat]
-    data: ParameterDef[ArrayAttr[IntAttr] | ArrayAttr[FloatData]]
+    data: ParameterDef[BytesAttr]
+    """
+    The elements, packed in a little-endian buffer: doubles for float element types,
+    and integers with the storage layout of dense elements otherwise.
+    Signless integers that do not fit in the signed storage range wrap around.
+    """
+
+    def __init__(
+        self, elt_type: IntegerType | IndexType | AnyFloat, data: bytes | BytesAttr
+    ):
+        if isinstance(data, bytes):
+            data = BytesAttr(data)
+        super().__init__([elt_type, data])
 
     def verify(self):
-        if isinstance(self.elt_type, IntegerType | IndexType):
-            for d in self.data.data:
-                if isinstance(d, FloatData):
-                    raise VerifyException(
-                        "dense array of integer or index element type "
-                        "should only contain integers"
-                    )
-        else:
-            for d in self.data.data:
-                if isinstance(d, IntAttr):
-                    raise VerifyException(
-                        "dense array of float element type "
-                        "should only contain floats"
-                    )
+        item_size = self._get_element_size(self.elt_type)
+        if len(self.data.data) % item_size:
+            raise VerifyException(
+                f"dense array of {self.elt_type} expects a buffer of {item_size}-byte "
+                f"values, but got {len(self.data.data)} bytes"
+            )
+
+    @staticmethod
+    def _get_element_size(data_type: IntegerType | IndexType | AnyFloat) -> int:
+        """Get the size in bytes of an element of the buffer."""
+        if isinstance(data_type, IntegerType | IndexType):
+            return _get_dense_element_size(data_type)
+        return 8
 
     @staticmethod
     def create_dense_int_or_index(
         data_type: IntegerType | IndexType, data: Sequence[int] | Sequence[IntAttr]
     ) -> DenseArrayBase:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [IntAttr(d) for d in cast(Sequence[int], data)]
-        else:
-            attr_list = cast(Sequence[IntAttr], data)
-
-        return DenseArrayBase([data_type, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], IntAttr):
+            data = [d.data for d in cast(Sequence[IntAttr], data)]
+        values = cast(Sequence[int], data)
+        int_type = i64 if isinstance(data_type, IndexType) else data_type
+        min_value, max_value = int_type.value_range()
+        for value in values:
+            if not (min_value <= value < max_value):
+                raise VerifyException(
+                    f"Value {value} does not fit in array<{data_type}>, which "
+                    f"supports values in the range [{min_value}, {max_value})"
+                )
+        return DenseArrayBase(data_type, _pack_dense_elements(data_type, values))
 
     @staticmethod
     def create_dense_float(
         data_type: AnyFloat, data: Sequence[int | float] | Sequence[FloatData]
     ) -> DenseArrayBase:
-        if len(data) and isinstance(data[0], int | float):
-            attr_list = [FloatData(float(d)) for d in cast(Sequence[int | float], data)]
-        else:
-            attr_list = cast(Sequence[FloatData], data)
-
-        return DenseArrayBase([data_type, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], FloatData):
+            data = [d.data for d in cast(Sequence[FloatData], data)]
+        return DenseArrayBase(data_type, struct.pack(f"<{len(data)}d", *data))
 
     @overload
     @staticmethod
@@ -995,14 +1024,18 @@ class DenseArrayBase(ParametrizedAttribute):
 
     def as_tuple(self) -> tuple[int, ...] | tuple[float, ...]:
         """
-        Get the "raw" data out as a tuple. This will not
-        apply the datatype restrictions that the array element
-        type would suggest!
+        Get the values of the elements as a tuple.
 
-        e.g. given a dense<i8: 99999999, 255, 256>, as_tuple()
-        would return 1234567, 255, 256 and not 135, 255, 0 (mod 256)
+        Signless integers are returned in their signed range, e.g. given an
+        array<i8: 255, -1>, as_tuple() would return (-1, -1).
+
+        The values are unpacked from the buffer in a single call, without creating
+        an attribute per element.
         """
-        return tuple(x.data for x in self.data.data)
+        if isinstance(self.elt_type, IntegerType | IndexType):
+            return _unpack_dense_elements(self.elt_type, self.data.data)
+        num_elements = len(self.data.data) // 8
+        return struct.unpack(f"<{num_elements}d", self.data.data)
 
 
 @irdl_attr_definition
@@ -1609,17 +1642,230 @@ RankedStructure: TypeAlias = (
 )
 
 
+class _PackedFloatFormat(NamedTuple):
+    """The binary layout of a floating-point type that `struct` cannot pack."""
+
+    exponent_bits: int
+    fraction_bits: int
+    explicit_integer_bit: bool
+    """Whether the integer bit of the significand is stored, as in x87 f80."""
+
+    @property
+    def size(self) -> int:
+        total_bits = 1 + self.exponent_bits + self.fraction_bits
+        return (total_bits + self.explicit_integer_bit + 7) // 8
+
+    def encode(self, value: float) -> int:
+        """Get the bits of the value, rounded to the nearest even representable value."""
+        sign = 1 if math.copysign(1.0, value) < 0 else 0
+        bias = (1 << (self.exponent_bits - 1)) - 1
+        max_exponent = (1 << self.exponent_bits) - 1
+        integer_bit = int(self.explicit_integer_bit) << self.fraction_bits
+        value = abs(value)
+        if math.isnan(value):
+            exponent, fraction = (
+                max_exponent,
+                integer_bit | 1 << (self.fraction_bits - 1),
+            )
+        elif math.isinf(value):
+            exponent, fraction = max_exponent, integer_bit
+        elif value == 0:
+            exponent, fraction = 0, 0
+        else:
+            # value = numerator / denominator, where the denominator is a power of two
+            numerator, denominator = value.as_integer_ratio()
+            unbiased = max(numerator.bit_length() - denominator.bit_length(), 1 - bias)
+            # Round the significand to `fraction_bits` bits after the binary point
+            shift = self.fraction_bits - unbiased
+            if shift >= 0:
+                significand, remainder = divmod(numerator << shift, denominator)
+            else:
+                significand, remainder = divmod(numerator, denominator << -shift)
+                denominator <<= -shift
+            if 2 * remainder > denominator or (
+                2 * remainder == denominator and significand & 1
+            ):
+                significand += 1
+            if significand >> (self.fraction_bits + 1):
+                significand >>= 1
+                unbiased += 1
+            if unbiased + bias >= max_exponent:
+                exponent, fraction = max_exponent, integer_bit
+            elif significand >> self.fraction_bits:
+                exponent = unbiased + bias
+                fraction = significand & ((1 << self.fraction_bits) - 1) | integer_bit
+            else:
+                # Subnormal
+                exponent, fraction = 0, significand
+        exponent_shift = self.fraction_bits + self.explicit_integer_bit
+        return (
+            sign << (exponent_shift + self.exponent_bits)
+            | exponent << exponent_shift
+            | fraction
+        )
+
+    def decode(self, bits: int) -> float:
+        """Get the value of the bits, rounded to the nearest Python float."""
+        exponent_shift = self.fraction_bits + self.explicit_integer_bit
+        sign = -1.0 if bits >> (exponent_shift + self.exponent_bits) else 1.0
+        exponent = bits >> exponent_shift & ((1 << self.exponent_bits) - 1)
+        fraction = bits & ((1 << self.fraction_bits) - 1)
+        bias = (1 << (self.exponent_bits - 1)) - 1
+        if exponent == (1 << self.exponent_bits) - 1:
+            return math.copysign(math.nan, sign) if fraction else sign * math.inf
+        if exponent == 0:
+            significand, unbiased = fraction, 1 - bias
+        else:
+            significand, unbiased = fraction | 1 << self.fraction_bits, exponent - bias
+        # Integer division and conversion round to the nearest float
+        shift = unbiased - self.fraction_bits
+        try:
+            if shift >= 0:
+                return sign * float(significand << shift)
+            return sign * (significand / (1 << -shift))
+        except OverflowError:
+            return sign * math.inf
+
+
+_PACKED_FLOAT_FORMATS: dict[type[Attribute], _PackedFloatFormat] = {
+    BFloat16Type: _PackedFloatFormat(8, 7, False),
+    Float80Type: _PackedFloatFormat(15, 63, True),
+    Float128Type: _PackedFloatFormat(15, 112, False),
+}
+
+
+def _get_dense_element_format(
+    element_type: IntegerType | IndexType | AnyFloat,
+) -> str | None:
+    """
+    Get the `struct` format character of an element of the given type, as stored in
+    packed dense buffers, or None if `struct` cannot pack it.
+    Integers are stored in the smallest standard width that holds them.
+    """
+    match element_type:
+        case IntegerType():
+            width = element_type.width.data
+            unsigned = element_type.signedness.data == Signedness.UNSIGNED
+            for max_width, format in ((8, "b"), (16, "h"), (32, "i"), (64, "q")):
+                if width <= max_width:
+                    return format.upper() if unsigned else format
+            return None
+        case IndexType():
+            return "q"
+        case Float16Type():
+            return "e"
+        case Float32Type():
+            return "f"
+        case Float64Type():
+            return "d"
+        case _:
+            return None
+
+
+def _get_dense_element_size(element_type: IntegerType | IndexType | AnyFloat) -> int:
+    """Get the size in bytes of an element of the given type in packed dense buffers."""
+    if (format := _get_dense_element_format(element_type)) is not None:
+        return struct.calcsize(format)
+    if isinstance(element_type, IntegerType):
+        return (element_type.width.data + 7) // 8
+    return _PACKED_FLOAT_FORMATS[type(element_type)].size
+
+
+def _pack_dense_elements(
+    element_type: IntegerType | IndexType | AnyFloat,
+    values: Sequence[int] | Sequence[float],
+) -> bytes:
+    """
+    Pack values in a little-endian buffer.
+    Integers wider than 64 bits are stored in two's complement with the least number
+    of bytes that holds their width, and bf16, f80 and f128 values in their IEEE
+    (or x87 for f80) binary layout.
+    Signless integers that do not fit in the signed storage range wrap around.
+    """
+    if (format := _get_dense_element_format(element_type)) is not None:
+        if format.islower() and not isinstance(element_type, AnyFloat):
+            signed_max = 1 << (struct.calcsize(format) * 8 - 1)
+            values = [
+                v - (signed_max << 1) if v >= signed_max else v
+                for v in cast(Sequence[int], values)
+            ]
+        return struct.pack(f"<{len(values)}{format}", *values)
+    size = _get_dense_element_size(element_type)
+    if isinstance(element_type, IntegerType):
+        mask = (1 << (8 * size)) - 1
+        return b"".join(
+            (value & mask).to_bytes(size, "little")
+            for value in cast(Sequence[int], values)
+        )
+    float_format = _PACKED_FLOAT_FORMATS[type(element_type)]
+    return b"".join(
+        float_format.encode(value).to_bytes(size, "little") for value in values
+    )
+
+
+def _unpack_dense_elements(
+    element_type: IntegerType | IndexType | AnyFloat, data: bytes
+) -> tuple[int, ...] | tuple[float, ...]:
+    """Unpack the values of a buffer packed by `_pack_dense_elements`."""
+    size = _get_dense_element_size(element_type)
+    if (format := _get_dense_element_format(element_type)) is not None:
+        return struct.unpack(f"<{len(data) // size}{format}", data)
+    chunks = (data[i : i + size] for i in range(0, len(data) - size + 1, size))
+    if isinstance(element_type, IntegerType):
+        signed = element_type.signedness.data != Signedness.UNSIGNED
+        return tuple(int.from_bytes(chunk, "little", signed=signed) for chunk in chunks)
+    float_format = _PACKED_FLOAT_FORMATS[type(element_type)]
+    return tuple(
+        float_format.decode(int.from_bytes(chunk, "little")) for chunk in chunks
+    )
+
+
 @irdl_attr_definition
 class DenseIntOrFPElementsAttr(
     ParametrizedAttribute, ContainerType[IntegerType | IndexType | AnyFloat]
 ):
+    """
+    An attribute containing a dense multidimensional array of integer or floating-point
+    values.
+
+    The elements are packed in a little-endian buffer, in row-major order, using the
+    storage layout of their element type: floats are stored in their IEEE format (x87
+    for f80), and integers in the smallest standard width that holds them, or with the
+    least number of bytes that holds them if they are wider than 64 bits.
+    Signless integers that do not fit in the signed storage range wrap around, as in
+    the hex form of dense literals.
+    """
+
     name = "dense"
     type: ParameterDef[
         RankedStructure[IntegerType]
         | RankedStructure[IndexType]
         | RankedStructure[AnyFloat]
     ]
-    data: ParameterDef[ArrayAttr[AnyIntegerAttr] | ArrayAttr[AnyFloatAttr]]
+    data: ParameterDef[BytesAttr]
+    """The packed elements."""
+
+    def __init__(
+        self,
+        type: (
+            RankedStructure[IntegerType]
+            | RankedStructure[IndexType]
+            | RankedStructure[AnyFloat]
+        ),
+        data: bytes | BytesAttr,
+    ):
+        if isinstance(data, bytes):
+            data = BytesAttr(data)
+        super().__init__([type, data])
+
+    def verify(self) -> None:
+        item_size = self._get_element_size()
+        if len(self.data.data) % item_size:
+            raise VerifyException(
+                f"Dense elements of type {self.get_element_type()} expect a buffer "
+                f"whose size is a multiple of {item_size} bytes, but got "
+                f"{len(self.data.data)} bytes"
+            )
 
     # The type stores the shape data
     def get_shape(self) -> tuple[int, ...] | None:
@@ -1630,6 +1876,14 @@ class DenseIntOrFPElementsAttr(
     def get_element_type(self) -> IntegerType | IndexType | AnyFloat:
         return self.type.get_element_type()
 
+    def _get_element_size(self) -> int:
+        """Get the size in bytes of a single element of the buffer."""
+        return _get_dense_element_size(self.get_element_type())
+
+    def get_num_elements(self) -> int:
+        """Get the number of elements stored in the buffer."""
+        return len(self.data.data) // self._get_element_size()
+
     @property
     def shape_is_complete(self) -> bool:
         shape = self.get_shape()
@@ -1644,51 +1898,120 @@ class DenseIntOrFPElementsAttr(
             n *= dim
 
         # Product of dimensions needs to equal length
-        return n == len(self.data.data)
+        return n == self.get_num_elements()
+
+    def iter_values(self) -> Iterator[int] | Iterator[float]:
+        """Iterate over the values of the elements, in row-major order."""
+        element_format = _get_dense_element_format(self.get_element_type())
+        if element_format is None:
+            return iter(self.get_values())
+        return (
+            value
+            for (value,) in struct.iter_unpack(f"<{element_format}", self.data.data)
+        )
+
+    def get_values(self) -> tuple[int, ...] | tuple[float, ...]:
+        """Get the values of the elements, in row-major order."""
+        return _unpack_dense_elements(self.get_element_type(), self.data.data)
+
+    def get_attrs(self) -> tuple[AnyIntegerAttr, ...] | tuple[AnyFloatAttr, ...]:
+        """
+        Get the elements as integer or float attributes, in row-major order.
+        Prefer `get_values` or `to_numpy` on large attributes, as this creates an
+        attribute per element.
+        """
+        element_type = self.get_element_type()
+        if isinstance(element_type, IntegerType | IndexType):
+            return tuple(
+                IntegerAttr(cast(int, value), element_type)
+                for value in self.iter_values()
+            )
+        return tuple(FloatAttr(value, element_type) for value in self.iter_values())
+
+    def is_splat(self) -> bool:
+        """Return if all the elements have the same value."""
+        buffer = self.data.data
+        item_size = self._get_element_size()
+        return buffer == buffer[:item_size] * (len(buffer) // item_size)
+
+    def to_numpy(self) -> npt.NDArray[Any]:
+        """
+        Get a read-only NumPy array of the elements, with the shape of the attribute
+        type, that shares the underlying buffer.
+        Elements that NumPy cannot represent, bf16, f80, f128 and integers wider than
+        64 bits, are copied to an array of Python floats or ints instead.
+        """
+        import numpy as np
+
+        element_type = self.get_element_type()
+        if (element_format := _get_dense_element_format(element_type)) is not None:
+            array = np.frombuffer(self.data.data, dtype=f"<{element_format}")
+        else:
+            dtype = object if isinstance(element_type, IntegerType) else np.float64
+            array = np.array(self.get_values(), dtype=dtype)
+            array.flags.writeable = False
+        if self.shape_is_complete:
+            shape = self.get_shape()
+            assert shape is not None
+            array = array.reshape(shape)
+        return array
+
+    @staticmethod
+    def _pack(
+        element_type: IntegerType | IndexType | AnyFloat,
+        values: Sequence[int] | Sequence[float],
+    ) -> bytes:
+        """Pack the given values in a buffer, according to their element type."""
+        if isinstance(element_type, IntegerType):
+            min_value, max_value = element_type.value_range()
+            for value in cast(Sequence[int], values):
+                if not (min_value <= value < max_value):
+                    raise VerifyException(
+                        f"Integer value {value} is out of range for type "
+                        f"{element_type} which supports values in the range "
+                        f"[{min_value}, {max_value})"
+                    )
+        return _pack_dense_elements(element_type, values)
 
     @staticmethod
     def create_dense_index(
         type: RankedStructure[IndexType],
         data: Sequence[int] | Sequence[IntegerAttr[IndexType]],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [
-                IntegerAttr.from_index_int_value(d) for d in cast(Sequence[int], data)
+        if len(data) and isinstance(data[0], IntegerAttr):
+            data = [
+                el.value.data for el in cast(Sequence[IntegerAttr[IndexType]], data)
             ]
-        else:
-            attr_list = cast(Sequence[IntegerAttr[IndexType]], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        values = cast(Sequence[int], data)
+        return DenseIntOrFPElementsAttr(
+            type, DenseIntOrFPElementsAttr._pack(type.element_type, values)
+        )
 
     @staticmethod
     def create_dense_int(
         type: RankedStructure[IntegerType],
         data: Sequence[int] | Sequence[IntegerAttr[IntegerType]],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int):
-            attr_list = [
-                IntegerAttr[IntegerType](d, type.element_type)
-                for d in cast(Sequence[int], data)
+        if len(data) and isinstance(data[0], IntegerAttr):
+            data = [
+                el.value.data for el in cast(Sequence[IntegerAttr[IntegerType]], data)
             ]
-        else:
-            attr_list = cast(Sequence[IntegerAttr[IntegerType]], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        values = cast(Sequence[int], data)
+        return DenseIntOrFPElementsAttr(
+            type, DenseIntOrFPElementsAttr._pack(type.element_type, values)
+        )
 
     @staticmethod
     def create_dense_float(
         type: RankedStructure[AnyFloat],
         data: Sequence[int | float] | Sequence[AnyFloatAttr],
     ) -> DenseIntOrFPElementsAttr:
-        if len(data) and isinstance(data[0], int | float):
-            attr_list = [
-                FloatAttr(float(d), type.element_type)
-                for d in cast(Sequence[int | float], data)
-            ]
-        else:
-            attr_list = cast(Sequence[AnyFloatAttr], data)
-
-        return DenseIntOrFPElementsAttr([type, ArrayAttr(attr_list)])
+        if len(data) and isinstance(data[0], FloatAttr):
+            data = [el.value.data for el in cast(Sequence[AnyFloatAttr], data)]
+        values = cast(Sequence[float], data)
+        return DenseIntOrFPElementsAttr(
+            type, DenseIntOrFPElementsAttr._pack(type.element_type, values)
+        )
 
     @overload
     @staticmethod
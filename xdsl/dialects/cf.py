@@ -173,10 +173,7 @@ class Switch(IRDLOperation):
                 "case_operand_segments is expected to be a DenseArrayBase of i32"
             )
 
-        def_sizes = cast(
-            tuple[int, ...],
-            tuple(size_attr.data for size_attr in self.case_operand_segments.data.data),
-        )
+        def_sizes = cast(tuple[int, ...], self.case_operand_segments.as_tuple())
 
         if sum(def_sizes) != len(self.case_operands):
             raise VerifyException(
@@ -240,9 +237,11 @@ class Switch(IRDLOperation):
             cases = [("default", self.default_block, self.default_operands)]
             if self.case_values:
                 cases = cases + [
-                    (str(c.value.data), block, operands)
+                    (str(c), block, operands)
                     for (c, block, operands) in zip(
-                        self.case_values.data.data, self.case_blocks, self.case_operand
+                        self.case_values.get_values(),
+                        self.case_blocks,
+                        self.case_operand,
                     )
                 ]
 
@@ -760,7 +760,7 @@ class TransposeOp(IRDLOperation):
                 f"Input rank ({input_rank}) does not match output rank ({init_rank})"
             )
         if (input_rank := len(input_shape)) != (
-            permutation_size := len(self.permutation.data)
+            permutation_size := len(self.permutation.as_tuple())
         ):
             raise VerifyException(
                 f"Input rank ({input_rank}) does not match size of permutation ({permutation_size})"
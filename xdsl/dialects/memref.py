@@ -14,6 +14,7 @@ from xdsl.dialects.builtin import (
     BoolAttr,
     DenseArrayBase,
     DenseIntOrFPElementsAttr,
+    DenseResourceAttr,
     IndexType,
     IntAttr,
     IntegerAttr,
@@ -421,7 +422,10 @@ class Global(IRDLOperation):
         if not isinstance(self.type, MemRefType):
             raise Exception("Global expects a MemRefType")
 
-        if not isinstance(self.initial_value, UnitAttr | DenseIntOrFPElementsAttr):
+        if not isinstance(
+            self.initial_value,
+            UnitAttr | DenseIntOrFPElementsAttr | DenseResourceAttr,
+        ):
             raise Exception(
                 "Global initial value is expected to be a "
                 "dense type or an unit attribute"
@@ -765,21 +769,21 @@ class Subview(IRDLOperation):
         print_dynamic_index_list(
             printer,
             self.offsets,
-            (cast(int, offset.data) for offset in self.static_offsets.data.data),
+            cast(tuple[int, ...], self.static_offsets.as_tuple()),
             dynamic_index=Subview.DYNAMIC_INDEX,
         )
         printer.print_string(" ")
         print_dynamic_index_list(
             printer,
             self.sizes,
-            (cast(int, size.data) for size in self.static_sizes.data.data),
+            cast(tuple[int, ...], self.static_sizes.as_tuple()),
             dynamic_index=Subview.DYNAMIC_INDEX,
         )
         printer.print_string(" ")
         print_dynamic_index_list(
             printer,
             self.strides,
-            (cast(int, stride.data) for stride in self.static_strides.data.data),
+            cast(tuple[int, ...], self.static_strides.as_tuple()),
             dynamic_index=Subview.DYNAMIC_INDEX,
         )
         printer.print_op_attributes(self.attributes, print_keyword=True)
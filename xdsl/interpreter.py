@@ -4,6 +4,7 @@ import platform
 from collections import Counter
 from collections.abc import Callable, Generator, Iterable
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import (
     IO,
     Any,
@@ -20,12 +21,15 @@ from xdsl.ir import (
     Attribute,
     AttributeInvT,
     Block,
+    BlockArgument,
     Operation,
     OperationInvT,
+    OpResult,
     Region,
     SSAValue,
     TypeAttribute,
 )
+from xdsl.resources import ResourceManager
 from xdsl.traits import CallableOpInterface, IsTerminator, SymbolOpInterface
 from xdsl.utils.exceptions import InterpretationError
 
@@ -550,6 +554,84 @@ class InterpreterContext:
         return "/".join(c.name for c in self.stack())
 
 
+_UNSET = object()
+"""The value of the registers of a compiled region that are not assigned yet."""
+
+
+@dataclass
+class _RegisterContext(InterpreterContext):
+    """
+    The scope of a compiled region, which holds the values of the region in a list of
+    registers, at slots computed when compiling the region.
+    The scope is reused each time the region is run, unless it is already running.
+    """
+
+    registers: list[Any] = field(default_factory=list)
+    slots: dict[SSAValue, int] = field(default_factory=dict)
+    region: Region | None = None
+
+    def __getitem__(self, key: SSAValue) -> Any:
+        if (slot := self.slots.get(key)) is not None:
+            if (value := self.registers[slot]) is not _UNSET:
+                return value
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: SSAValue, value: Any):
+        if (slot := self.slots.get(key)) is not None:
+            self.registers[slot] = value
+        else:
+            super().__setitem__(key, value)
+
+
+_Step: TypeAlias = Callable[[list[Any]], "TerminatorValue | None"]
+"""
+The compiled implementation of an operation, which reads its operands from and writes
+its results to the registers of its region, and returns its terminator value, if any.
+"""
+
+
+class _CompiledBlock(NamedTuple):
+    arg_slots: tuple[int, ...]
+    steps: tuple[_Step, ...]
+
+
+class _CapturedValue(NamedTuple):
+    """A value defined outside of a compiled region, and used in it."""
+
+    value: SSAValue
+    slot: int
+    """The slot of the value in the registers of the region."""
+    depth: int
+    """
+    The number of regions between the region and the region defining the value, or 0
+    if the value is not defined in an enclosing region.
+    """
+    outer_region: Region | None
+    outer_slot: int
+    """The slot of the value in the registers of the region defining it."""
+
+
+@dataclass
+class _CompiledRegion:
+    """A region translated to steps over a list of registers."""
+
+    region: Region
+    num_slots: int
+    slots: dict[SSAValue, int]
+    """The slot of each value used or defined by the operations of the region."""
+    captured: tuple[_CapturedValue, ...]
+    """The values defined outside the region, loaded when entering it."""
+    blocks: dict[Block, _CompiledBlock]
+    """The compiled blocks, starting with the entry block."""
+    listener: Interpreter.Listener
+    """
+    The listener notified by the steps, which are compiled without notifications if it
+    is the default listener.
+    """
+    scope: _RegisterContext | None = None
+    """The scope reused to run the region, or None if the region is running."""
+
+
 def _get_system_bitwidth() -> Literal[32, 64] | None:
     match platform.architecture()[0]:
         case "64bit":
@@ -602,6 +684,22 @@ class Interpreter:
     Runtime data associated with an interpreter functions implementation.
     """
     listener: Listener = field(default=Listener())
+    resources: ResourceManager = field(default_factory=ResourceManager)
+    """
+    The resource blobs referenced by the interpreted IR, such as the data of
+    `dense_resource` attributes.
+    """
+    compile_regions: bool = field(default=False)
+    """
+    Translate each region once, when it is first run, into a list of steps with
+    pre-bound implementations and operand and result slots, instead of looking them up
+    for every operation run.
+    The values of each region are held in a list of registers, reused for each run of
+    the region, and the values of enclosing regions are loaded from their registers.
+    The interpreted IR must not be modified once its regions are compiled.
+    """
+    _compiled_regions: dict[int, _CompiledRegion] = field(default_factory=dict)
+    """The compiled regions, by id of the region."""
 
     @property
     def symbol_table(self) -> dict[str, Operation]:
@@ -657,13 +755,17 @@ class Interpreter:
         set to True.
         """
         self._impls.register_from(impls, override=override)
+        self._compiled_regions.clear()
 
     def _run_op(self, op: Operation, inputs: PythonValues) -> OpImplResult:
         if (operands_count := len(op.operands)) != (inputs_count := len(inputs)):
             raise InterpretationError(
                 f"Number of operands ({operands_count}) doesn't match the number of inputs ({inputs_count})."
             )
-        self.listener.will_interpret_op(op, inputs)
+        # Only notify listeners that observe the interpretation
+        notify = type(self.listener) is not Interpreter.Listener
+        if notify:
+            self.listener.will_interpret_op(op, inputs)
         result = self._impls.run(self, op, inputs)
         if (results_count := len(op.results)) != (
             actual_result_count := len(result.values)
@@ -671,7 +773,8 @@ class Interpreter:
             raise InterpretationError(
                 f"Number of operation results ({results_count}) doesn't match the number of implementation results ({actual_result_count})."
             )
-        self.listener.did_interpret_op(op, result.values)
+        if notify:
+            self.listener.did_interpret_op(op, result.values)
         return result
 
     def run_op(self, op: Operation | str, inputs: PythonValues = ()) -> PythonValues:
@@ -705,6 +808,9 @@ class Interpreter:
         Creates a new scope, then executes the first block in the region. The first block
         is expected to return the results of the region directly.
         """
+        if self.compile_regions:
+            return self._run_compiled_region(region, args, name)
+
         results = ()
         if not region.blocks:
             return results
@@ -748,6 +854,215 @@ class Interpreter:
             self.pop_scope()
         return results
 
+    def _run_compiled_region(
+        self, region: Region, args: PythonValues, name: str
+    ) -> PythonValues:
+        compiled = self._get_compiled_region(region)
+        results = ()
+        if not compiled.blocks:
+            return results
+
+        parent = self._ctx
+        if (scope := compiled.scope) is not None:
+            # Reuse the scope of the previous run, such as the previous iteration
+            compiled.scope = None
+            scope.name = name
+            scope.parent = parent
+            if scope.env:
+                scope.env.clear()
+        else:
+            # The first run of the region, or it is already running, such as a
+            # recursive function
+            scope = _RegisterContext(
+                name,
+                parent,
+                registers=[_UNSET] * compiled.num_slots,
+                slots=compiled.slots,
+                region=region,
+            )
+        registers = scope.registers
+        for value, slot, depth, outer_region, outer_slot in compiled.captured:
+            # Load the value from the scope of the region defining it, if it is the
+            # scope `depth` levels up
+            outer = parent
+            for _ in range(depth - 1):
+                if outer is None:
+                    break
+                outer = outer.parent
+            if isinstance(outer, _RegisterContext) and outer.region is outer_region:
+                registers[slot] = outer.registers[outer_slot]
+            else:
+                registers[slot] = parent[value]
+        self._ctx = scope
+
+        block: _CompiledBlock | None = next(iter(compiled.blocks.values()))
+        while block is not None:
+            for slot, arg in zip(block.arg_slots, args):
+                registers[slot] = arg
+
+            terminator_value = None
+            for step in block.steps:
+                if (terminator_value := step(registers)) is not None:
+                    break
+
+            match terminator_value:
+                case ReturnedValues():
+                    results = terminator_value.values
+                    block = None
+                case Successor():
+                    block = compiled.blocks[terminator_value.block]
+                    args = terminator_value.args
+                case None:
+                    block = None
+
+        self._ctx = parent
+        scope.parent = None
+        compiled.scope = scope
+        return results
+
+    def _get_compiled_region(self, region: Region) -> _CompiledRegion:
+        compiled = self._compiled_regions.get(id(region))
+        if (
+            compiled is None
+            or compiled.region is not region
+            or compiled.listener is not self.listener
+        ):
+            compiled = self._compile_region(region)
+            self._compiled_regions[id(region)] = compiled
+        return compiled
+
+    @staticmethod
+    def _number_values(region: Region) -> dict[SSAValue, int]:
+        """Number the block arguments and operation results of the region."""
+        slots: dict[SSAValue, int] = {}
+        for block in region.blocks:
+            for arg in block.args:
+                slots[arg] = len(slots)
+            for op in block.ops:
+                for result in op.results:
+                    slots[result] = len(slots)
+        return slots
+
+    def _capture(self, region: Region, value: SSAValue, slot: int) -> _CapturedValue:
+        """
+        Find the enclosing region defining a value used in the region, and the slot of
+        the value in it.
+        """
+        match value:
+            case BlockArgument():
+                block = value.block
+            case OpResult():
+                block = value.op.parent_block()
+            case _:
+                block = None
+        outer_region = None if block is None else block.parent
+        depth = 0
+        ancestor: Region | None = region
+        while ancestor is not None and outer_region is not None:
+            if ancestor is outer_region:
+                outer_slots = self._number_values(outer_region)
+                return _CapturedValue(
+                    value, slot, depth, outer_region, outer_slots[value]
+                )
+            depth += 1
+            ancestor = ancestor.parent_region()
+        return _CapturedValue(value, slot, 0, None, 0)
+
+    def _compile_region(self, region: Region) -> _CompiledRegion:
+        """
+        Number the values of the region, and translate its operations to steps over
+        the registers of the region.
+        """
+        slots = self._number_values(region)
+
+        captured: list[_CapturedValue] = []
+        for block in region.blocks:
+            for op in block.ops:
+                for operand in op.operands:
+                    if operand not in slots:
+                        slots[operand] = len(slots)
+                        captured.append(self._capture(region, operand, len(slots) - 1))
+
+        blocks = {
+            block: _CompiledBlock(
+                tuple(slots[arg] for arg in block.args),
+                tuple(self._compile_op(op, slots) for op in block.ops),
+            )
+            for block in region.blocks
+        }
+        return _CompiledRegion(
+            region, len(slots), slots, tuple(captured), blocks, self.listener
+        )
+
+    def _compile_op(self, op: Operation, slots: dict[SSAValue, int]) -> _Step:
+        """
+        Translate an operation to a step with its implementation, and the slots of its
+        operands and results, bound ahead of time.
+        """
+        if type(op) not in self._impls._impl_dict:  # pyright: ignore[reportPrivateUsage]
+            # Only fail if the operation is run, as when interpreting it
+            def missing_impl(registers: list[Any]) -> TerminatorValue | None:
+                raise InterpretationError(
+                    f"Could not find interpretation function for op {op.name}"
+                )
+
+            return missing_impl
+
+        ft, impl = self._impls._impl_dict[type(op)]  # pyright: ignore[reportPrivateUsage]
+        interpreter = self
+
+        operand_slots = tuple(slots[operand] for operand in op.operands)
+        get_inputs: Callable[[list[Any]], PythonValues]
+        if len(operand_slots) > 1:
+            get_inputs = itemgetter(*operand_slots)
+        elif operand_slots:
+            (operand_slot,) = operand_slots
+
+            def get_input(registers: list[Any]) -> PythonValues:
+                return (registers[operand_slot],)
+
+            get_inputs = get_input
+        else:
+
+            def get_no_inputs(registers: list[Any]) -> PythonValues:
+                return ()
+
+            get_inputs = get_no_inputs
+
+        result_slots = tuple(slots[result] for result in op.results)
+        results_count = len(result_slots)
+
+        listener = self.listener
+        if type(listener) is Interpreter.Listener:
+            # The default listener does nothing, so there is nothing to notify
+
+            def step(registers: list[Any]) -> TerminatorValue | None:
+                result = impl(ft, interpreter, op, get_inputs(registers))
+                if len(values := result.values) != results_count:
+                    raise InterpretationError(
+                        f"Number of operation results ({results_count}) doesn't match the number of implementation results ({len(values)})."
+                    )
+                for slot, value in zip(result_slots, values):
+                    registers[slot] = value
+                return result.terminator_value
+
+            return step
+
+        def notifying_step(registers: list[Any]) -> TerminatorValue | None:
+            inputs = get_inputs(registers)
+            listener.will_interpret_op(op, inputs)
+            result = impl(ft, interpreter, op, inputs)
+            if len(values := result.values) != results_count:
+                raise InterpretationError(
+                    f"Number of operation results ({results_count}) doesn't match the number of implementation results ({len(values)})."
+                )
+            listener.did_interpret_op(op, values)
+            for slot, value in zip(result_slots, values):
+                registers[slot] = value
+            return result.terminator_value
+
+        return notifying_step
+
     def cast_value(self, o: Attribute, r: Attribute, value: Any) -> Any:
         """
         If the type of the operand and result are not the same, then look up the
@@ -2,7 +2,7 @@ from math import copysign, isnan
 from typing import cast
 
 from xdsl.dialects import arith
-from xdsl.dialects.builtin import AnyFloatAttr, AnyIntegerAttr
+from xdsl.dialects.builtin import AnyIntegerAttr, FloatAttr, IntegerAttr
 from xdsl.interpreter import (
     Interpreter,
     InterpreterFunctions,
@@ -10,9 +10,7 @@ from xdsl.interpreter import (
     impl,
     register_impls,
 )
-from xdsl.irdl import base
 from xdsl.utils.exceptions import InterpretationError
-from xdsl.utils.isattr import isattr
 
 
 @register_impls
@@ -23,7 +21,7 @@ class ArithFunctions(InterpreterFunctions):
     ) -> PythonValues:
         value = op.value
         interpreter.interpreter_assert(
-            isattr(op.value, base(AnyIntegerAttr) | base(AnyFloatAttr)),
+            isinstance(op.value, IntegerAttr | FloatAttr),
             f"arith.constant not implemented for {type(op.value)}",
         )
         value = cast(AnyIntegerAttr, op.value)
@@ -1,3 +1,4 @@
+from math import prod
 from typing import Any, Literal, cast
 
 from xdsl.dialects import builtin
@@ -19,6 +20,7 @@ from xdsl.interpreter import (
 from xdsl.interpreters import ptr
 from xdsl.interpreters.shaped_array import ShapedArray
 from xdsl.ir import Attribute
+from xdsl.utils.exceptions import InterpretationError
 from xdsl.utils.hints import isa
 
 
@@ -40,6 +42,38 @@ def xtype_for_el_type(
             raise NotImplementedError(f"Unknown format for element type {el_type}")
 
 
+def dense_resource_value(
+    interpreter: Interpreter, attr: builtin.DenseResourceAttr, *, copy: bool
+) -> ShapedArray[Any]:
+    """
+    Get the data of a `dense_resource` attribute, from the resource blobs of the
+    interpreter.
+    If `copy` is not set, the returned array is a read-only view on the blob data.
+    """
+    handle = attr.resource_handle.data
+    blob = interpreter.resources.get("builtin", handle)
+    if blob is None:
+        raise InterpretationError(f"Unknown dense resource '{handle}'")
+    type = attr.type
+    if not isinstance(type, builtin.ShapedType) or not isinstance(
+        type, builtin.ContainerType
+    ):
+        raise InterpretationError(
+            f"Expected a shaped type for dense resource '{handle}'"
+        )
+    shape = type.get_shape()
+    xtype = xtype_for_el_type(
+        cast(Attribute, type.get_element_type()), interpreter.index_bitwidth
+    )
+    data = blob.data
+    if len(data) != prod(shape) * xtype.size:
+        raise InterpretationError(
+            f"Dense resource '{handle}' of {len(data)} bytes does not match type {type}"
+        )
+    memory = bytearray(data) if copy else data
+    return ShapedArray(ptr.TypedPtr(ptr.RawPtr(memory), xtype=xtype), list(shape))
+
+
 @register_impls
 class BuiltinFunctions(InterpreterFunctions):
     @impl(UnrealizedConversionCastOp)
@@ -85,9 +119,11 @@ class BuiltinFunctions(InterpreterFunctions):
         attr: Attribute,
         type_attr: builtin.MemRefType[Any],
     ) -> ShapedArray[Any]:
+        if isinstance(attr, builtin.DenseResourceAttr):
+            return dense_resource_value(interpreter, attr, copy=False)
         assert isinstance(attr, builtin.DenseIntOrFPElementsAttr)
         shape = attr.get_shape()
-        data = [el.value.data for el in attr.data]
+        data = list(attr.get_values())
         data_ptr = ptr.TypedPtr[Any].new(
             data,
             xtype=xtype_for_el_type(
@@ -1,8 +1,10 @@
+from __future__ import annotations
+
 from itertools import product
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from xdsl.dialects import linalg
-from xdsl.dialects.builtin import TensorType
+from xdsl.dialects.builtin import DenseIntOrFPElementsAttr
 from xdsl.interpreter import (
     Interpreter,
     InterpreterFunctions,
@@ -14,6 +16,55 @@ from xdsl.interpreter import (
 )
 from xdsl.interpreters.shaped_array import ShapedArray
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+
+def _to_ndarrays(*arrays: ShapedArray[Any]) -> tuple[npt.NDArray[Any], ...] | None:
+    """
+    Get NumPy views of the arrays, or None if NumPy is not installed, in which case
+    the operations are computed element by element.
+    """
+    try:
+        return tuple(array.to_ndarray() for array in arrays)
+    except ImportError:
+        return None
+
+
+def _get_2d_values(attr: DenseIntOrFPElementsAttr) -> tuple[int, int]:
+    """
+    Get the values of the strides or dilations of a 2d operation, which may be a splat.
+    """
+    if attr.get_shape() != (2,):
+        raise NotImplementedError("Only 2d operations supported")
+    values = attr.get_values()
+    y, x = values * 2 if len(values) == 1 else values
+    return int(y), int(x)
+
+
+def _windows(
+    input: npt.NDArray[Any],
+    window_shape: tuple[int, int],
+    output_shape: tuple[int, int],
+    strides: tuple[int, int],
+    dilations: tuple[int, int],
+) -> npt.NDArray[Any]:
+    """
+    Get a view of the windows of the last two dimensions of an NCHW input, with shape
+    (N, C, output height, output width, window height, window width).
+    """
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    (ky, kx), (oy, ox), (sy, sx), (dy, dx) = (
+        window_shape,
+        output_shape,
+        strides,
+        dilations,
+    )
+    dilated_shape = ((ky - 1) * dy + 1, (kx - 1) * dx + 1)
+    windows = sliding_window_view(input, dilated_shape, axis=(2, 3))
+    return windows[:, :, : oy * sy : sy, : ox * sx : sx, ::dy, ::dx]
+
 
 @register_impls
 class LinalgFunctions(InterpreterFunctions):
@@ -39,6 +90,26 @@ class LinalgFunctions(InterpreterFunctions):
 
         loop_ranges = op.get_static_loop_ranges()
 
+        try:
+            from xdsl.interpreters.vectorized_generic import run_vectorized_generic
+        except ImportError:
+            # NumPy is not installed, interpret the body for each point instead
+            pass
+        else:
+            if run_vectorized_generic(
+                interpreter,
+                op.body,
+                args[:inputs_count],
+                outputs,
+                (None,) * len(outputs),
+                indexing_maps,
+                tuple(
+                    it.data != linalg.IteratorType.PARALLEL for it in op.iterator_types
+                ),
+                loop_ranges,
+            ):
+                return ()
+
         for indices in product(*(range(loop_range) for loop_range in loop_ranges)):
             loop_args = tuple(
                 (
@@ -74,11 +145,13 @@ class LinalgFunctions(InterpreterFunctions):
         lhs = cast(ShapedArray[float], lhs)
         rhs = cast(ShapedArray[float], rhs)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
         assert lhs.shape == rhs.shape == res.shape
-        for i in range(len(lhs.data)):
-            res.data_ptr[i] = lhs.data_ptr[i] + rhs.data_ptr[i]
+        if (views := _to_ndarrays(lhs, rhs, res)) is not None:
+            lhs_view, rhs_view, res_view = views
+            res_view[...] = lhs_view + rhs_view
+        else:
+            for index in res.indices():
+                res.store(index, lhs.load(index) + rhs.load(index))
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -88,14 +161,16 @@ class LinalgFunctions(InterpreterFunctions):
         self, interpreter: Interpreter, op: linalg.FillOp, args: tuple[Any, ...]
     ) -> tuple[Any, ...]:
         operand, res = args[0], args[1]
-        assert isinstance(operand, ShapedArray)
         assert isinstance(res, ShapedArray)
-        operand = cast(ShapedArray[float], operand)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
-        for i in range(len(res.data)):
-            res.data_ptr[i] = operand.data_ptr[0]
+        if isinstance(operand, ShapedArray):
+            operand = cast(ShapedArray[float], operand).data_ptr[0]
+        if (views := _to_ndarrays(res)) is not None:
+            (res_view,) = views
+            res_view[...] = operand
+        else:
+            for index in res.indices():
+                res.store(index, operand)
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -111,11 +186,13 @@ class LinalgFunctions(InterpreterFunctions):
         lhs = cast(ShapedArray[float], lhs)
         rhs = cast(ShapedArray[float], rhs)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
         assert lhs.shape == rhs.shape == res.shape
-        for i in range(len(lhs.data)):
-            res.data_ptr[i] = lhs.data_ptr[i] * rhs.data_ptr[i]
+        if (views := _to_ndarrays(lhs, rhs, res)) is not None:
+            lhs_view, rhs_view, res_view = views
+            res_view[...] = lhs_view * rhs_view
+        else:
+            for index in res.indices():
+                res.store(index, lhs.load(index) * rhs.load(index))
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -129,14 +206,15 @@ class LinalgFunctions(InterpreterFunctions):
         assert isinstance(res, ShapedArray)
         operand = cast(ShapedArray[float], operand)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
-        assert len(operand.shape) == 2
-        assert len(res.shape) == 2
-        rows, cols = operand.shape
-        for i in range(rows):
-            for j in range(cols):
-                res.data_ptr[j * rows + i] = operand.data_ptr[i * cols + j]
+        permutation = cast(tuple[int, ...], op.permutation.as_tuple())
+        transposed = operand.transpose(permutation)
+        assert transposed.shape == res.shape
+        if (views := _to_ndarrays(transposed, res)) is not None:
+            transposed_view, res_view = views
+            res_view[...] = transposed_view
+        else:
+            for index in res.indices():
+                res.store(index, transposed.load(index))
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -152,17 +230,19 @@ class LinalgFunctions(InterpreterFunctions):
         lhs = cast(ShapedArray[float], lhs)
         rhs = cast(ShapedArray[float], rhs)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
-        rows = lhs.shape[0]
+        rows, inner = lhs.shape
         cols = rhs.shape[1]
-        assert rows == cols
-        for i in range(rows):
-            for j in range(cols):
-                res.data_ptr[i * cols + j] = sum(
-                    lhs.data_ptr[i * lhs.shape[1] + k]
-                    * rhs.data_ptr[k * rhs.shape[1] + j]
-                    for k in range(lhs.shape[1])
+        assert rhs.shape[0] == inner
+        assert res.shape == [rows, cols]
+        if (views := _to_ndarrays(lhs, rhs, res)) is not None:
+            lhs_view, rhs_view, res_view = views
+            res_view += lhs_view @ rhs_view
+        else:
+            for i, j in res.indices():
+                res.store(
+                    (i, j),
+                    res.load((i, j))
+                    + sum(lhs.load((i, k)) * rhs.load((k, j)) for k in range(inner)),
                 )
 
         if len(op.results) > 0:
@@ -183,34 +263,31 @@ class LinalgFunctions(InterpreterFunctions):
         input = cast(ShapedArray[float], input)
         kernel_filter = cast(ShapedArray[float], kernel_filter)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
-        strides_type = op.strides.type
-        assert isinstance(strides_type, TensorType)
-        (strides_shape,) = strides_type.get_shape()
-        strides = tuple(value.value.data for value in op.strides.data)
-        if strides_shape != 2:
-            raise NotImplementedError("Only 2d max pooling supported")
-
-        m_height, m_width = input.shape[2:]
-        ky, kx = kernel_filter.shape[0], kernel_filter.shape[1]
-
-        # convert input into a numpy like array
-        input_data = [
-            [input.data[r * m_width + c] for c in range(m_width)]
-            for r in range(m_height)
-        ]
-
-        output: list[float] = []
-        for k in range(0, m_height - ky + 1, int(strides[0])):
-            for l in range(0, m_width - kx + 1, int(strides[0])):
-                block_max_value = float("-inf")
-                for i in range(k, k + ky):
-                    for j in range(l, l + kx):
-                        block_max_value = max(block_max_value, input_data[i][j])
-                output.append(block_max_value)
-        for i in range(len(output)):
-            res.data_ptr[i] = output[i]
+        sy, sx = _get_2d_values(op.strides)
+        dy, dx = _get_2d_values(op.dilations)
+        ky, kx = kernel_filter.shape
+
+        if (views := _to_ndarrays(input, res)) is not None:
+            import numpy as np
+
+            input_view, res_view = views
+            windows = _windows(
+                input_view, (ky, kx), (res.shape[2], res.shape[3]), (sy, sx), (dy, dx)
+            )
+            np.maximum(res_view, windows.max(axis=(4, 5)), out=res_view)
+        else:
+            for n, c, y, x in res.indices():
+                res.store(
+                    (n, c, y, x),
+                    max(
+                        res.load((n, c, y, x)),
+                        *(
+                            input.load((n, c, y * sy + i * dy, x * sx + j * dx))
+                            for i in range(ky)
+                            for j in range(kx)
+                        ),
+                    ),
+                )
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -229,34 +306,29 @@ class LinalgFunctions(InterpreterFunctions):
         input = cast(ShapedArray[float], input)
         kernel_filter = cast(ShapedArray[float], kernel_filter)
         res = cast(ShapedArray[float], res)
-        if not all(res.data_ptr[i] == 0.0 for i in range(len(res.data))):
-            raise NotImplementedError()
-        m_height, m_width = input.shape[2:]
-        ky, kx = kernel_filter.shape[2], kernel_filter.shape[3]
-        strides = tuple(value.value.data for value in op.strides.data)
-        # convert input into a numpy like array
-        input_data = [
-            [input.data[r * m_width + c] for c in range(m_width)]
-            for r in range(m_height)
-        ]
-        # convert kernel into a numpy like array
-        kernel_data = [
-            [
-                kernel_filter.data[r * kernel_filter.shape[3] + c]
-                for c in range(kernel_filter.shape[3])
-            ]
-            for r in range(kernel_filter.shape[2])
-        ]
-        output: list[float] = []
-        for k in range(0, m_height - ky + 1, int(strides[0])):
-            for l in range(0, m_width - kx + 1, int(strides[0])):
-                conv_value: float = 0.0
-                for i in range(k, k + ky):
-                    for j in range(l, l + kx):
-                        conv_value += input_data[i][j] * kernel_data[i - k][j - l]
-                output.append(conv_value)
-        for i in range(len(output)):
-            res.data_ptr[i] = output[i]
+        sy, sx = _get_2d_values(op.strides)
+        dy, dx = _get_2d_values(op.dilations)
+        _, channels, ky, kx = kernel_filter.shape
+
+        if (views := _to_ndarrays(input, kernel_filter, res)) is not None:
+            import numpy as np
+
+            input_view, kernel_view, res_view = views
+            windows = _windows(
+                input_view, (ky, kx), (res.shape[2], res.shape[3]), (sy, sx), (dy, dx)
+            )
+            res_view += np.einsum("ncyxij,fcij->nfyx", windows, kernel_view)
+        else:
+            for n, f, y, x in res.indices():
+                res.store(
+                    (n, f, y, x),
+                    res.load((n, f, y, x))
+                    + sum(
+                        input.load((n, c, y * sy + i * dy, x * sx + j * dx))
+                        * kernel_filter.load((f, c, i, j))
+                        for c, i, j in product(range(channels), range(ky), range(kx))
+                    ),
+                )
         if len(op.results) > 0:
             return (res,)
         return ()
@@ -9,7 +9,7 @@ from xdsl.interpreter import (
     impl,
     register_impls,
 )
-from xdsl.interpreters.builtin import xtype_for_el_type
+from xdsl.interpreters.builtin import dense_resource_value, xtype_for_el_type
 from xdsl.interpreters.ptr import TypedPtr
 from xdsl.interpreters.shaped_array import ShapedArray
 from xdsl.ir import Attribute
@@ -72,11 +72,18 @@ class MemrefFunctions(InterpreterFunctions):
         mem = SymbolTable.lookup_symbol(op, op.name_)
         assert isinstance(mem, memref.Global)
         initial_value = mem.initial_value
+        if isinstance(initial_value, builtin.DenseResourceAttr):
+            # Constant globals share the blob data instead of copying it
+            return (
+                dense_resource_value(
+                    interpreter, initial_value, copy=mem.constant is None
+                ),
+            )
         if not isinstance(initial_value, builtin.DenseIntOrFPElementsAttr):
             raise NotImplementedError(
                 "Memrefs that are not dense int or float arrays are not implemented"
             )
-        data = [el.value.data for el in initial_value.data]
+        data = list(initial_value.get_values())
         shape = initial_value.get_shape()
         assert shape is not None
         xtype = xtype_for_el_type(
@@ -84,3 +91,36 @@ class MemrefFunctions(InterpreterFunctions):
         )
         shaped_array = ShapedArray(TypedPtr[Any].new(data, xtype=xtype), list(shape))
         return (shaped_array,)
+
+    @impl(memref.Subview)
+    def run_subview(
+        self, interpreter: Interpreter, op: memref.Subview, args: PythonValues
+    ) -> PythonValues:
+        source = cast(ShapedArray[Any], args[0])
+        # The dynamic offsets, sizes, and strides, in this order
+        dynamic_values = iter(args[1:])
+        offsets, sizes, strides = (
+            [
+                next(dynamic_values) if value == memref.Subview.DYNAMIC_INDEX else value
+                for value in cast(tuple[int, ...], attr.as_tuple())
+            ]
+            for attr in (op.static_offsets, op.static_sizes, op.static_strides)
+        )
+        # The subview shares the memory of the source
+        subview = source.subview(offsets, sizes, strides)
+
+        result_type = cast(memref.MemRefType[Attribute], op.result.type)
+        rank = len(result_type.get_shape())
+        if rank != len(sizes):
+            # Rank-reducing subviews drop dimensions of size 1, any of which can be
+            # dropped as they only have one element
+            dropped = [i for i, size in enumerate(sizes) if size == 1]
+            dropped = dropped[: len(sizes) - rank]
+            subview = ShapedArray(
+                subview.data_ptr,
+                [d for i, d in enumerate(subview.shape) if i not in dropped],
+                strides=[
+                    s for i, s in enumerate(subview.get_strides()) if i not in dropped
+                ],
+            )
+        return (subview,)
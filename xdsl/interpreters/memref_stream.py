@@ -12,6 +12,7 @@ from xdsl.interpreter import (
     register_impls,
 )
 from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.ir.affine import AffineMap
 
 
 @register_impls
@@ -45,6 +46,33 @@ class MemrefStreamFunctions(InterpreterFunctions):
         for index, init in zip(op.init_indices, init_values, strict=True):
             inits[index.data] = init
 
+        try:
+            from xdsl.interpreters.vectorized_generic import run_vectorized_generic
+        except ImportError:
+            # NumPy is not installed, interpret the body for each point instead
+            pass
+        else:
+            bounds = outer_ubs + inner_ubs
+            if run_vectorized_generic(
+                interpreter,
+                op.body,
+                args[:inputs_count],
+                outputs,
+                inits,
+                indexing_maps[:inputs_count]
+                # The outputs of imperfect nests are only indexed by the outer loops
+                + tuple(
+                    AffineMap(len(bounds), m.num_symbols, m.results)
+                    for m in output_indexing_maps
+                ),
+                tuple(
+                    it.data == memref_stream.IteratorType.REDUCTION
+                    for it in op.iterator_types
+                ),
+                bounds,
+            ):
+                return ()
+
         if inner_ubs:
             inputs: tuple[ShapedArray[float] | float, ...] = args[:inputs_count]
             input_indexing_maps = indexing_maps[:inputs_count]
@@ -33,8 +33,6 @@ class MLProgramFunctions(InterpreterFunctions):
         xtype = xtype_for_el_type(
             global_value.get_element_type(), interpreter.index_bitwidth
         )
-        data = TypedPtr[Any].new(
-            [el.value.data for el in global_value.data], xtype=xtype
-        )
+        data = TypedPtr[Any].new(list(global_value.get_values()), xtype=xtype)
         shaped_array = ShapedArray(data, list(shape))
         return (shaped_array,)
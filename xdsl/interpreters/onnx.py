@@ -2,6 +2,7 @@ from typing import Any, cast
 
 import numpy as np
 import numpy.typing as npt
+from numpy.lib.stride_tricks import sliding_window_view
 
 from xdsl.dialects import onnx
 from xdsl.dialects.builtin import TensorType
@@ -24,7 +25,7 @@ def to_dtype(
     match xtype.format:
         case "<i":
             return np.int32
-        case "<I":
+        case "<q":
             return np.int64
         case "<f":
             return np.float32
@@ -41,9 +42,9 @@ def from_dtype(
         return ptr.float32
     elif dtype == np.float64:
         return ptr.float64
-    elif dtype == np.float32:
+    elif dtype == np.int32:
         return ptr.int32
-    elif dtype == np.float64:
+    elif dtype == np.int64:
         return ptr.int64
     else:
         raise NotImplementedError()
@@ -52,10 +53,7 @@ def from_dtype(
 def to_ndarray(
     shaped_array: ShapedArray[int] | ShapedArray[float],
 ) -> npt.NDArray[np.float32 | np.float64 | np.int32 | np.int64]:
-    dtype = to_dtype(shaped_array.data_ptr.xtype)
-    flat = np.frombuffer(shaped_array.data_ptr.raw.memory, dtype)
-    shaped = flat.reshape(shaped_array.shape)
-    return shaped
+    return shaped_array.to_ndarray()
 
 
 def from_ndarray(
@@ -63,7 +61,7 @@ def from_ndarray(
 ) -> ShapedArray[float] | ShapedArray[int]:
     return ShapedArray(
         ptr.TypedPtr(
-            ptr.RawPtr(bytearray(ndarray.data)),
+            ptr.RawPtr(bytearray(np.ascontiguousarray(ndarray))),
             xtype=from_dtype(np.dtype(ndarray.dtype)),
         ),
         list(ndarray.shape),
@@ -138,7 +136,7 @@ class OnnxFunctions(InterpreterFunctions):
         if op.value is None:
             raise NotImplementedError("Only dense constant values implemented")
         shape = op.value.get_shape()
-        data = [el.value.data for el in op.value.data]
+        data = list(op.value.get_values())
         data_ptr = ptr.TypedPtr[Any].new(
             data,
             xtype=xtype_for_el_type(
@@ -270,24 +268,15 @@ class OnnxFunctions(InterpreterFunctions):
         out_height = int((m_height - kernel.shape[2]) // strides[0] + 1)
         out_width = int((m_width - kernel.shape[3]) // strides[1] + 1)
 
-        output = np.zeros(
-            (matrix.shape[0], matrix.shape[1], out_height, out_width),
-            dtype=matrix.dtype,
-        )
-
-        # do convolution
-        for k in range(matrix.shape[0]):
-            for l in range(matrix.shape[1]):
-                for i in range(0, m_height - kernel.shape[2] + 1, strides[0]):
-                    for j in range(0, m_width - kernel.shape[3] + 1, strides[1]):
-                        output[k, l, i // strides[0], j // strides[1]] = np.sum(
-                            padded_matrix[
-                                k, l, i : i + kernel.shape[2], j : j + kernel.shape[3]
-                            ]
-                            * kernel[k, l]
-                        )
+        # do convolution, over views of the windows of the input
+        windows = sliding_window_view(padded_matrix, kernel.shape[2:], axis=(2, 3))[
+            :, :, :: strides[0], :: strides[1]
+        ]
+        assert windows.shape[2:4] == (out_height, out_width)
+        output = np.einsum("ncyxij,mcij->nmyx", windows, kernel)
 
-        output += to_ndarray(bias)
+        # the bias has one value per output channel
+        output += to_ndarray(bias).reshape(-1, 1, 1)
 
         # the number of channels is not always fixed to one
         result_type = op.res.type
@@ -385,19 +374,12 @@ class OnnxFunctions(InterpreterFunctions):
         out_height = int((m_height - ky) // strides[0] + 1)
         out_width = int((m_width - kx) // strides[1] + 1)
 
-        result = np.zeros(
-            (matrix.shape[0], matrix.shape[1], out_height, out_width),
-            dtype=matrix.dtype,
-        )
-
-        # do maxpool computation
-        for k in range(matrix.shape[0]):
-            for l in range(matrix.shape[1]):
-                for i in range(0, m_height - ky + 1, strides[0]):
-                    for j in range(0, m_width - kx + 1, strides[1]):
-                        result[k, l, i // strides[0], j // strides[1]] = np.nanmax(
-                            padded_matrix[k, l, i : i + ky, j : j + kx]
-                        )
+        # do maxpool computation, over views of the windows of the input
+        windows = sliding_window_view(padded_matrix, (ky, kx), axis=(2, 3))[
+            :, :, :: strides[0], :: strides[1]
+        ]
+        assert windows.shape[2:4] == (out_height, out_width)
+        result = np.nanmax(windows, axis=(4, 5))
 
         # Numpy has two types of ndarray: ndarray and NDArray, weirdly they don't seem
         # to be compatible, despite one being a typealias for the other...
@@ -0,0 +1,286 @@
+"""
+A listener measuring the wall time spent interpreting operations.
+
+The time is aggregated along the stacks of operations being interpreted, such as an
+`scf.for` for the operations of its body. When the operations being run are in
+another function than their parent, such as when calling a function with `func.call`,
+a frame named after the symbol of the function is inserted in the stack.
+
+The stacks can be exported as collapsed stacks for flame graphs, or as speedscope or
+Chrome trace JSON files.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from time import perf_counter_ns
+from typing import Any, NamedTuple
+
+from xdsl.interpreter import Interpreter, PythonValues
+from xdsl.ir import Block, Operation
+from xdsl.traits import CallableOpInterface, SymbolOpInterface
+
+
+@dataclass
+class ProfileNode:
+    """The time spent in a stack of frames, and in the stacks extending it."""
+
+    name: str
+    count: int = 0
+    """The number of times the frame was entered."""
+    total_ns: int = 0
+    """The time spent in the frame, including the time spent in its children."""
+    children: dict[str, ProfileNode] = field(default_factory=dict)
+
+    @property
+    def self_ns(self) -> int:
+        """The time spent in the frame, excluding the time spent in its children."""
+        return self.total_ns - sum(child.total_ns for child in self.children.values())
+
+    def child(self, name: str) -> ProfileNode:
+        if (node := self.children.get(name)) is None:
+            node = self.children[name] = ProfileNode(name)
+        return node
+
+    def walk(
+        self, stack: tuple[str, ...] = ()
+    ) -> Iterator[tuple[tuple[str, ...], ProfileNode]]:
+        """Iterate over the descendants of the node, with their stacks, in pre-order."""
+        for child in self.children.values():
+            child_stack = (*stack, child.name)
+            yield child_stack, child
+            yield from child.walk(child_stack)
+
+
+@dataclass
+class ProfileStats:
+    """The time spent in the frames with the same name."""
+
+    count: int = 0
+    inclusive_ns: int = 0
+    """
+    The time spent in the frames, including their children, counting recursive frames
+    once.
+    """
+    exclusive_ns: int = 0
+    """The time spent in the frames, excluding their children."""
+
+
+@dataclass
+class _Frame:
+    node: ProfileNode
+    function: str | None
+    """The symbol of the function of the frame."""
+    op: Operation | None
+    """The operation being interpreted, or None for the frame of a function."""
+    start_ns: int = 0
+    children_ns: int = 0
+
+
+class _BlockInfo(NamedTuple):
+    function: str | None
+    """The symbol of the function of the block."""
+    ancestors: frozenset[Operation]
+    """The operations the block is nested in, up to its function."""
+
+
+_NO_BLOCK_INFO = _BlockInfo(None, frozenset())
+
+
+@dataclass
+class ProfilingListener(Interpreter.Listener):
+    """
+    Measures the time spent interpreting each operation, and aggregates it per
+    operation name, per function, and per stack of frames.
+    """
+
+    clock: Callable[[], int] = field(default=perf_counter_ns)
+    """The clock measuring time, in nanoseconds."""
+    root: ProfileNode = field(default_factory=lambda: ProfileNode("root"))
+    """The root of the tree of stacks of frames."""
+    ops: dict[str, ProfileStats] = field(default_factory=dict)
+    """The time spent in the operations, by name."""
+    functions: dict[str, ProfileStats] = field(default_factory=dict)
+    """The time spent in the operations of functions, by symbol."""
+    _stack: list[_Frame] = field(default_factory=list)
+    _active: Counter[str] = field(default_factory=Counter)
+    """The number of frames on the stack, by name, to count recursive frames once."""
+    _blocks: dict[Block, _BlockInfo] = field(default_factory=dict)
+
+    def _block_info(self, block: Block) -> _BlockInfo:
+        if (info := self._blocks.get(block)) is None:
+            function = None
+            ancestors: set[Operation] = set()
+            parent = block.parent_op()
+            while parent is not None:
+                ancestors.add(parent)
+                if parent.has_trait(CallableOpInterface) and (
+                    symbol := parent.get_trait(SymbolOpInterface)
+                ):
+                    if (name := symbol.get_sym_attr_name(parent)) is not None:
+                        function = name.data
+                    break
+                parent = parent.parent_op()
+            info = self._blocks[block] = _BlockInfo(function, frozenset(ancestors))
+        return info
+
+    def will_interpret_op(self, op: Operation, args: PythonValues) -> None:
+        block = op.parent_block()
+        info = _NO_BLOCK_INFO if block is None else self._block_info(block)
+        function = info.function
+        parent = self._stack[-1] if self._stack else None
+        parent_node = self.root if parent is None else parent.node
+        if function is not None and (
+            parent is None
+            or (parent.op is not None and parent.op not in info.ancestors)
+        ):
+            # Entering a function, such as the callee of the parent operation
+            name = f"@{function}"
+            parent_node = parent_node.child(name)
+            parent_node.count += 1
+            self._stack.append(_Frame(parent_node, function, None))
+            self.functions.setdefault(function, ProfileStats()).count += 1
+            self._active[name] += 1
+
+        node = parent_node.child(op.name)
+        node.count += 1
+        self.ops.setdefault(op.name, ProfileStats()).count += 1
+        self._active[op.name] += 1
+        frame = _Frame(node, function, op)
+        self._stack.append(frame)
+        # Start the clock last, to not measure the bookkeeping
+        frame.start_ns = self.clock()
+
+    def did_interpret_op(self, op: Operation, results: PythonValues) -> None:
+        end_ns = self.clock()
+        # Leave the functions entered by the operation
+        while (frame := self._stack.pop()).op is not op:
+            self._leave_function(frame)
+
+        elapsed_ns = end_ns - frame.start_ns
+        frame.node.total_ns += elapsed_ns
+        self_ns = elapsed_ns - frame.children_ns
+        stats = self.ops[op.name]
+        stats.exclusive_ns += self_ns
+        self._active[op.name] -= 1
+        if not self._active[op.name]:
+            stats.inclusive_ns += elapsed_ns
+        if frame.function is not None:
+            self.functions[frame.function].exclusive_ns += self_ns
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent.children_ns += elapsed_ns
+            if parent.op is None:
+                # The time of a function is the time of its operations
+                parent.node.total_ns += elapsed_ns
+                assert parent.function is not None
+                if self._active[parent.node.name] == 1:
+                    self.functions[parent.function].inclusive_ns += elapsed_ns
+
+    def _leave_function(self, frame: _Frame) -> None:
+        self._active[frame.node.name] -= 1
+        if self._stack:
+            self._stack[-1].children_ns += frame.children_ns
+
+    def to_collapsed_stacks(self) -> str:
+        """
+        Get the exclusive time of each stack, in nanoseconds, in the collapsed stack
+        format of flame graph tools, with one `frame;frame;frame time` line per stack.
+        """
+        return "".join(
+            f"{';'.join(stack)} {node.self_ns}\n"
+            for stack, node in self.root.walk()
+            if node.self_ns > 0
+        )
+
+    def to_speedscope(self, name: str = "xdsl") -> dict[str, Any]:
+        """
+        Get a speedscope profile, with the stacks as samples weighted by their
+        exclusive time.
+        """
+        frames: list[dict[str, str]] = []
+        frame_indices: dict[str, int] = {}
+        samples: list[list[int]] = []
+        weights: list[int] = []
+        for stack, node in self.root.walk():
+            if node.self_ns <= 0:
+                continue
+            sample: list[int] = []
+            for frame in stack:
+                if (index := frame_indices.get(frame)) is None:
+                    index = frame_indices[frame] = len(frames)
+                    frames.append({"name": frame})
+                sample.append(index)
+            samples.append(sample)
+            weights.append(node.self_ns)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "exporter": "xdsl",
+            "name": name,
+            "shared": {"frames": frames},
+            "profiles": [
+                {
+                    "type": "sampled",
+                    "name": name,
+                    "unit": "nanoseconds",
+                    "startValue": 0,
+                    "endValue": sum(weights),
+                    "samples": samples,
+                    "weights": weights,
+                }
+            ],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """
+        Get a Chrome trace, with an event per stack, laid out one after the other as
+        the aggregated time of the stacks, rather than as the timeline of the run.
+        """
+        events: list[dict[str, Any]] = []
+
+        def add_events(node: ProfileNode, start_ns: int):
+            events.append(
+                {
+                    "name": node.name,
+                    "ph": "X",
+                    "ts": start_ns / 1000,
+                    "dur": node.total_ns / 1000,
+                    "pid": 0,
+                    "tid": 0,
+                    "args": {"count": node.count},
+                }
+            )
+            for child in node.children.values():
+                add_events(child, start_ns)
+                start_ns += child.total_ns
+
+        start_ns = 0
+        for child in self.root.children.values():
+            add_events(child, start_ns)
+            start_ns += child.total_ns
+        return {"traceEvents": events, "displayTimeUnit": "ns"}
+
+    def summary(self, limit: int = 20) -> str:
+        """
+        Get tables of the operations and functions with the most exclusive time, with
+        times in milliseconds.
+        """
+        lines: list[str] = []
+        for title, stats in (("operation", self.ops), ("function", self.functions)):
+            if not stats:
+                continue
+            width = max(len(title), *(len(name) for name in stats))
+            lines.append(
+                f"{title:<{width}}  {'count':>10}  {'inclusive':>12}  {'exclusive':>12}"
+            )
+            ranked = sorted(stats.items(), key=lambda item: -item[1].exclusive_ns)
+            for name, stat in ranked[:limit]:
+                lines.append(
+                    f"{name:<{width}}  {stat.count:>10}  "
+                    f"{stat.inclusive_ns / 1e6:>12.3f}  {stat.exclusive_ns / 1e6:>12.3f}"
+                )
+            lines.append("")
+        return "\n".join(lines)
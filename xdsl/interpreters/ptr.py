@@ -4,6 +4,7 @@ import itertools
 import struct
 from collections.abc import Iterator, Sequence
 from dataclasses import KW_ONLY, dataclass, field
+from functools import cached_property
 from typing import Generic, Literal, TypeVar, final
 
 from typing_extensions import Self
@@ -18,7 +19,11 @@ class RawPtr:
     Data structure to help simulate pointers into memory.
     """
 
-    memory: bytearray
+    memory: bytearray | memoryview
+    """
+    The underlying buffer, a memoryview when it is shared with another owner, such as a
+    resource blob. Read-only memoryviews can be loaded from but not stored to.
+    """
     offset: int = field(default=0)
 
     @property
@@ -80,9 +85,16 @@ class XType(Generic[_TCov]):
     https://docs.python.org/3/library/struct.html
     """
 
+    @cached_property
+    def packer(self) -> struct.Struct:
+        """
+        The compiled format, to pack and unpack values.
+        """
+        return struct.Struct(self.format)
+
     @property
     def size(self) -> int:
-        return struct.calcsize(self.format)
+        return self.packer.size
 
 
 int32 = XType(int, "<i")
@@ -129,12 +141,20 @@ class TypedPtr(Generic[_T]):
         return list(itertools.islice(self.get_iter(), count))
 
     def __getitem__(self, index: int) -> _T:
-        raw_at_offset = self.raw + index * self.size
-        return struct.unpack(self.format, raw_at_offset.memoryview[: self.size])[0]
+        packer = self.xtype.packer
+        raw = self.raw
+        offset = raw.offset + index * packer.size
+        if offset < 0:
+            raise IndexError("Negative offset into memory")
+        return packer.unpack_from(raw.memory, offset)[0]
 
     def __setitem__(self, index: int, value: _T):
-        raw_at_offset = self.raw + index * self.size
-        struct.pack_into(self.format, raw_at_offset.memory, raw_at_offset.offset, value)
+        packer = self.xtype.packer
+        raw = self.raw
+        offset = raw.offset + index * packer.size
+        if offset < 0:
+            raise IndexError("Negative offset into memory")
+        packer.pack_into(raw.memory, offset, value)
 
     @staticmethod
     def zeros(count: int, *, xtype: XType[_T]) -> TypedPtr[_T]:
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import operator
 from collections.abc import Iterable, Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from itertools import accumulate, product
 from math import prod
-from typing import Generic, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 from typing_extensions import Self
 
 from xdsl.dialects.builtin import ShapedType
 from xdsl.interpreters.ptr import TypedPtr
 
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
 _T = TypeVar("_T")
 
 
@@ -24,6 +27,18 @@ class ShapedArray(Generic[_T]):
 
     _data: TypedPtr[_T]
     shape: list[int]
+    strides: list[int] | None = field(default=None, kw_only=True)
+    """
+    For each dimension, the number of elements between consecutive elements in memory,
+    or None if the elements are contiguous in row-major order.
+    Arrays with strides are views into the memory of another array, such as subviews.
+    """
+
+    def __post_init__(self):
+        if self.strides is not None:
+            # Arrays with contiguous elements are stored without strides
+            if tuple(self.strides) == ShapedType.strides_for_shape(self.shape):
+                self.strides = None
 
     @property
     def size(self) -> int:
@@ -31,26 +46,46 @@ class ShapedArray(Generic[_T]):
 
     @property
     def data(self) -> list[_T]:
-        return self._data.get_list(self.size)
+        if self.strides is None:
+            return self._data.get_list(self.size)
+        return [self.load(index) for index in self.indices()]
 
     @property
     def data_ptr(self) -> TypedPtr[_T]:
+        """
+        The pointer to the first element, the other elements are not contiguous if the
+        array has strides.
+        """
         return self._data
 
+    def get_strides(self) -> Sequence[int]:
+        """
+        For each dimension, the number of elements between consecutive elements in
+        memory.
+        """
+        if self.strides is None:
+            return ShapedType.strides_for_shape(self.shape)
+        return self.strides
+
     def copy(self) -> Self:
-        return type(self)(self._data.copy(), self.shape.copy())
+        if self.strides is None:
+            return type(self)(self._data.copy(), self.shape.copy())
+        return type(self)(
+            TypedPtr.new(self.data, xtype=self._data.xtype), self.shape.copy()
+        )
 
     def with_shape(self, new_shape: Sequence[int]) -> Self:
-        return type(self)(self._data.copy(), list(new_shape))
+        return type(self)(self.copy()._data, list(new_shape))
 
     def offset(self, index: Sequence[int]) -> int:
         """
-        Returns the index of the element in `self.data` for a given tuple of indices
+        Returns the offset of the element in memory, in elements from `self.data_ptr`,
+        for a given tuple of indices
         """
         if len(index) != len(self.shape):
             raise ValueError(f"Invalid indices {index} for shape {self.shape}")
         # For each dimension, the number of elements in the nested arrays
-        strides = ShapedType.strides_for_shape(self.shape)
+        strides = self.get_strides()
         offset = sum(i * stride for i, stride in zip(index, strides, strict=True))
         return offset
 
@@ -72,31 +107,84 @@ class ShapedArray(Generic[_T]):
         """
         yield from product(*(range(dim) for dim in self.shape))
 
-    def transposed(self, dim0: int, dim1: int) -> Self:
+    def transpose(self, permutation: Sequence[int]) -> Self:
         """
-        Returns a new ShapedArray, with the dimensions `dim0` and `dim1` transposed.
+        Returns a view of this array, with dimension `i` of the view being dimension
+        `permutation[i]` of this array.
         """
-        new_shape = list(self.shape)
-        new_shape[dim0], new_shape[dim1] = new_shape[dim1], new_shape[dim0]
-        old_list = self.data
-        new_data = type(self.data_ptr).new(old_list, xtype=self.data_ptr.xtype)
-
-        result = type(self)(new_data, new_shape)
+        if sorted(permutation) != list(range(len(self.shape))):
+            raise ValueError(
+                f"Invalid permutation {permutation} for shape {self.shape}"
+            )
+        strides = self.get_strides()
+        return type(self)(
+            self._data,
+            [self.shape[dim] for dim in permutation],
+            strides=[strides[dim] for dim in permutation],
+        )
+
+    def subview(
+        self, offsets: Sequence[int], sizes: Sequence[int], strides: Sequence[int]
+    ) -> Self:
+        """
+        Returns a view of the elements of this array starting at `offsets`, with `sizes`
+        elements in each dimension, taking every `strides` element.
+        """
+        if not len(offsets) == len(sizes) == len(strides) == len(self.shape):
+            raise ValueError(
+                f"Invalid subview {offsets}, {sizes}, {strides} for shape {self.shape}"
+            )
+        if any(
+            size and (offset < 0 or offset + (size - 1) * stride >= dim)
+            for offset, size, stride, dim in zip(offsets, sizes, strides, self.shape)
+        ):
+            raise ValueError(
+                f"Subview {offsets}, {sizes}, {strides} out of bounds of shape "
+                f"{self.shape}"
+            )
+        data = TypedPtr(
+            self._data.raw + self.offset(offsets) * self._data.size,
+            xtype=self._data.xtype,
+        )
+        return type(self)(
+            data,
+            list(sizes),
+            strides=[
+                stride * outer
+                for stride, outer in zip(strides, self.get_strides(), strict=True)
+            ],
+        )
+
+    def to_ndarray(self) -> npt.NDArray[Any]:
+        """
+        Returns a NumPy array sharing the memory of this array, which is read-only if
+        the memory is.
+        Requires NumPy to be installed.
+        """
+        import numpy as np
 
-        for source_index in self.indices():
-            dest_index = list(source_index)
-            dest_index[dim0], dest_index[dim1] = source_index[dim1], source_index[dim0]
-            result.store(tuple(dest_index), self.load(source_index))
+        dtype = np.dtype(self._data.format)
+        return np.ndarray(
+            self.shape,
+            dtype=dtype,
+            buffer=self._data.raw.memory,
+            offset=self._data.raw.offset,
+            strides=[stride * dtype.itemsize for stride in self.get_strides()],
+        )
 
-        return result
+    def transposed(self, dim0: int, dim1: int) -> Self:
+        """
+        Returns a new ShapedArray, with the dimensions `dim0` and `dim1` transposed.
+        """
+        permutation = list(range(len(self.shape)))
+        permutation[dim0], permutation[dim1] = dim1, dim0
+        return self.transpose(permutation).copy()
 
     def __format__(self, __format_spec: str) -> str:
         prod_dims: list[int] = list(accumulate(reversed(self.shape), operator.mul))
-        size = prod_dims[-1]
         result = "[" * len(self.shape)
 
-        for i in range(size):
-            d = self._data[i]
+        for i, d in enumerate(self.data):
             if i:
                 n = sum(not i % p for p in prod_dims)
                 result += "]" * n
@@ -0,0 +1,288 @@
+"""
+Vectorized interpretation of generic operations, such as `linalg.generic` and
+`memref_stream.generic`, using NumPy.
+
+Instead of running the body of the operation for each point of the iteration space,
+the operands are viewed as arrays over the whole iteration space, and the body is
+evaluated once, elementwise over these arrays. Outputs that are not indexed by some
+iteration dimensions are reductions, which must be yielded as the combination of the
+output with a value, such as `arith.addf %acc, %x`.
+
+Bodies with operations that are not supported are not vectorized, and the caller is
+expected to fall back to interpreting the body for each point.
+
+Integers are computed as 64-bit values. Integer outputs narrower than 64 bits are not
+vectorized, as storing an out-of-range value fails in the scalar path but would wrap
+around silently here. Results of 64-bit integer outputs wrap around on overflow.
+"""
+
+from collections.abc import Callable, Sequence
+from typing import Any, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from xdsl.dialects import arith
+from xdsl.dialects.builtin import FloatAttr, IntegerAttr
+from xdsl.interpreter import Interpreter
+from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.ir import Block, BlockArgument, Operation, Region, SSAValue
+from xdsl.ir.affine import AffineDimExpr, AffineMap
+
+
+def _minimumf(lhs: Any, rhs: Any) -> Any:
+    # -0.0 is less than 0.0, which `np.minimum` does not guarantee
+    both_zero = (lhs == 0) & (rhs == 0)
+    signed_zero = np.where(np.signbit(lhs) | np.signbit(rhs), -0.0, 0.0)
+    return np.where(both_zero, signed_zero, np.minimum(lhs, rhs))
+
+
+def _maximumf(lhs: Any, rhs: Any) -> Any:
+    # 0.0 is greater than -0.0, which `np.maximum` does not guarantee
+    both_zero = (lhs == 0) & (rhs == 0)
+    signed_zero = np.where(np.signbit(lhs) & np.signbit(rhs), -0.0, 0.0)
+    return np.where(both_zero, signed_zero, np.maximum(lhs, rhs))
+
+
+_ELEMENTWISE_FUNCTIONS: dict[type[Operation], Callable[..., Any]] = {
+    arith.Addi: np.add,
+    arith.Subi: np.subtract,
+    arith.Muli: np.multiply,
+    arith.Addf: np.add,
+    arith.Subf: np.subtract,
+    arith.Mulf: np.multiply,
+    arith.Minimumf: _minimumf,
+    arith.Maximumf: _maximumf,
+}
+"""The functions computing the results of operations over arrays."""
+
+_CMPI_FUNCTIONS: tuple[np.ufunc, ...] = (
+    np.equal,
+    np.not_equal,
+    np.less,
+    np.less_equal,
+    np.greater,
+    np.greater_equal,
+    np.less,
+    np.less_equal,
+    np.greater,
+    np.greater_equal,
+)
+"""The function of each `arith.cmpi` predicate, compared as in the interpreter."""
+
+_REDUCTION_FUNCTIONS: dict[type[Operation], np.ufunc] = {
+    arith.Addi: np.add,
+    arith.Muli: np.multiply,
+    arith.Addf: np.add,
+    arith.Mulf: np.multiply,
+}
+"""The functions that can combine an output with the reduction of a value."""
+
+
+def _promote(array: npt.NDArray[Any]) -> npt.NDArray[Any]:
+    """
+    Compute with 64-bit values, as the interpreter computes with Python floats and ints,
+    which are only rounded when stored.
+    """
+    if array.dtype.kind == "f":
+        return array.astype(np.float64, copy=False)
+    if array.dtype.kind in "iu":
+        return array.astype(np.int64, copy=False)
+    return array
+
+
+def _projected_dims(indexing_map: AffineMap) -> tuple[int, ...] | None:
+    """
+    Get the iteration dimension of each result of the map, if each result is a distinct
+    dimension.
+    """
+    dims = tuple(
+        expr.position
+        for expr in indexing_map.results
+        if isinstance(expr, AffineDimExpr)
+    )
+    if len(dims) != len(indexing_map.results) or len(set(dims)) != len(dims):
+        return None
+    return dims
+
+
+def _iteration_view(
+    array: npt.NDArray[Any], dims: tuple[int, ...], num_dims: int
+) -> npt.NDArray[Any]:
+    """
+    Get a view of an array indexed by the distinct iteration dimensions `dims`, with one
+    axis per iteration dimension, of size 1 for the dimensions not in `dims`.
+    """
+    # Order the axes of the array as the iteration dimensions
+    axes = sorted(range(len(dims)), key=lambda axis: dims[axis])
+    missing = tuple(dim for dim in range(num_dims) if dim not in dims)
+    return np.expand_dims(np.transpose(array, axes), missing)
+
+
+def _gather(
+    array: npt.NDArray[Any], indexing_map: AffineMap, bounds: Sequence[int]
+) -> npt.NDArray[Any]:
+    """
+    Get the values of an array at each point of the iteration space, with one axis per
+    iteration dimension, of size 1 for the dimensions that are not used by the map.
+    """
+    if (dims := _projected_dims(indexing_map)) is not None:
+        return _iteration_view(array, dims, len(bounds))
+
+    # Each index is broadcast over the iteration dimensions it depends on
+    grid = np.ogrid[tuple(slice(bound) for bound in bounds)]
+    return np.asarray(array[indexing_map.eval(grid, ())])
+
+
+def _get_reduction(
+    block: Block, output_arg: BlockArgument, yielded: SSAValue
+) -> tuple[Operation, SSAValue] | None:
+    """
+    Get the operation combining the output with a value, and that value, if `yielded`
+    is such a combination, and the output is only used by it.
+    """
+    if not isinstance(combine := yielded.owner, Operation):
+        return None
+    if combine.parent_block() is not block or len(combine.operands) != 2:
+        return None
+    if type(combine) not in _REDUCTION_FUNCTIONS:
+        return None
+    if len(output_arg.uses) != 1 or len(combine.results[0].uses) != 1:
+        return None
+    lhs, rhs = combine.operands
+    if lhs is output_arg:
+        return combine, rhs
+    if rhs is output_arg:
+        return combine, lhs
+    return None
+
+
+def run_vectorized_generic(
+    interpreter: Interpreter,
+    body: Region,
+    inputs: Sequence[Any],
+    outputs: Sequence[ShapedArray[Any]],
+    inits: Sequence[int | float | None],
+    indexing_maps: Sequence[AffineMap],
+    reduction_dims: Sequence[bool],
+    bounds: Sequence[int],
+) -> bool:
+    """
+    Run a generic operation by evaluating its body elementwise over whole arrays.
+    Return False, without modifying the outputs, if the operation cannot be vectorized.
+
+    The indexing maps of the outputs must only use iteration dimensions that are not
+    reduction dimensions, and may have fewer dimensions than the iteration space when
+    it is an imperfect loop nest.
+    Each output is initialized with the corresponding init value, if it is not None.
+    """
+    # The listener would not be notified of the operations in the body
+    if type(interpreter.listener) is not Interpreter.Listener:
+        return False
+
+    block = body.block
+    if block.last_op is None:
+        return False
+    yielded = block.last_op.operands
+    num_dims = len(bounds)
+    num_inputs = len(inputs)
+    input_args = block.args[:num_inputs]
+    output_args = block.args[num_inputs:]
+    if len(yielded) != len(outputs) or len(output_args) != len(outputs):
+        return False
+
+    # Check that the outputs can be written to, as views over the iteration space
+    output_views: list[npt.NDArray[Any]] = []
+    for output, indexing_map in zip(outputs, indexing_maps[num_inputs:], strict=True):
+        output_array = output.to_ndarray()
+        dims = _projected_dims(indexing_map)
+        if not output_array.flags.writeable or dims is None:
+            return False
+        if output_array.dtype.kind in "iu" and output_array.dtype.itemsize < 8:
+            return False
+        # Outputs must be written once per point of the non-reduction dimensions
+        if sorted(dims) != [d for d in range(num_dims) if not reduction_dims[d]]:
+            return False
+        output_views.append(_iteration_view(output_array, dims, num_dims))
+
+    # Check that the outputs are only used to be reduced, if there are reductions
+    reductions: list[tuple[Operation, SSAValue] | None] = [None] * len(outputs)
+    if any(reduction_dims):
+        for i, (output_arg, value) in enumerate(zip(output_args, yielded, strict=True)):
+            if (reduction := _get_reduction(block, output_arg, value)) is None:
+                return False
+            reductions[i] = reduction
+    reduction_ops = {reduction[0] for reduction in reductions if reduction is not None}
+
+    # Check that all operations in the body are supported, before evaluating them
+    for op in block.ops:
+        if op is block.last_op or op in reduction_ops:
+            continue
+        if isinstance(op, arith.Constant):
+            if not isinstance(op.value, IntegerAttr | FloatAttr):
+                return False
+        elif not isinstance(op, arith.Cmpi) and type(op) not in _ELEMENTWISE_FUNCTIONS:
+            return False
+
+    values: dict[SSAValue, Any] = {}
+    for arg, value, indexing_map in zip(
+        input_args, inputs, indexing_maps[:num_inputs], strict=True
+    ):
+        if isinstance(value, ShapedArray):
+            array = cast(ShapedArray[Any], value).to_ndarray()
+            values[arg] = _gather(_promote(array), indexing_map, bounds)
+        elif isinstance(value, int | float):
+            values[arg] = value
+        else:
+            return False
+    for arg, view, init, reduction in zip(
+        output_args, output_views, inits, reductions, strict=True
+    ):
+        if reduction is None and arg.uses:
+            # Copy, as the outputs are written while the values may still be used
+            values[arg] = _promote(view).copy() if init is None else init
+
+    # Values defined outside of the body are the same at each point
+    for op in block.ops:
+        for operand in op.operands:
+            owner = operand.owner
+            parent = owner if isinstance(owner, Block) else owner.parent_block()
+            if parent is block or operand in values:
+                continue
+            (outer,) = interpreter.get_values((operand,))
+            if not isinstance(outer, int | float):
+                return False
+            values[operand] = outer
+
+    for op in block.ops:
+        if op is block.last_op or op in reduction_ops:
+            continue
+        operands = [values[operand] for operand in op.operands]
+        if isinstance(op, arith.Constant):
+            result = op.value.value.data  # pyright: ignore[reportAttributeAccessIssue]
+        elif isinstance(op, arith.Cmpi):
+            predicate = op.predicate.value.data
+            if not 0 <= predicate < len(_CMPI_FUNCTIONS):
+                return False
+            result = _CMPI_FUNCTIONS[predicate](*operands)
+        else:
+            result = _ELEMENTWISE_FUNCTIONS[type(op)](*operands)
+        values[op.results[0]] = result
+
+    reduction_axes = tuple(d for d in range(num_dims) if reduction_dims[d])
+    results: list[Any] = []
+    for value, view, init, reduction in zip(
+        yielded, output_views, inits, reductions, strict=True
+    ):
+        if reduction is None:
+            results.append(values[value])
+            continue
+        combine, reduced_value = reduction
+        ufunc = _REDUCTION_FUNCTIONS[type(combine)]
+        full = np.broadcast_to(values[reduced_value], bounds)
+        reduced = ufunc.reduce(full, axis=reduction_axes, keepdims=True)
+        results.append(ufunc(_promote(view) if init is None else init, reduced))
+
+    for view, result in zip(output_views, results, strict=True):
+        view[...] = result
+    return True
@@ -28,13 +28,19 @@ from typing import (
     overload,
 )
 
-from typing_extensions import Self, deprecated
+from typing_extensions import Self
 
 from xdsl.traits import IsTerminator, NoTerminator, OpTrait, OpTraitInvT
 from xdsl.utils import lexer
 from xdsl.utils.exceptions import VerifyException
 from xdsl.utils.str_enum import StrEnum
 
+if TYPE_CHECKING:
+    from typing_extensions import deprecated
+else:
+    # `typing_extensions.deprecated` imports asyncio, which is slow to import
+    from xdsl.utils.deprecation import deprecated
+
 # Used for cyclic dependencies in type hints
 if TYPE_CHECKING:
     from xdsl.irdl import ParamAttrDef
@@ -600,6 +606,36 @@ class ParametrizedAttribute(Attribute):
         attr_def.verify(self)
         super()._verify()
 
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        other = cast(ParametrizedAttribute, other)
+        # Attributes with different cached hashes cannot be equal
+        if (
+            (self_hash := self.__dict__.get("_hash")) is not None
+            and (other_hash := other.__dict__.get("_hash")) is not None
+            and self_hash != other_hash
+        ):
+            return False
+        return self.parameters == other.parameters
+
+    def __hash__(self) -> int:
+        # Attributes are immutable, so their hash is only computed once
+        try:
+            return self.__dict__["_hash"]
+        except KeyError:
+            attr_hash = hash((self.parameters,))
+            object.__setattr__(self, "_hash", attr_hash)
+            return attr_hash
+
+    def __getstate__(self) -> dict[str, Any]:
+        # String hashes are salted per process, so the cached hash is not pickled
+        state = self.__dict__.copy()
+        state.pop("_hash", None)
+        return state
+
 
 class TypedAttribute(ParametrizedAttribute, Generic[AttributeCovT], ABC):
     """
@@ -239,8 +239,10 @@ def irdl_param_attr_definition(cls: type[_PAttrT]) -> type[_PAttrT]:
 
     cls = cast(type[_PAttrT], cls)
 
+    # Equality and hashing are inherited from ParametrizedAttribute, which caches the
+    # hash of the attribute
     return runtime_final(
-        dataclass(frozen=True, init=False)(
+        dataclass(frozen=True, init=False, eq=False)(
             type.__new__(
                 type(cls), cls.__name__, (cls,), {**cls.__dict__, **new_fields}
             )
@@ -101,7 +101,8 @@ class FormatLexer(Lexer):
         if current_char in ("`", "$", "\\", "^"):
             self._consume_chars()
             return self._form_token(Token.Kind.BARE_IDENT, start_pos)
-        return super().lex()
+        # The fast path of the MLIR lexer does not allow `-` in bare identifiers
+        return self._lex_char_by_char()
 
     # Authorize `-` in bare identifier
     bare_identifier_suffix_regex = re.compile(r"[a-zA-Z0-9_$.\-]*")
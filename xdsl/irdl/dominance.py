@@ -1,14 +1,48 @@
-from xdsl.ir import Block, Region
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from typing_extensions import deprecated
+
+from xdsl.ir import Block, BlockArgument, Operation, Region, SSAValue
+
+if TYPE_CHECKING:
+    from xdsl.pattern_rewriter import PatternRewriterListener
+
+
+def _block_successors(block: Block) -> Sequence[Block]:
+    """Get the successors of a block in the control-flow graph."""
+    if (last_op := block.last_op) is None:
+        return ()
+    return last_op.successors
 
 
 class DominanceInfo:
     """
     Computes and exposes the dominance relation amongst blocks of a region.
 
+    The dominator tree is computed with the Cooper-Harvey-Kennedy algorithm, and its
+    nodes are numbered in DFS pre- and post-order, so that dominance queries take
+    constant time.
+    Blocks that are not reachable from the entry block are only dominated by
+    themselves.
+
     https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332
+    https://www.cs.tufts.edu/comp/150FP/archive/keith-cooper/dom14.pdf
+    """
+
+    _idom: dict[Block, Block | None]
     """
+    The immediate dominator of each reachable block, `None` for the roots of the tree.
+    """
+
+    _pre_order: dict[Block, int]
+    """The index of each reachable block in a pre-order walk of the dominator tree."""
 
-    _dominance: dict[Block, set[Block]]
+    _post_order: dict[Block, int]
+    """The index of each reachable block in a post-order walk of the dominator tree."""
 
     def __init__(self, region: Region):
         """
@@ -16,46 +50,118 @@ class DominanceInfo:
 
         https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332
         """
-
-        self._dominance = {}
-
         # No block, no work
-        if not (region.blocks):
+        if not region.blocks:
+            self._compute([], _block_successors)
             return
+        self._compute([region.blocks[0]], _block_successors)
 
-        # Build the preceding relationship
-        pred: dict[Block, set[Block]] = {}
-        for b in region.blocks:
-            pred[b] = set()
-        for b in region.blocks:
-            if b.last_op is not None:
-                for s in b.last_op.successors:
-                    pred[s].add(b)
+    def _compute(
+        self, roots: Sequence[Block], successors: Callable[[Block], Iterable[Block]]
+    ):
+        """
+        Compute the dominator tree of the graph defined by `successors`, starting from
+        `roots`.
+        The roots are all considered immediately dominated by a virtual root node.
+        """
+        # Number the reachable blocks in post-order
+        post_order: list[Block] = []
+        indices: dict[Block, int] = {}
+        visited: set[Block] = set()
+        for root in roots:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(successors(root)))]
+            while stack:
+                block, succs = stack[-1]
+                for succ in succs:
+                    if succ not in visited:
+                        visited.add(succ)
+                        stack.append((succ, iter(successors(succ))))
+                        break
+                else:
+                    stack.pop()
+                    indices[block] = len(post_order)
+                    post_order.append(block)
 
-        # Get entry and other blocks
-        entry, *blocks = region.blocks
+        # Compute the predecessors of each reachable block
+        preds: list[list[int]] = [[] for _ in post_order]
+        for index, block in enumerate(post_order):
+            for succ in successors(block):
+                preds[indices[succ]].append(index)
+        root_indices = {indices[root] for root in roots}
 
-        # The entry block is only dominated by itself
-        self._dominance[entry] = {entry}
+        # Iterate in reverse post-order until the immediate dominators converge.
+        # The virtual root is numbered after all blocks, and `-1` marks blocks whose
+        # immediate dominator was not computed yet.
+        virtual_root = len(post_order)
+        idoms = [-1] * len(post_order)
+        for index in root_indices:
+            idoms[index] = virtual_root
 
-        # Instantiate other blocks dominators to all blocks
-        for b in blocks:
-            self._dominance[b] = set(region.blocks)
+        def intersect(a: int, b: int) -> int:
+            while a != b:
+                while a < b:
+                    a = idoms[a]
+                while b < a:
+                    b = idoms[b]
+            return a
 
-        # Iteratively filter out dominators until it converges
         changed = True
         while changed:
             changed = False
-            for b in blocks:
-                old = self._dominance[b].copy()
-                self._dominance[b] = {b} | (
-                    set[Block].intersection(*(self._dominance[p] for p in pred[b]))
-                    if pred[b]
-                    else set()
-                )
-                if old != self._dominance[b]:
+            for index in reversed(range(len(post_order))):
+                if index in root_indices:
+                    continue
+                new_idom = -1
+                for pred in preds[index]:
+                    if idoms[pred] == -1:
+                        continue
+                    new_idom = pred if new_idom == -1 else intersect(pred, new_idom)
+                if new_idom != idoms[index]:
+                    idoms[index] = new_idom
                     changed = True
 
+        self._idom = {}
+        children: dict[Block | None, list[Block]] = {None: []}
+        for block in reversed(post_order):
+            children[block] = []
+        for index in reversed(range(len(post_order))):
+            idom = idoms[index]
+            block = post_order[index]
+            parent = None if idom == virtual_root else post_order[idom]
+            self._idom[block] = parent
+            children[parent].append(block)
+
+        # Number the dominator tree nodes in pre- and post-order
+        self._pre_order = {}
+        self._post_order = {}
+        tree_stack: list[tuple[Block | None, Iterator[Block]]] = [
+            (None, iter(children[None]))
+        ]
+        while tree_stack:
+            node, node_children = tree_stack[-1]
+            for child in node_children:
+                self._pre_order[child] = len(self._pre_order)
+                tree_stack.append((child, iter(children[child])))
+                break
+            else:
+                tree_stack.pop()
+                if node is not None:
+                    self._post_order[node] = len(self._post_order)
+
+    def is_reachable(self, block: Block) -> bool:
+        """Return if `block` is reachable from a root of the dominator tree."""
+        return block in self._idom
+
+    def immediate_dominator(self, block: Block) -> Block | None:
+        """
+        Return the immediate dominator of `block`, or `None` if `block` is a root of
+        the dominator tree or is unreachable.
+        """
+        return self._idom.get(block)
+
     def strictly_dominates(self, a: Block, b: Block) -> bool:
         """
         Return if `a` *strictly* dominates `b`.
@@ -69,7 +175,190 @@ class DominanceInfo:
         """
         Return if `a` dominates `b`.
         """
-        return a in self._dominance[b]
+        if a is b:
+            return True
+        pre_a = self._pre_order.get(a)
+        pre_b = self._pre_order.get(b)
+        if pre_a is None or pre_b is None:
+            return False
+        return pre_a <= pre_b and self._post_order[b] <= self._post_order[a]
+
+
+class PostDominanceInfo(DominanceInfo):
+    """
+    Computes and exposes the post-dominance relation amongst blocks of a region.
+
+    The exit blocks of the region, i.e. the blocks without successors, are the roots
+    of the post-dominator tree. Blocks from which no exit block is reachable are only
+    post-dominated by themselves.
+    """
+
+    def __init__(self, region: Region):
+        preds: dict[Block, list[Block]] = {block: [] for block in region.blocks}
+        for block in region.blocks:
+            for succ in _block_successors(block):
+                preds[succ].append(block)
+        exits = [block for block in region.blocks if not _block_successors(block)]
+        self._compute(exits, preds.__getitem__)
+
+
+@dataclass(eq=False)
+class Dominance:
+    """
+    Answers dominance queries between blocks, operations and values, possibly nested
+    in different regions.
+
+    The dominator tree of each region is computed on the first query, and cached until
+    it is invalidated, either explicitly with `invalidate`, or by the rewriter events
+    forwarded by the listener returned by `get_listener`.
+    """
+
+    post: bool = field(default=False)
+    """Compute post-dominance instead of dominance."""
+
+    _region_infos: dict[int, tuple[Region, DominanceInfo]] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The cached dominance information of each region, indexed by the region id, as
+    regions are not hashable.
+    """
+
+    _op_indices: dict[Block, dict[Operation, int]] = field(
+        default_factory=dict, init=False
+    )
+    """The cached index of each operation in its block."""
+
+    def get_info(self, region: Region) -> DominanceInfo:
+        """Get the dominance information of the blocks of a region."""
+        entry = self._region_infos.get(id(region))
+        if entry is not None:
+            return entry[1]
+        info = PostDominanceInfo(region) if self.post else DominanceInfo(region)
+        self._region_infos[id(region)] = (region, info)
+        return info
+
+    def invalidate(self, region: Region | None = None) -> None:
+        """
+        Invalidate the cached information of a region, or of all regions if `region`
+        is `None`.
+        """
+        if region is None:
+            self._region_infos.clear()
+            self._op_indices.clear()
+            return
+        self._region_infos.pop(id(region), None)
+        for block in region.blocks:
+            self._op_indices.pop(block, None)
+
+    def _op_index(self, op: Operation, block: Block) -> int:
+        """Get the index of an operation in its parent block."""
+        indices = self._op_indices.get(block)
+        if indices is None or op not in indices:
+            indices = {o: i for i, o in enumerate(block.ops)}
+            self._op_indices[block] = indices
+        return indices[op]
+
+    def _get_ancestor_in_region(
+        self, op: Operation, region: Region
+    ) -> Operation | None:
+        """Get the ancestor of `op` (or `op` itself) that is directly in `region`."""
+        ancestor: Operation | None = op
+        while ancestor is not None and ancestor.parent_region() is not region:
+            ancestor = ancestor.parent_op()
+        return ancestor
+
+    def block_dominates(self, a: Block, b: Block) -> bool:
+        """
+        Return if block `a` dominates block `b`, or the block of an operation that
+        contains `b`.
+        """
+        if (region := a.parent) is None:
+            return a is b
+        while b.parent is not region:
+            if (parent_op := b.parent_op()) is None or (
+                parent_block := parent_op.parent_block()
+            ) is None:
+                return False
+            b = parent_block
+        return self.get_info(region).dominates(a, b)
+
+    def properly_dominates(
+        self, a: Operation, b: Operation, *, enclosing_op_ok: bool = True
+    ) -> bool:
+        """
+        Return if operation `a` properly dominates operation `b`, i.e. if it dominates
+        `b` and is not `b`.
+        If `enclosing_op_ok` is set, an operation properly dominates all the operations
+        nested in its regions.
+        """
+        if a is b:
+            return False
+        if (block_a := a.parent_block()) is None or (region := block_a.parent) is None:
+            return False
+        ancestor = self._get_ancestor_in_region(b, region)
+        if ancestor is None:
+            return False
+        if ancestor is a:
+            return enclosing_op_ok
+        block_b = ancestor.parent_block()
+        assert block_b is not None
+        if block_a is block_b:
+            index_a = self._op_index(a, block_a)
+            index_b = self._op_index(ancestor, block_b)
+            return index_a > index_b if self.post else index_a < index_b
+        return self.get_info(region).strictly_dominates(block_a, block_b)
+
+    def dominates(self, a: Operation, b: Operation) -> bool:
+        """Return if operation `a` dominates operation `b`."""
+        return a is b or self.properly_dominates(a, b)
+
+    def value_properly_dominates(self, value: SSAValue, op: Operation) -> bool:
+        """
+        Return if the definition of `value` properly dominates `op`, i.e. if `value`
+        can be used by `op`.
+        """
+        if isinstance(value, BlockArgument):
+            if (block := op.parent_block()) is None:
+                return False
+            return self.block_dominates(value.block, block)
+        assert isinstance(value.owner, Operation)
+        return self.properly_dominates(value.owner, op, enclosing_op_ok=False)
+
+    def value_dominates(self, value: SSAValue, op: Operation) -> bool:
+        """Return if the definition of `value` dominates `op`."""
+        return value.owner is op or self.value_properly_dominates(value, op)
+
+    def _handle_operation_change(self, op: Operation) -> None:
+        """Invalidate the information that a change to `op` may affect."""
+        if (block := op.parent_block()) is None:
+            return
+        self._op_indices.pop(block, None)
+        if op.successors and (region := block.parent) is not None:
+            self._region_infos.pop(id(region), None)
+
+    def _handle_operation_modification(self, op: Operation) -> None:
+        """Invalidate the information that a modification of `op` may affect."""
+        if op.successors and (region := op.parent_region()) is not None:
+            self._region_infos.pop(id(region), None)
+
+    def _handle_block_creation(self, block: Block) -> None:
+        """Invalidate the information of the region in which `block` is created."""
+        if (region := block.parent) is not None:
+            self._region_infos.pop(id(region), None)
+
+    def get_listener(self) -> PatternRewriterListener:
+        """
+        Get a listener that invalidates the cached information affected by rewrites.
+        """
+        from xdsl.pattern_rewriter import PatternRewriterListener
+
+        return PatternRewriterListener(
+            operation_insertion_handler=[self._handle_operation_change],
+            operation_removal_handler=[self._handle_operation_change],
+            operation_modification_handler=[self._handle_operation_modification],
+            block_creation_handler=[self._handle_block_creation],
+        )
 
 
 def _strictly_dominates_block(a: Block, b: Block) -> bool:
@@ -87,11 +376,13 @@ def _strictly_dominates_block(a: Block, b: Block) -> bool:
     return DominanceInfo(a.parent).strictly_dominates(a, b)
 
 
-# This function could be deemed useless for now, but it's intended to be
-# overloaded with Values and Operations
+@deprecated(
+    "Please use `Dominance`, which caches the dominator tree of each region, instead"
+)
 def strictly_dominates(a: Block, b: Block) -> bool:
     """
     Returns true if block `a` strictly dominates block `b`, assuming they are in the
     same region.
+    The dominator tree of the region is computed for each call.
     """
     return _strictly_dominates_block(a, b)
@@ -5,6 +5,7 @@ from abc import ABC
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
+from operator import attrgetter
 from types import FunctionType
 from typing import (
     TYPE_CHECKING,
@@ -1312,7 +1313,7 @@ def get_variadic_sizes_from_attr(
             f"{size_attribute_name} {container_name} is expected to "
             "be a DenseArrayBase of i32"
         )
-    def_sizes = cast(list[int], [size_attr.data for size_attr in attribute.data.data])
+    def_sizes = cast(tuple[int, ...], attribute.as_tuple())
 
     if len(def_sizes) != len(defs):
         raise VerifyException(
@@ -1812,26 +1813,120 @@ def irdl_op_init(
     )
 
 
+_CONSTRUCT_STORAGE_NAMES = {
+    VarIRConstruct.OPERAND: "_operands",
+    VarIRConstruct.RESULT: "results",
+    VarIRConstruct.REGION: "regions",
+    VarIRConstruct.SUCCESSOR: "successors",
+}
+"""The name of the `Operation` field storing each kind of construct."""
+
+
+def _get_construct_segments_getter(
+    construct: VarIRConstruct, op_def: OpDef
+) -> Callable[[Operation], Sequence[tuple[int, int]]]:
+    """
+    Get a function returning the `(begin, end)` range of each definition of a
+    construct in an operation.
+    The ranges only depend on the number of constructs, and on the segment sizes
+    attribute if there is one, so they are cached on the operation until either
+    changes.
+    """
+    defs = get_construct_defs(op_def, construct)
+    get_args = attrgetter(_CONSTRUCT_STORAGE_NAMES[construct])
+    cache_name = f"_irdl_{construct.name.lower()}_segments"
+    attr_size_option = get_attr_size_option(construct)
+    option = next((o for o in op_def.options if isinstance(o, attr_size_option)), None)
+    sizes_name = None if option is None else option.attribute_name
+    sizes_container = attrgetter(
+        "properties" if option is not None and option.as_property else "attributes"
+    )
+
+    def get_segments(op: Operation) -> Sequence[tuple[int, int]]:
+        num_args = len(get_args(op))
+        sizes_attr = None if sizes_name is None else sizes_container(op).get(sizes_name)
+        cached = op.__dict__.get(cache_name)
+        if cached is not None and cached[0] == num_args and cached[1] is sizes_attr:
+            return cached[2]
+
+        variadic_sizes = iter(get_variadic_sizes(op, op_def, construct))
+        segments: list[tuple[int, int]] = []
+        begin = 0
+        for _, arg_def in defs:
+            size = next(variadic_sizes) if isinstance(arg_def, VariadicDef) else 1
+            segments.append((begin, begin + size))
+            begin += size
+        op.__dict__[cache_name] = (num_args, sizes_attr, segments)
+        return segments
+
+    return get_segments
+
+
 def irdl_op_arg_definition(
     new_attrs: dict[str, Any], construct: VarIRConstruct, op_def: OpDef
 ) -> None:
-    previous_variadics = 0
+    """
+    Add the accessors of the operands, results, regions, or successors of an
+    operation definition.
+    Accessors of operations without variadic definitions directly index the
+    constructs, while the others use cached segment ranges.
+    """
     defs = get_construct_defs(op_def, construct)
+    num_defs = len(defs)
+    num_variadics = sum(isinstance(arg_def, VariadicDef) for _, arg_def in defs)
+    get_args = attrgetter(_CONSTRUCT_STORAGE_NAMES[construct])
+    get_segments = _get_construct_segments_getter(construct, op_def)
+
     for arg_idx, (arg_name, arg_def) in enumerate(defs):
+        if not num_variadics:
+
+            def fixed_getter(self: Any, idx: int = arg_idx):
+                args = get_args(self)
+                if len(args) != num_defs:
+                    # Raise the same error as the verifier
+                    get_variadic_sizes(self, op_def, construct)
+                return args[idx]
+
+            new_attrs[arg_name] = property(fixed_getter)
+            continue
+
+        if isinstance(arg_def, OptionalDef):
 
-        def fun(self: Any, idx: int = arg_idx, previous_vars: int = previous_variadics):
-            return get_operand_result_or_region(
-                self, op_def, idx, previous_vars, construct
+            def optional_getter(self: Any, idx: int = arg_idx):
+                begin, end = get_segments(self)[idx]
+                return get_args(self)[begin] if begin != end else None
+
+            new_attrs[arg_name] = property(optional_getter)
+        elif isinstance(arg_def, VariadicDef):
+            wrapper: type[VarOperand] | type[VarOpResult] | None = (
+                VarOperand
+                if isinstance(arg_def, OperandDef)
+                else VarOpResult
+                if isinstance(arg_def, ResultDef)
+                else None
             )
 
-        new_attrs[arg_name] = property(fun)
-        if isinstance(arg_def, VariadicDef):
-            previous_variadics += 1
+            def variadic_getter(
+                self: Any,
+                idx: int = arg_idx,
+                wrapper: type[VarOperand] | type[VarOpResult] | None = wrapper,
+            ):
+                begin, end = get_segments(self)[idx]
+                values = get_args(self)[begin:end]
+                return values if wrapper is None else wrapper(values)
+
+            new_attrs[arg_name] = property(variadic_getter)
+        else:
+
+            def single_getter(self: Any, idx: int = arg_idx):
+                return get_args(self)[get_segments(self)[idx][0]]
+
+            new_attrs[arg_name] = property(single_getter)
 
     # If we have multiple variadics, check that we have an
     # attribute that holds the variadic sizes.
     variadics_option = get_multiple_variadic_options(construct)
-    if previous_variadics > 1 and (
+    if num_variadics > 1 and (
         not any(
             isinstance(o, option) for o in op_def.options for option in variadics_option
         )
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import math
 import re
-import struct
-import sys
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Any, Literal, NoReturn, cast
@@ -60,9 +58,9 @@ from xdsl.dialects.builtin import (
 )
 from xdsl.ir import Attribute, Data, ParametrizedAttribute
 from xdsl.ir.affine import AffineMap, AffineSet
-from xdsl.irdl import BaseAttr, base
+from xdsl.irdl import base
 from xdsl.parser.base_parser import BaseParser
-from xdsl.utils.exceptions import ParseError
+from xdsl.utils.exceptions import ParseError, VerifyException
 from xdsl.utils.isattr import isattr
 from xdsl.utils.lexer import Position, Span, StringLiteral, Token
 
@@ -91,6 +89,23 @@ class AttrParser(BaseParser):
     The key is the alias name, including the `!` or `#` prefix.
     """
 
+    _builtin_integer_or_float_types: dict[str, Attribute] = field(
+        default_factory=dict, init=False
+    )
+    """
+    The integer and float types that were already parsed, indexed by their name.
+    Types are immutable, so they are shared instead of being recreated and verified.
+    """
+
+    def _get_optional_alias(self, token: Token) -> Attribute | None:
+        """
+        Get the attribute aliased by an already parsed `!` or `#` identifier, if it
+        is a defined alias that is not followed by an opaque attribute body.
+        """
+        if self._current_token.kind == Token.Kind.LESS:
+            return None
+        return self.attribute_aliases.get(token.text)
+
     def parse_optional_type(self) -> Attribute | None:
         """
         Parse an xDSL type, if present.
@@ -109,8 +124,14 @@ class AttrParser(BaseParser):
         if (
             token := self._parse_optional_token(Token.Kind.EXCLAMATION_IDENT)
         ) is not None:
-            return self._parse_extended_type_or_attribute(token.text[1:], True)
-        return self._parse_optional_builtin_type()
+            if (alias := self._get_optional_alias(token)) is not None:
+                return alias
+            attr = self._parse_extended_type_or_attribute(token.text[1:], True)
+        else:
+            attr = self._parse_optional_builtin_type()
+        if attr is not None and (uniquer := self.ctx.uniquer) is not None:
+            return uniquer.unique(attr)
+        return attr
 
     def parse_type(self) -> Attribute:
         """
@@ -145,8 +166,14 @@ class AttrParser(BaseParser):
                             | [^[]<>(){}\0]+
         """
         if (token := self._parse_optional_token(Token.Kind.HASH_IDENT)) is not None:
-            return self._parse_extended_type_or_attribute(token.text[1:], False)
-        return self._parse_optional_builtin_attr()
+            if (alias := self._get_optional_alias(token)) is not None:
+                return alias
+            attr = self._parse_extended_type_or_attribute(token.text[1:], False)
+        else:
+            attr = self._parse_optional_builtin_attr()
+        if attr is not None and (uniquer := self.ctx.uniquer) is not None:
+            return uniquer.unique(attr)
+        return attr
 
     def parse_attribute(self) -> Attribute:
         """
@@ -239,6 +266,8 @@ class AttrParser(BaseParser):
 
         elif issubclass(attr_def, ParametrizedAttribute):
             param_list = attr_def.parse_parameters(self)
+            if (uniquer := self.ctx.uniquer) is not None:
+                return uniquer.get(attr_def, param_list)
             return attr_def.new(param_list)
         elif issubclass(attr_def, Data):
             param: Any = attr_def.parse_parameter(self)
@@ -698,15 +727,17 @@ class AttrParser(BaseParser):
             | RankedStructure[IndexType]
             | RankedStructure[AnyFloat]
         ),
-    ) -> tuple[list[int] | list[float], list[int]]:
+    ) -> tuple[bytes, int | None]:
         """
-        Parse a hex string literal e.g. dense<"0x82F5AB00">, and returns its flattened data
-        and its flattened shape, based on the parsed type.
+        Parse a hex string literal e.g. dense<"0x82F5AB00">, and returns its packed
+        little-endian data and its number of elements, based on the parsed type.
+        The number of elements is `None` for splat literals, in which case the data
+        is already repeated to match the type shape.
 
-        For instance, a dense<"0x82F5AB0182F5AB00"> attribute will return [28046722, 11269506]
-        for a tensor<2xi32> type.
+        For instance, a dense<"0x82F5AB0182F5AB00"> attribute will return
+        (b"\\x82\\xf5\\xab\\x01\\x82\\xf5\\xab\\x00", 2) for a tensor<2xi32> type.
 
-        Only supports integer types that are multiple of 8, f32 and f64.
+        Only supports integer types that are multiple of 8, and float types.
         """
         element_type = type.element_type
 
@@ -719,15 +750,16 @@ class AttrParser(BaseParser):
         except ValueError:
             self.raise_error("Hex string in denseAttr is invalid")
 
-        # Use struct builtin package for unpacking f32, f64
-        format_str: str = ""
         match element_type:
-            case Float32Type():
-                chunk_size = 4
-                format_str = "@f"  # @ in format string implies native endianess
-            case Float64Type():
-                chunk_size = 8
-                format_str = "@d"
+            case (
+                BFloat16Type()
+                | Float16Type()
+                | Float32Type()
+                | Float64Type()
+                | Float80Type()
+                | Float128Type()
+            ):
+                chunk_size = element_type.bitwidth // 8
             case IntegerType():
                 if element_type.width.data % 8 != 0:
                     self.raise_error(
@@ -736,29 +768,33 @@ class AttrParser(BaseParser):
                 chunk_size = element_type.width.data // 8
             case _:
                 self.raise_error(
-                    "Hex strings for dense literals are only supported for int, f32 and f64 types"
+                    "Hex strings for dense literals are only supported for int and float types"
                 )
         num_chunks = len(byte_list) // chunk_size
 
-        data_values: list[int] | list[float] = []
-
-        # Use struct to unpack floats
-        if isattr(element_type, BaseAttr(Float32Type) | BaseAttr(Float64Type)):
-            data_values = list(struct.unpack_from(format_str, byte_list))
-        # Use int for unpacking IntegerType
-        else:
-            for i in range(num_chunks):
-                parsed_int = int.from_bytes(
+        if isinstance(element_type, IntegerType) and chunk_size not in (1, 2, 4, 8):
+            # Integers that are not stored with their own width need to be repacked
+            values = [
+                int.from_bytes(
                     byte_list[i * chunk_size : (i + 1) * chunk_size],
-                    sys.byteorder,
-                    signed=True,
+                    "little",
+                    signed=element_type.signedness.data != Signedness.UNSIGNED,
                 )
-                data_values.append(parsed_int)
-        if len(data_values) == 1:
-            # Splat attribute case, same value everywhere,
-            # Emit values repeatedly and emit empty shape
-            return [data_values[0]] * math.prod(type.get_shape()), []
-        return data_values, [num_chunks]
+                for i in range(num_chunks)
+            ]
+            num_values = None if num_chunks == 1 else num_chunks
+            if num_chunks == 1:
+                values *= math.prod(type.get_shape())
+            int_type = cast(RankedStructure[IntegerType], type)
+            attr = DenseIntOrFPElementsAttr.create_dense_int(int_type, values)
+            return attr.data.data, num_values
+
+        byte_list = byte_list[: num_chunks * chunk_size]
+        if num_chunks == 1:
+            # Splat attribute case, same value everywhere
+            # Emit values repeatedly
+            return byte_list * math.prod(type.get_shape()), None
+        return byte_list, num_chunks
 
     def _parse_dense_literal_type(
         self,
@@ -826,15 +862,14 @@ class AttrParser(BaseParser):
         elif isinstance(dense_contents, str):
             # Hex-encoded string case
             # Get values and shape in case of hex_string (requires parsed type)
-            data_values, shape = self._parse_builtin_dense_attr_hex(
-                dense_contents, type
-            )
+            data, num_values = self._parse_builtin_dense_attr_hex(dense_contents, type)
             # For splat attributes any shape is fine
-            if shape and type_num_values != shape[0]:
+            if num_values is not None and type_num_values != num_values:
                 self.raise_error(
                     f"Shape mismatch in dense literal. Expected {type_num_values} "
-                    f"elements from the type, but got {shape[0]} elements."
+                    f"elements from the type, but got {num_values} elements."
                 )
+            return DenseIntOrFPElementsAttr(type, data)
         else:
             # Tensor literal case
             dense_values, shape = dense_contents
@@ -896,13 +931,18 @@ class AttrParser(BaseParser):
 
         self.parse_characters(":", " in dense array")
 
+        start_pos = self.pos
         values = self.parse_comma_separated_list(
             self.Delimiter.NONE, lambda: self.parse_number(allow_boolean=True)
         )
+        end_pos = self.pos
 
         self.parse_characters(">", " in dense array")
 
-        return DenseArrayBase.from_list(element_type, values)
+        try:
+            return DenseArrayBase.from_list(element_type, values)
+        except VerifyException as e:
+            self.raise_error(str(e), start_pos, end_pos)
 
     def _parse_builtin_affine_map(self, _name: Span) -> AffineMapAttr:
         self.parse_characters("<", " in affine_map attribute")
@@ -1277,7 +1317,23 @@ class AttrParser(BaseParser):
         if self._current_token.kind != Token.Kind.BARE_IDENT:
             return None
         name = self._current_token.text
+        if (cached := self._builtin_integer_or_float_types.get(name)) is not None:
+            self._consume_token()
+            return cached
+        attr = self._parse_optional_uncached_integer_or_float_type(name)
+        if attr is not None:
+            if (uniquer := self.ctx.uniquer) is not None:
+                attr = uniquer.unique(attr)
+            self._builtin_integer_or_float_types[name] = attr
+        return attr
 
+    def _parse_optional_uncached_integer_or_float_type(
+        self, name: str
+    ) -> Attribute | None:
+        """
+        Parse as integer or float type the current token, with the given name, if
+        present.
+        """
         # Index type
         if name == "index":
             self._consume_token()
@@ -518,11 +518,6 @@ class BaseParser:
         Parse a punctuation, if it is present. Otherwise, return None.
         Punctuations are defined by `PunctuationSpelling`.
         """
-        # This check is only necessary to catch errors made by users that
-        # are not using pyright.
-        assert Token.Kind.is_spelling_of_punctuation(punctuation), (
-            "'parse_optional_punctuation' must be " "called with a valid punctuation"
-        )
         kind = Token.Kind.get_punctuation_kind_from_spelling(punctuation)
         if self._parse_optional_token(kind) is not None:
             return punctuation
@@ -535,11 +530,6 @@ class BaseParser:
         Parse a punctuation. Punctuations are defined by
         `PunctuationSpelling`.
         """
-        # This check is only necessary to catch errors made by users that
-        # are not using pyright.
-        assert Token.Kind.is_spelling_of_punctuation(
-            punctuation
-        ), "'parse_punctuation' must be called with a valid punctuation"
         kind = Token.Kind.get_punctuation_kind_from_spelling(punctuation)
         self._parse_token(kind, f"Expected '{punctuation}'" + context_msg)
         return punctuation
@@ -18,6 +18,7 @@ from xdsl.ir import (
 )
 from xdsl.irdl import IRDLOperation
 from xdsl.parser import AttrParser, ParserState, Position
+from xdsl.resources import ResourceBlob
 from xdsl.utils.exceptions import MultipleSpansParseError
 from xdsl.utils.lexer import Input, Lexer, Span, Token
 
@@ -88,6 +89,12 @@ class Parser(AttrParser):
     This field map a name and a tuple index to the forward declared SSA value.
     """
 
+    _op_types: dict[str, tuple[type[Operation], str]]
+    """
+    The operation type and dialect name of the operation names that were already
+    found in the context, so that each name is only looked up once.
+    """
+
     def __init__(
         self,
         ctx: MLContext,
@@ -99,11 +106,17 @@ class Parser(AttrParser):
         self.blocks = dict()
         self.forward_block_references = dict()
         self.forward_ssa_references = dict()
+        self._op_types = dict()
 
     def parse_module(self, allow_implicit_module: bool = True) -> ModuleOp:
         module_op: Operation
 
         if not allow_implicit_module:
+            while self._current_token.kind in (
+                Token.Kind.HASH_IDENT,
+                Token.Kind.EXCLAMATION_IDENT,
+            ):
+                self._parse_alias_def()
             parsed_op = self.parse_optional_operation()
 
             if parsed_op is None:
@@ -114,6 +127,8 @@ class Parser(AttrParser):
                 self.raise_error("builtin.module operation expected", 0)
 
             module_op = parsed_op
+            while self._current_token.kind == Token.Kind.FILE_METADATA_BEGIN:
+                self._parse_file_metadata()
         else:
             parsed_ops: list[Operation] = []
 
@@ -124,6 +139,9 @@ class Parser(AttrParser):
                 ):
                     self._parse_alias_def()
                     continue
+                if self._current_token.kind == Token.Kind.FILE_METADATA_BEGIN:
+                    self._parse_file_metadata()
+                    continue
                 if (parsed_op := self.parse_optional_operation()) is not None:
                     parsed_ops.append(parsed_op)
                     continue
@@ -149,6 +167,60 @@ class Parser(AttrParser):
 
         return module_op
 
+    def _parse_file_metadata(self) -> None:
+        """
+        Parse a file metadata dictionary, and register the resource blobs it contains
+        in the context, with the following syntax:
+            file-metadata-dict ::= `{-#` metadata-entry (`,` metadata-entry)* `#-}`
+            metadata-entry ::= `dialect_resources` `:` `{` dialect-resources-list `}`
+            dialect-resources ::= bare-id `:` `{` resource-list `}`
+            resource ::= bare-id `:` hex-string
+        The hex strings of the blobs are only decoded when their data is accessed.
+        """
+        self._parse_token(Token.Kind.FILE_METADATA_BEGIN, "Expected '{-#'")
+
+        def parse_resource(dialect: str) -> None:
+            key = self.parse_identifier(" for resource key")
+            self.parse_punctuation(":", " after resource key")
+            token = self._parse_token(
+                Token.Kind.STRING_LIT, "Expected hex string for resource blob"
+            )
+            span = Span(token.span.start + 1, token.span.end - 1, token.span.input)
+            try:
+                blob = ResourceBlob.from_hex_span(span)
+            except ValueError as e:
+                self.raise_error(str(e), token.span)
+            self.ctx.resources.insert(dialect, key, blob)
+
+        def parse_dialect_resources() -> None:
+            dialect = self.parse_identifier(" for resource dialect")
+            self.parse_punctuation(":", " after resource dialect")
+            self.parse_comma_separated_list(
+                self.Delimiter.BRACES,
+                lambda: parse_resource(dialect),
+                " in dialect resources",
+            )
+
+        def parse_entry() -> None:
+            start = self.pos
+            section = self.parse_identifier(" for file metadata section")
+            if section != "dialect_resources":
+                self.raise_error(
+                    f"Unsupported file metadata section '{section}', only "
+                    "'dialect_resources' is supported",
+                    start,
+                    self.pos,
+                )
+            self.parse_punctuation(":", " after file metadata section")
+            self.parse_comma_separated_list(
+                self.Delimiter.BRACES,
+                parse_dialect_resources,
+                " in dialect resources section",
+            )
+
+        self.parse_comma_separated_list(self.Delimiter.NONE, parse_entry)
+        self._parse_token(Token.Kind.FILE_METADATA_END, "Expected '#-}'")
+
     def _parse_alias_def(self):
         """
         Parse an attribute or type alias definition with format:
@@ -286,32 +358,27 @@ class Parser(AttrParser):
         and checks that the type is consistent.
         """
         name = operand.operand_name
-
-        # If the indexed operand is already used as a forward reference, return it
-        if (
-            name in self.forward_ssa_references
-            and operand.index in self.forward_ssa_references[name]
-        ):
-            return self.forward_ssa_references[name][operand.index]
-
-        # If the operand is not yet defined, create a forward reference
-        if name not in self.ssa_values:
-            forward_value = ForwardDeclaredValue(type)
-            reference_tuple = self.forward_ssa_references.setdefault(name, {})
-            reference_tuple[operand.index] = forward_value
+        values = self.ssa_values.get(name)
+
+        # If the operand is not yet defined, return its forward reference, creating
+        # it if it is not used yet
+        if values is None:
+            references = self.forward_ssa_references.setdefault(name, {})
+            if (forward_value := references.get(operand.index)) is None:
+                forward_value = ForwardDeclaredValue(type)
+                references[operand.index] = forward_value
             return forward_value
 
         # If the operand is already defined, check that the tuple index is in range
-        tuple_size = len(self.ssa_values[name])
-        if operand.index >= tuple_size:
+        if operand.index >= len(values):
             self.raise_error(
                 "SSA value tuple index out of bounds. "
-                f"Tuple is of size {tuple_size} but tried to access element {operand.index}.",
+                f"Tuple is of size {len(values)} but tried to access element {operand.index}.",
                 operand.span,
             )
 
         # Check that the type is consistent
-        resolved = self.ssa_values[name][operand.index]
+        resolved = values[operand.index]
         if resolved.type != type:
             self.raise_error(
                 f"operand is used with type {type}, but has been "
@@ -369,9 +436,9 @@ class Parser(AttrParser):
 
         tuple_size = len(values)
         # Check for forward references of this value
-        if name in self.forward_ssa_references:
-            index_references = self.forward_ssa_references[name]
-            del self.forward_ssa_references[name]
+        if (
+            index_references := self.forward_ssa_references.pop(name, None)
+        ) is not None:
             if any(index >= tuple_size for index in index_references):
                 self.raise_error(
                     f"SSA value %{name} is referenced with an index "
@@ -694,23 +761,22 @@ class Parser(AttrParser):
         op_loc = self._current_token.span
         bound_results = self._parse_op_result_list()
 
+        dialect_stack = self._parser_state.dialect_stack
         if (op_name := self._parse_optional_token(Token.Kind.BARE_IDENT)) is not None:
             # Custom operation format
-            op_type = self._get_op_by_name(op_name.text)
-            dialect_name = op_type.dialect_name()
-            self._parser_state.dialect_stack.append(dialect_name)
+            op_type, dialect_name = self._get_op_type_and_dialect(op_name.text)
+            dialect_stack.append(dialect_name)
             op = op_type.parse(self)
-            self._parser_state.dialect_stack.pop()
+            dialect_stack.pop()
         else:
             # Generic operation format
             op_name = self.expect(
                 self.parse_optional_str_literal, "operation name expected"
             )
-            op_type = self._get_op_by_name(op_name)
-            dialect_name = op_type.dialect_name()
-            self._parser_state.dialect_stack.append(dialect_name)
+            op_type, dialect_name = self._get_op_type_and_dialect(op_name)
+            dialect_stack.append(dialect_name)
             op = self._parse_generic_operation(op_type)
-            self._parser_state.dialect_stack.pop()
+            dialect_stack.pop()
 
         n_bound_results = sum(r[1] for r in bound_results)
         if (n_bound_results != 0) and (len(op.results) != n_bound_results):
@@ -731,6 +797,23 @@ class Parser(AttrParser):
 
         return op
 
+    def _get_op_type_and_dialect(self, name: str) -> tuple[type[Operation], str]:
+        """
+        Get an operation type and the name of its dialect from the operation name.
+        Raises an error if the operation is not registered, and if unregistered
+        dialects are not allowed.
+        """
+        if (cached := self._op_types.get(name)) is not None:
+            return cached
+        op_type = self.ctx.get_optional_op(name)
+        if op_type is None:
+            op_type = self._get_op_by_name(name)
+            return op_type, op_type.dialect_name()
+        # Only names found without the dialect stack are cached, as the others
+        # depend on the enclosing operations
+        cached = self._op_types[name] = (op_type, op_type.dialect_name())
+        return cached
+
     def _get_op_by_name(self, name: str) -> type[Operation]:
         """
         Get an operation type by its name.
@@ -815,7 +898,7 @@ class Parser(AttrParser):
         If the length of args and input_types does not match, an error is raised at
         the location error_pos.
         """
-        length = len(list(input_types))
+        length = len(input_types)
         if len(args) != length:
             self.raise_error(
                 f"expected {length} operand types but had {len(args)}",
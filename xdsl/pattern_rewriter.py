@@ -430,9 +430,24 @@ def op_type_rewrite_pattern(
         if isinstance(op, expected_type):
             func(self, op, rewriter)
 
+    # Record the matched operation types, so that pattern appliers can skip
+    # calling the pattern on operations it cannot match.
+    impl.__op_types__ = expected_types  # pyright: ignore[reportFunctionMemberAccess]
+
     return impl
 
 
+def _get_pattern_op_types(
+    pattern: RewritePattern,
+) -> tuple[type[Operation], ...] | None:
+    """
+    Get the operation types a pattern can match on, as declared by the type hint of a
+    `match_and_rewrite` method decorated with `op_type_rewrite_pattern`.
+    Returns `None` if the pattern may match any operation.
+    """
+    return getattr(pattern.match_and_rewrite, "__op_types__", None)
+
+
 @dataclass
 class TypeConversionPattern(RewritePattern):
     """
@@ -578,11 +593,42 @@ class GreedyRewritePatternApplier(RewritePattern):
     and then use this rewrite.
     """
 
-    rewrite_patterns: list[RewritePattern]
-    """The list of rewrites to apply in order."""
+    rewrite_patterns: Sequence[RewritePattern]
+    """
+    The rewrites to apply in order, stored as a tuple as the patterns of each operation
+    type are cached.
+    """
+
+    _patterns_by_op_type: dict[type[Operation], tuple[RewritePattern, ...]] = field(
+        default_factory=dict, init=False
+    )
+    """
+    For each operation type encountered so far, the patterns that can match it, in
+    their original order.
+    Patterns decorated with `op_type_rewrite_pattern` are only kept for the operation
+    types they match on, while other patterns are kept for all operation types.
+    """
+
+    def __post_init__(self):
+        self.rewrite_patterns = tuple(self.rewrite_patterns)
+
+    def _get_patterns_for_op_type(
+        self, op_type: type[Operation]
+    ) -> tuple[RewritePattern, ...]:
+        """Get the patterns that can match operations of the given type."""
+        patterns = self._patterns_by_op_type.get(op_type)
+        if patterns is None:
+            patterns = tuple(
+                pattern
+                for pattern in self.rewrite_patterns
+                if (op_types := _get_pattern_op_types(pattern)) is None
+                or issubclass(op_type, op_types)
+            )
+            self._patterns_by_op_type[op_type] = patterns
+        return patterns
 
     def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
-        for pattern in self.rewrite_patterns:
+        for pattern in self._get_patterns_for_op_type(type(op)):
             pattern.match_and_rewrite(op, rewriter)
             if rewriter.has_done_action:
                 return
@@ -640,6 +686,11 @@ class Worklist:
             self._op_stack[index] = None
             del self._map[op]
 
+    def clear(self):
+        """Remove all operations from the worklist."""
+        self._op_stack.clear()
+        self._map.clear()
+
 
 @dataclass(eq=False, repr=False)
 class PatternRewriteWalker:
@@ -671,9 +722,39 @@ class PatternRewriteWalker:
     listener: PatternRewriterListener = field(default_factory=PatternRewriterListener)
     """The listener that will be called when an operation or block is modified."""
 
+    incremental: bool = field(default=False, kw_only=True)
+    """
+    Populate the worklist with the nested operations only once, and then only rely on
+    the rewriter events to add operations back to the worklist.
+    Otherwise, all nested operations are walked again after each round that modified
+    the IR, until a round does not modify it.
+    This only has an effect when `apply_recursively` is set.
+    """
+
+    max_iterations: int | None = field(default=None, kw_only=True)
+    """
+    The maximum number of walks over all nested operations when not in incremental
+    mode. `None` means that there is no limit.
+    """
+
+    max_num_rewrites: int | None = field(default=None, kw_only=True)
+    """
+    The maximum number of pattern applications that modify the IR during a single
+    rewrite. `None` means that there is no limit.
+    """
+
+    converged: bool = field(default=True, init=False)
+    """
+    Whether the last rewrite stopped because there was nothing left to rewrite, as
+    opposed to because `max_iterations` or `max_num_rewrites` was reached.
+    """
+
     _worklist: Worklist = field(default_factory=Worklist, init=False)
     """The worklist of operations to walk over."""
 
+    _num_rewrites: int = field(default=0, init=False)
+    """The number of pattern applications that modified the IR in the current rewrite."""
+
     def _add_operands_to_worklist(self, operands: Iterable[SSAValue]) -> None:
         """
         Add defining operations of SSA values to the worklist if they have only
@@ -752,21 +833,40 @@ class PatternRewriteWalker:
         pattern. Returns `True` if the IR was mutated.
         """
         pattern_listener = self._get_rewriter_listener()
+        self.converged = True
+        self._num_rewrites = 0
 
         self._populate_worklist(op)
         op_was_modified = self._process_worklist(pattern_listener)
 
-        if not self.apply_recursively:
+        # In incremental mode, the worklist was kept up to date by the rewriter
+        # events, so processing it until it is empty reaches the fixpoint.
+        if not self.apply_recursively or self.incremental:
             return op_was_modified
 
         result = op_was_modified
+        num_iterations = 1
 
-        while op_was_modified:
+        while op_was_modified and self.converged:
+            if (
+                self.max_iterations is not None
+                and num_iterations >= self.max_iterations
+            ) or self._has_reached_max_num_rewrites():
+                self.converged = False
+                break
             self._populate_worklist(op)
             op_was_modified = self._process_worklist(pattern_listener)
+            num_iterations += 1
 
         return result
 
+    def _has_reached_max_num_rewrites(self) -> bool:
+        """Check if the budget of pattern applications is exhausted."""
+        return (
+            self.max_num_rewrites is not None
+            and self._num_rewrites >= self.max_num_rewrites
+        )
+
     def _populate_worklist(self, op: Operation) -> None:
         """Populate the worklist with all nested operations."""
         # We walk in reverse order since we use a stack for our worklist.
@@ -808,6 +908,17 @@ class PatternRewriteWalker:
                 )
             rewriter_has_done_action |= rewriter.has_done_action
 
+            # Stop early if the budget of pattern applications is exhausted
+            if rewriter.has_done_action:
+                self._num_rewrites += 1
+                if (
+                    self._has_reached_max_num_rewrites()
+                    and not self._worklist.is_empty()
+                ):
+                    self.converged = False
+                    self._worklist.clear()
+                    return rewriter_has_done_action
+
             # If the worklist is empty, we are done
             op = self._worklist.pop()
             if op is None:
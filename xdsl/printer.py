@@ -1,18 +1,17 @@
 from __future__ import annotations
 
 import json
+import sys
 from collections.abc import Callable, Iterable, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from io import StringIO
 from itertools import chain
-from typing import Any, TypeVar, cast
-
-from typing_extensions import deprecated
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from xdsl.dialects.builtin import (
     AffineMapAttr,
     AffineSetAttr,
-    AnyFloatAttr,
     AnyIntegerAttr,
     AnyUnrankedMemrefType,
     AnyUnrankedTensorType,
@@ -31,7 +30,6 @@ from xdsl.dialects.builtin import (
     Float80Type,
     Float128Type,
     FloatAttr,
-    FloatData,
     FunctionType,
     IndexType,
     IntAttr,
@@ -68,12 +66,25 @@ from xdsl.ir import (
     SSAValue,
     TypeAttribute,
 )
+from xdsl.resources import ResourceManager
 from xdsl.traits import IsolatedFromAbove, IsTerminator
 from xdsl.utils.diagnostic import Diagnostic
 from xdsl.utils.lexer import Lexer
 
+if TYPE_CHECKING:
+    from typing_extensions import deprecated
+else:
+    # `typing_extensions.deprecated` imports asyncio, which is slow to import
+    from xdsl.utils.deprecation import deprecated
+
 indentNumSpaces = 2
 
+_BUFFER_FLUSH_SIZE = 4096
+"""The number of buffered strings after which the buffer is written to the stream."""
+
+_ALIAS_MIN_LENGTH = 24
+"""The minimal length of the printed form of an attribute to print it as an alias."""
+
 
 @dataclass(eq=False, repr=False)
 class Printer:
@@ -81,6 +92,23 @@ class Printer:
     print_generic_format: bool = field(default=False)
     print_properties_as_attributes: bool = field(default=False)
     print_debuginfo: bool = field(default=False)
+    elide_elementsattrs_if_larger: int | None = field(default=None)
+    """
+    Print the dense elements attributes with more elements than this limit as an
+    opaque `dense_resource<__elided__>` placeholder. Splat attributes are never
+    elided.
+    """
+    print_elementsattrs_with_hex_if_larger: int | None = field(default=None)
+    """
+    Print the dense elements attributes with more elements than this limit in the
+    hex form, e.g. `dense<"0x0100000002000000">`, if their element type supports it.
+    """
+    print_aliases: bool = field(default=False)
+    """
+    Print the large attributes and types that are used several times in an operation
+    as aliases, e.g. `!stencil_field = !stencil.field<...>`, defined before the
+    operation.
+    """
     diagnostic: Diagnostic = field(default_factory=Diagnostic)
 
     _indent: int = field(default=0, init=False)
@@ -96,11 +124,25 @@ class Printer:
     )
     _next_valid_name_id: list[int] = field(default_factory=lambda: [0], init=False)
     _next_valid_block_id: list[int] = field(default_factory=lambda: [0], init=False)
-    _current_line: int = field(default=0, init=False)
-    _current_column: int = field(default=0, init=False)
+    _buffer: list[str] = field(default_factory=list, init=False)
+    """The text printed and not yet written to the stream."""
+    _buffering: bool = field(default=False, init=False)
+    """
+    Whether the text is kept in the buffer until the outermost `print_op` returns,
+    instead of being written to the stream right away.
+    """
+    _column_offset: int = field(default=0, init=False)
+    """The column at which the text in the buffer starts."""
+    _aliases: dict[Attribute, str] = field(default_factory=dict, init=False)
+    """The alias names of the attributes and types, including their `!` or `#`."""
     _next_line_callback: list[Callable[[], None]] = field(
         default_factory=list, init=False
     )
+    _printed_resource_handles: set[str] = field(default_factory=set, init=False)
+    """
+    The handles of the `dense_resource` attributes printed so far, whose blobs are
+    printed by `print_resources`.
+    """
 
     @property
     def ssa_names(self):
@@ -162,33 +204,60 @@ class Printer:
         then the `Printer` instance's indentation level is used.
         """
 
-        num_newlines = text.count("\n")
-
-        if not num_newlines:
-            self._current_column += len(text)
-            print(text, end="", file=self.stream)
+        if "\n" not in text:
+            if self._buffering:
+                self._buffer.append(text)
+            else:
+                self._write(text)
             return
 
         indent = self._indent if indent is None else indent
-        lines = text.split("\n")
 
         if indent == 0 and not self._next_line_callback:
             # No indent and no callback to print after the next newline, the text
             # can be printed directly.
-            self._current_line += num_newlines
-            self._current_column = len(lines[-1])
-            print(text, end="", file=self.stream)
+            self._write(text)
             return
 
-        # Line and column information is not computed ahead of time
-        # as indent-aware newline printing may use it as part of
-        # callbacks.
-        print(lines[0], end="", file=self.stream)
-        self._current_column += len(lines[0])
+        lines = text.split("\n")
+        self._write(lines[0])
         for line in lines[1:]:
             self._print_new_line(indent=indent)
-            print(line, end="", file=self.stream)
-            self._current_column += len(line)
+            self._write(line)
+
+    def _write(self, text: str) -> None:
+        """
+        Print text, keeping it in the buffer while it is held by `print_op`.
+        """
+        if self._buffering:
+            self._buffer.append(text)
+        else:
+            self._buffer.append(text)
+            self._flush()
+
+    def _flush(self) -> None:
+        """Write the buffered text to the stream."""
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        if (last_newline := text.rfind("\n")) == -1:
+            self._column_offset += len(text)
+        else:
+            self._column_offset = len(text) - last_newline - 1
+        stream = sys.stdout if self.stream is None else self.stream
+        stream.write(text)
+
+    @property
+    def _current_column(self) -> int:
+        """
+        The column of the next printed character, computed from the text printed
+        since the last newline.
+        """
+        column = 0
+        for text in reversed(self._buffer):
+            if (last_newline := text.rfind("\n")) != -1:
+                return column + len(text) - last_newline - 1
+            column += len(text)
+        return column + self._column_offset
 
     @contextmanager
     def indented(self, amount: int = 1):
@@ -270,17 +339,18 @@ class Printer:
         self, indent: int | None = None, print_message: bool = True
     ) -> None:
         indent = self._indent if indent is None else indent
-        # Prints a newline, bypassing the `print_string` method
-        print(file=self.stream)
-        self._current_line += 1
-        if print_message:
-            for callback in self._next_line_callback:
-                callback()
-            self._next_line_callback = []
         num_spaces = indent * indentNumSpaces
-        # Prints indentation, bypassing the `print_string` method
-        print(" " * num_spaces, end="", file=self.stream)
-        self._current_column = num_spaces
+        # Prints a newline and indentation, bypassing the `print_string` method
+        if not print_message or not self._next_line_callback:
+            self._write("\n" + " " * num_spaces)
+            if len(self._buffer) >= _BUFFER_FLUSH_SIZE:
+                self._flush()
+            return
+        self._write("\n")
+        for callback in self._next_line_callback:
+            callback()
+        self._next_line_callback = []
+        self._write(" " * num_spaces)
 
     def _get_new_valid_name_id(self) -> str:
         self._next_valid_name_id[-1] += 1
@@ -458,7 +528,51 @@ class Printer:
                     self.print_string(chr(byte))
         self.print_string('"')
 
+    def _print_large_dense_elements_attr(
+        self, attribute: DenseIntOrFPElementsAttr
+    ) -> bool:
+        """
+        Print a dense elements attribute as an elided placeholder or in the hex form,
+        if it is larger than the limits set on the printer.
+        Return whether the attribute was printed.
+        """
+        num_elements = attribute.get_num_elements()
+        elide_limit = self.elide_elementsattrs_if_larger
+        hex_limit = self.print_elementsattrs_with_hex_if_larger
+        if (
+            elide_limit is not None
+            and num_elements > elide_limit
+            and not attribute.is_splat()
+        ):
+            self.print_string("dense_resource<__elided__> : ")
+            self.print_attribute(attribute.type)
+            return True
+        if hex_limit is None or num_elements <= hex_limit:
+            return False
+        # The hex form stores elements with the exact width of their type
+        element_type = attribute.get_element_type()
+        if isinstance(element_type, IntegerType):
+            width = element_type.width.data
+            supports_hex = width in (8, 16, 32, 64) or (width > 64 and width % 8 == 0)
+        else:
+            supports_hex = not isinstance(element_type, IndexType)
+        if not supports_hex or attribute.is_splat():
+            return False
+        self.print_string(f'dense<"0x{attribute.data.data.hex().upper()}"> : ')
+        self.print_attribute(attribute.type)
+        return True
+
     def print_attribute(self, attribute: Attribute) -> None:
+        if self._aliases:
+            try:
+                alias = self._aliases.get(attribute)
+            except TypeError:
+                # Unhashable attributes are never aliased
+                alias = None
+            if alias is not None:
+                self.print_string(alias)
+                return
+
         if isinstance(attribute, UnitAttr):
             self.print_string("unit")
             return
@@ -556,8 +670,8 @@ class Printer:
         if isinstance(attribute, DenseArrayBase):
             self.print_string("array<")
             self.print_attribute(attribute.elt_type)
-            data = cast(ArrayAttr[IntAttr | FloatData], attribute.data)
-            if len(data.data) == 0:
+            data = attribute.as_tuple()
+            if len(data) == 0:
                 self.print_string(">")
                 return
             self.print_string(": ")
@@ -565,11 +679,11 @@ class Printer:
             # therefore we need to print these as false and true
             if attribute.elt_type == i1:
                 self.print_list(
-                    data.data,
-                    lambda x: self.print_string("true" if x.data == 1 else "false"),
+                    data,
+                    lambda x: self.print_string("true" if x == 1 else "false"),
                 )
             else:
-                self.print_list(data.data, lambda x: self.print_string(f"{x.data}"))
+                self.print_list(data, lambda x: self.print_string(f"{x}"))
             self.print_string(">")
             return
 
@@ -591,21 +705,16 @@ class Printer:
             return
 
         if isinstance(attribute, DenseIntOrFPElementsAttr):
+            if self._print_large_dense_elements_attr(attribute):
+                return
+            is_int = isinstance(attribute.get_element_type(), IntegerType | IndexType)
+            elem_format = "" if is_int else ".6e"
 
-            def print_one_elem(val: Attribute):
-                if isinstance(val, IntegerAttr):
-                    self.print_string(f"{val.value.data}")
-                elif isinstance(val, FloatAttr):
-                    self.print_string(f"{val.value.data:.6e}")
-                else:
-                    raise Exception(
-                        "unexpected attribute type "
-                        "in DenseIntOrFPElementsAttr: "
-                        f"{type(val)}"
-                    )
+            def print_one_elem(val: int | float):
+                self.print_string(f"{val:{elem_format}}")
 
             def print_dense_list(
-                array: Sequence[AnyIntegerAttr] | Sequence[AnyFloatAttr],
+                array: Sequence[int] | Sequence[float],
                 shape: Sequence[int],
             ):
                 self.print_string("[")
@@ -620,14 +729,14 @@ class Printer:
                 self.print_string("]")
 
             self.print_string("dense<")
-            data = attribute.data.data
+            data = attribute.get_values()
             shape = (
                 attribute.get_shape() if attribute.shape_is_complete else (len(data),)
             )
             assert shape is not None, "If shape is complete, then it cannot be None"
             if len(data) == 0:
                 pass
-            elif data.count(data[0]) == len(data):
+            elif attribute.is_splat():
                 print_one_elem(data[0])
             else:
                 print_dense_list(data, shape)
@@ -637,6 +746,7 @@ class Printer:
 
         if isinstance(attribute, DenseResourceAttr):
             handle = attribute.resource_handle.data
+            self._printed_resource_handles.add(handle)
             self.print_string(f"dense_resource<{handle}> : ")
             self.print_attribute(attribute.type)
             return
@@ -954,9 +1064,147 @@ class Printer:
         self._ssa_names.pop()
         self._block_names.pop()
 
+    def print_resources(self, resources: ResourceManager) -> None:
+        """
+        Print the file metadata dictionary containing the resource blobs used by the
+        printed IR, if any. These are the builtin blobs referenced by the printed
+        `dense_resource` attributes, and the blobs of all other dialects.
+        """
+        dialect_blobs = {
+            dialect: {
+                key: blob
+                for key, blob in resources.get_dialect_resources(dialect).items()
+                if dialect != "builtin" or key in self._printed_resource_handles
+            }
+            for dialect in resources.dialects
+        }
+        dialect_blobs = {
+            dialect: blobs for dialect, blobs in dialect_blobs.items() if blobs
+        }
+        if not dialect_blobs:
+            return
+
+        self.print_string("\n\n{-#", indent=0)
+        with self.indented():
+            self.print_string("\ndialect_resources: {")
+            with self.indented():
+                for i, (dialect, blobs) in enumerate(dialect_blobs.items()):
+                    if i:
+                        self.print_string(",")
+                    self.print_string(f"\n{dialect}: {{")
+                    with self.indented():
+                        for j, (key, blob) in enumerate(blobs.items()):
+                            if j:
+                                self.print_string(",")
+                            self.print_string(f'\n{key}: "{blob.to_hex()}"')
+                    self.print_string("\n}")
+            self.print_string("\n}")
+        self.print_string("\n#-}", indent=0)
+
+    def _count_alias_candidates(self, op: Operation) -> dict[Attribute, int]:
+        """
+        Count the uses of the parametrized attributes and types in an operation and
+        its nested operations, in an order where nested attributes come first.
+        The parameters of an attribute are only counted on its first use, as they are
+        printed only once if the attribute is aliased.
+        """
+        counts: dict[Attribute, int] = {}
+
+        def visit(attr: Attribute) -> None:
+            if isinstance(attr, ParametrizedAttribute):
+                try:
+                    count = counts.get(attr)
+                except TypeError:
+                    return
+                if count is not None:
+                    counts[attr] = count + 1
+                    return
+                for param in attr.parameters:
+                    visit(param)
+                counts[attr] = 1
+            elif isinstance(attr, ArrayAttr):
+                for elem in cast(ArrayAttr[Attribute], attr):
+                    visit(elem)
+            elif isinstance(attr, DictionaryAttr):
+                for value in attr.data.values():
+                    visit(value)
+
+        for nested_op in op.walk():
+            for operand in nested_op.operands:
+                visit(operand.type)
+            for result in nested_op.results:
+                visit(result.type)
+            for attr in nested_op.properties.values():
+                visit(attr)
+            for attr in nested_op.attributes.values():
+                visit(attr)
+            for region in nested_op.regions:
+                for block in region.blocks:
+                    for arg in block.args:
+                        visit(arg.type)
+        return counts
+
+    def _print_alias_definitions(self, op: Operation) -> None:
+        """
+        Select the attributes and types of an operation that are worth aliasing, and
+        print their alias definitions.
+        """
+        self._aliases = {}
+        scratch = StringIO()
+        scratch_printer = Printer(
+            stream=scratch,
+            print_generic_format=self.print_generic_format,
+            print_properties_as_attributes=self.print_properties_as_attributes,
+            elide_elementsattrs_if_larger=self.elide_elementsattrs_if_larger,
+            print_elementsattrs_with_hex_if_larger=(
+                self.print_elementsattrs_with_hex_if_larger
+            ),
+        )
+        used_names: set[str] = set()
+        for attr, count in self._count_alias_candidates(op).items():
+            # Function types are expanded in function signatures, and cannot be
+            # aliased
+            if count < 2 or isinstance(attr, FunctionType):
+                continue
+            scratch.seek(0)
+            scratch.truncate()
+            scratch_printer.print_attribute(attr)
+            if len(scratch.getvalue()) < _ALIAS_MIN_LENGTH:
+                continue
+            assert isinstance(attr, ParametrizedAttribute)
+            prefix = "!" if isinstance(attr, TypeAttribute) else "#"
+            base_name = prefix + attr.name.replace(".", "_")
+            name = base_name
+            suffix = 0
+            while name in used_names:
+                suffix += 1
+                name = f"{base_name}{suffix}"
+            used_names.add(name)
+            # Definitions can only use the aliases defined before them
+            self.print_string(f"{name} = ", indent=0)
+            self.print_attribute(attr)
+            self.print_string("\n", indent=0)
+            self._aliases[attr] = name
+
     def print_op(self, op: Operation) -> None:
+        if self._buffering:
+            self._print_op(op)
+            return
+        # Keep the printed text in a buffer until the outermost operation is printed
+        self._buffering = True
+        try:
+            if self.print_aliases:
+                self._print_alias_definitions(op)
+            self._print_op(op)
+        finally:
+            self._buffering = False
+            self._aliases = {}
+            self._flush()
+
+    def _print_op(self, op: Operation) -> None:
         scope = bool(op.get_traits_of_type(IsolatedFromAbove))
-        begin_op_pos = self._current_column
+        messages = self.diagnostic.op_messages.get(op)
+        begin_op_pos = self._current_column if messages else 0
         self._print_results(op)
         if scope:
             self.enter_scope()
@@ -970,9 +1218,9 @@ class Printer:
         else:
             self.print_string(f"{op.name}")
             use_custom_format = True
-        end_op_pos = self._current_column
-        if op in self.diagnostic.op_messages:
-            for message in self.diagnostic.op_messages[op]:
+        if messages:
+            end_op_pos = self._current_column
+            for message in messages:
                 self._add_message_on_next_line(message, begin_op_pos, end_op_pos)
         if isinstance(op, UnregisteredOp):
             op_name = op.op_name
@@ -0,0 +1,172 @@
+"""
+Storage for the resource blobs referenced by the IR, such as the data of
+`dense_resource` attributes.
+
+Resource blobs are printed in the `dialect_resources` section of the file metadata,
+after the top-level operation:
+
+```
+{-#
+  dialect_resources: {
+    builtin: {
+      blob1: "0x08000000010000000000000002000000000000000300000000000000"
+    }
+  }
+#-}
+```
+
+The data of a blob is only materialized when it is first accessed, so that blobs that
+are passed through a pipeline are never decoded.
+"""
+
+from __future__ import annotations
+
+import mmap
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from os import PathLike
+
+from xdsl.utils.lexer import Span
+
+
+@dataclass(eq=False)
+class ResourceBlob:
+    """
+    A blob of binary data, with a minimal alignment.
+
+    A blob is either constructed from a buffer, from a hex string in the input of the
+    parser, or from a file. Hex strings are only decoded, and files are only
+    memory-mapped, when the data is first accessed.
+    """
+
+    alignment: int = field(default=1)
+    """The minimal alignment of the data, in bytes."""
+
+    _data: memoryview | None = field(default=None)
+    """The data of the blob, if it was already materialized."""
+
+    _hex_span: Span | None = field(default=None)
+    """
+    The span of the hex string in the input of the parser, without the quotes, if the
+    blob was parsed.
+    """
+
+    _file: tuple[str | PathLike[str], int, int | None] | None = field(default=None)
+    """The path, offset, and size of the data in a file, if the blob is file-backed."""
+
+    @staticmethod
+    def from_bytes(data: bytes | bytearray | memoryview, alignment: int = 1):
+        """Create a blob from a buffer. The buffer is not copied."""
+        return ResourceBlob(alignment, memoryview(data).cast("B"))
+
+    @staticmethod
+    def from_hex_span(span: Span) -> ResourceBlob:
+        """
+        Create a blob from a hex string in the input of the parser, of the form
+        `0x<alignment><data>`, where the alignment is a 32-bit little-endian integer.
+        The data is only decoded when it is first accessed.
+        """
+        text = span.input.content
+        if (
+            span.len < 10
+            or text[span.start : span.start + 2] != "0x"
+            or (span.len % 2) != 0
+        ):
+            raise ValueError("Expected a hex string of the form 0x<alignment><data>")
+        alignment = int.from_bytes(
+            bytes.fromhex(text[span.start + 2 : span.start + 10]), "little"
+        )
+        return ResourceBlob(alignment, _hex_span=span)
+
+    @staticmethod
+    def from_file(
+        path: str | PathLike[str],
+        offset: int = 0,
+        size: int | None = None,
+        alignment: int = 1,
+    ) -> ResourceBlob:
+        """
+        Create a blob from the `size` bytes at `offset` in a file, or until the end of
+        the file if `size` is `None`.
+        The file is only memory-mapped when the data is first accessed.
+        """
+        return ResourceBlob(alignment, _file=(path, offset, size))
+
+    @property
+    def is_materialized(self) -> bool:
+        """Return if the data of the blob was already decoded or mapped."""
+        return self._data is not None
+
+    @property
+    def data(self) -> memoryview:
+        """
+        A read-only view on the data of the blob, materialized on the first access.
+        """
+        if self._data is None:
+            self._data = self._materialize()
+        return self._data.toreadonly()
+
+    def _materialize(self) -> memoryview:
+        if self._hex_span is not None:
+            span = self._hex_span
+            return memoryview(
+                bytes.fromhex(span.input.content[span.start + 10 : span.end])
+            )
+        assert self._file is not None
+        path, offset, size = self._file
+        with open(path, "rb") as f:
+            # The mapping stays valid after the file is closed.
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        end = len(mapped) if size is None else offset + size
+        if end > len(mapped):
+            raise ValueError(
+                f"Resource blob of {end - offset} bytes at offset {offset} is out of "
+                f"bounds of file '{path}' of {len(mapped)} bytes"
+            )
+        return memoryview(mapped)[offset:end]
+
+    def to_hex(self) -> str:
+        """
+        Get the hex string representation of the blob, of the form
+        `0x<alignment><data>`.
+        Blobs that were parsed and never decoded are printed as in the input.
+        """
+        if self._hex_span is not None:
+            return self._hex_span.text
+        return (
+            "0x"
+            + self.alignment.to_bytes(4, "little").hex().upper()
+            + self.data.hex().upper()
+        )
+
+
+@dataclass
+class ResourceManager:
+    """Contains the resource blobs of each dialect, indexed by their key."""
+
+    _blobs: dict[str, dict[str, ResourceBlob]] = field(default_factory=dict)
+
+    def get(self, dialect: str, key: str) -> ResourceBlob | None:
+        """Get the blob of a dialect with the given key, if it exists."""
+        if (blobs := self._blobs.get(dialect)) is None:
+            return None
+        return blobs.get(key)
+
+    def insert(self, dialect: str, key: str, blob: ResourceBlob) -> None:
+        """Insert a blob for a dialect, replacing any blob with the same key."""
+        self._blobs.setdefault(dialect, {})[key] = blob
+
+    def get_dialect_resources(self, dialect: str) -> Mapping[str, ResourceBlob]:
+        """Get all the blobs of a dialect, indexed by their key."""
+        return self._blobs.get(dialect, {})
+
+    @property
+    def dialects(self) -> Iterator[str]:
+        """The dialects that have at least one blob."""
+        return (dialect for dialect, blobs in self._blobs.items() if blobs)
+
+    def clone(self) -> ResourceManager:
+        """Create a copy of this manager, sharing the blobs."""
+        return ResourceManager(
+            {dialect: blobs.copy() for dialect, blobs in self._blobs.items()}
+        )
@@ -2,7 +2,7 @@ import argparse
 import os
 import sys
 from collections.abc import Callable
-from typing import IO
+from typing import IO, TextIO, cast
 
 from xdsl.context import MLContext
 from xdsl.dialects import get_all_dialects
@@ -11,6 +11,7 @@ from xdsl.parser import Parser
 from xdsl.passes import ModulePass
 from xdsl.utils.exceptions import ParseError
 from xdsl.utils.lexer import Span
+from xdsl.utils.mapped_text import MappedTextIO
 
 
 def get_all_passes() -> dict[str, Callable[[], type[ModulePass]]]:
@@ -558,7 +559,7 @@ class CommandLineTool:
             f = sys.stdin
             file_extension = "mlir"
         else:
-            f = open(self.args.input_file)
+            f = MappedTextIO.from_file(self.args.input_file)
             _, file_extension = os.path.splitext(self.args.input_file)
             file_extension = file_extension.replace(".", "")
         return f, file_extension
@@ -589,7 +590,17 @@ class CommandLineTool:
                 self.get_input_name(),
             ).parse_module(not self.args.no_implicit_module)
 
+        def parse_bytecode(io: IO[str]):
+            from xdsl.bytecode import BytecodeReader
+
+            if isinstance(io, MappedTextIO):
+                data = io.read_bytes()
+            else:
+                data = cast(TextIO, io).buffer.read()
+            return BytecodeReader(self.ctx, data).read_module()
+
         self.available_frontends["mlir"] = parse_mlir
+        self.available_frontends["xdslbc"] = parse_bytecode
 
     def parse_chunk(
         self, chunk: IO[str], file_extension: str, start_offset: int = 0
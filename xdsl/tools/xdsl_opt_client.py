@@ -0,0 +1,33 @@
+"""
+A client of `xdsl-opt --server`, which takes the same arguments as xdsl-opt.
+
+The socket of the server is read from the `XDSL_OPT_SERVER` environment variable. If it
+is not set, xdsl-opt is run in this process instead.
+"""
+
+import os
+import sys
+
+from xdsl.utils.opt_server import run_client
+
+
+def main():
+    socket_path = os.environ.get("XDSL_OPT_SERVER")
+    if socket_path is None:
+        from xdsl.xdsl_opt_main import xDSLOptMain
+
+        xDSLOptMain().run()
+        return
+    sys.exit(
+        run_client(
+            socket_path,
+            sys.argv[1:],
+            sys.stdin.buffer,
+            sys.stdout.buffer,
+            sys.stderr.buffer,
+        )
+    )
+
+
+if "__main__" == __name__:
+    main()
@@ -1,8 +1,10 @@
 #!/usr/bin/env python3
 
 import argparse
+import json
 import sys
 from collections.abc import Sequence
+from typing import TYPE_CHECKING
 
 from xdsl.context import MLContext
 from xdsl.interpreter import Interpreter
@@ -13,6 +15,9 @@ from xdsl.parser import Parser
 from xdsl.tools.command_line_tool import CommandLineTool
 from xdsl.traits import CallableOpInterface
 
+if TYPE_CHECKING:
+    from xdsl.interpreters.profiler import ProfilingListener
+
 
 class xDSLRunMain(CommandLineTool):
     interpreter: Interpreter
@@ -66,6 +71,33 @@ class xDSLRunMain(CommandLineTool):
             nargs="?",
             help="Bitwidth of the index type representation.",
         )
+        arg_parser.add_argument(
+            "--compile-regions",
+            default=False,
+            action="store_true",
+            help="Translate each region once into a list of pre-bound steps before "
+            "interpreting it, which makes loops faster.",
+        )
+        arg_parser.add_argument(
+            "--profile",
+            default=False,
+            action="store_true",
+            help="Measure the time spent interpreting each operation, and print the "
+            "operations and functions taking the most time to stderr.",
+        )
+        arg_parser.add_argument(
+            "--profile-output",
+            type=str,
+            help="Write the measured time of each stack of operations to this file, "
+            "implies --profile.",
+        )
+        arg_parser.add_argument(
+            "--profile-format",
+            choices=("speedscope", "chrome", "collapsed"),
+            default="speedscope",
+            help="Format of the profile output: speedscope or Chrome trace JSON, or "
+            "collapsed stacks for flame graph tools.",
+        )
         arg_parser.add_argument(
             "--args",
             default="",
@@ -82,14 +114,37 @@ class xDSLRunMain(CommandLineTool):
             include_onnx=self.args.onnx,
         )
 
+    def write_profile(self, profiler: "ProfilingListener"):
+        print(profiler.summary(), file=sys.stderr)
+        if (path := self.args.profile_output) is None:
+            return
+        match self.args.profile_format:
+            case "collapsed":
+                output = profiler.to_collapsed_stacks()
+            case "chrome":
+                output = json.dumps(profiler.to_chrome_trace())
+            case _:
+                output = json.dumps(profiler.to_speedscope(self.args.symbol))
+        with open(path, "w") as f:
+            f.write(output)
+
     def run(self):
         input, file_extension = self.get_input_stream()
         try:
             module = self.parse_chunk(input, file_extension)
             if module is not None:
                 module.verify()
+                profiler = None
+                if self.args.profile or self.args.profile_output is not None:
+                    from xdsl.interpreters.profiler import ProfilingListener
+
+                    profiler = ProfilingListener()
                 interpreter = Interpreter(
-                    module, index_bitwidth=self.args.index_bitwidth
+                    module,
+                    index_bitwidth=self.args.index_bitwidth,
+                    resources=self.ctx.resources,
+                    compile_regions=self.args.compile_regions,
+                    listener=profiler or Interpreter.Listener(),
                 )
                 self.register_implementations(interpreter)
                 symbol = self.args.symbol
@@ -111,6 +166,8 @@ class xDSLRunMain(CommandLineTool):
                     )
                 )
                 result = interpreter.call_op(op, args)
+                if profiler is not None:
+                    self.write_profile(profiler)
                 if self.args.verbose:
                     if result:
                         if len(result) == 1:
@@ -4,14 +4,14 @@ import abc
 from collections.abc import Iterator
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import TYPE_CHECKING, TypeVar, final
+from typing import TYPE_CHECKING, TypeVar, cast, final
 
 from xdsl.utils.exceptions import VerifyException
 
 if TYPE_CHECKING:
     from xdsl.dialects.builtin import StringAttr, SymbolRefAttr
     from xdsl.ir import Attribute, Operation, Region, SSAValue
-    from xdsl.pattern_rewriter import RewritePattern
+    from xdsl.pattern_rewriter import PatternRewriterListener, RewritePattern
 
 
 @dataclass(frozen=True)
@@ -394,6 +394,275 @@ class OptionalSymbolOpInterface(SymbolOpInterface):
         return True
 
 
+@dataclass(eq=False)
+class _SymbolTableIndex:
+    """The symbols defined by a SymbolTable operation, and their uses."""
+
+    symbols: dict[str, Operation] = field(default_factory=dict)
+    """The symbol operations directly nested in the table, indexed by name."""
+
+    uses: dict[str, dict[Operation, None]] = field(default_factory=dict)
+    """
+    For each symbol name, the operations referencing it, in insertion order.
+    Only operations whose closest SymbolTable ancestor is the table are recorded.
+    """
+
+
+@dataclass(eq=False)
+class SymbolTableCollection:
+    """
+    A cache of the symbols defined by SymbolTable operations, and of the operations
+    referencing them, so that symbol lookups and symbol use queries do not walk the IR.
+
+    The index of a SymbolTable operation is built on its first query, and is then kept
+    up to date by the rewriter events forwarded by the listener returned by
+    `get_listener`. Changes to the IR done without notifying this listener require
+    calling `invalidate`.
+
+    https://mlir.llvm.org/doxygen/classmlir_1_1SymbolTableCollection.html
+    """
+
+    _indices: dict[Operation, _SymbolTableIndex] = field(
+        default_factory=dict, init=False
+    )
+    """The index of each SymbolTable operation queried so far."""
+
+    _symbol_names: dict[Operation, tuple[Operation, str]] = field(
+        default_factory=dict, init=False
+    )
+    """The table and name under which each indexed symbol operation is registered."""
+
+    _used_names: dict[Operation, tuple[Operation, tuple[str, ...]]] = field(
+        default_factory=dict, init=False
+    )
+    """The table and symbol names recorded as referenced by each indexed operation."""
+
+    @staticmethod
+    def _get_parent_table(op: Operation) -> Operation | None:
+        """Get the closest SymbolTable ancestor of an operation, if any."""
+        anchor = op.parent_op()
+        while anchor is not None and not anchor.has_trait(SymbolTable):
+            anchor = anchor.parent_op()
+        return anchor
+
+    @staticmethod
+    def _walk_table_ops(op: Operation) -> Iterator[Operation]:
+        """
+        Walk an operation and its nested operations, without entering the regions of
+        nested SymbolTable operations.
+        """
+        stack = [op]
+        while stack:
+            op = stack.pop()
+            yield op
+            if op.has_trait(SymbolTable):
+                continue
+            for region in reversed(op.regions):
+                for block in reversed(region.blocks):
+                    stack.extend(reversed(tuple(block.ops)))
+
+    @staticmethod
+    def _get_referenced_names(op: Operation) -> tuple[str, ...]:
+        """Get the root names of the symbol references in an operation's attributes."""
+        # import builtin here to avoid circular import
+        from xdsl.dialects.builtin import ArrayAttr, DictionaryAttr, SymbolRefAttr
+
+        names: list[str] = []
+        attrs: list[Attribute] = [*op.attributes.values(), *op.properties.values()]
+        while attrs:
+            attr = attrs.pop()
+            if isinstance(attr, SymbolRefAttr):
+                names.append(attr.root_reference.data)
+            elif isinstance(attr, ArrayAttr):
+                attrs.extend(cast("ArrayAttr[Attribute]", attr).data)
+            elif isinstance(attr, DictionaryAttr):
+                attrs.extend(attr.data.values())
+        return tuple(names)
+
+    def _add_op(self, table_op: Operation, index: _SymbolTableIndex, op: Operation):
+        """Record the symbol and symbol uses of an operation in a table index."""
+        self._remove_op(op)
+        if (
+            op.parent_op() is table_op
+            and (sym_interface := op.get_trait(SymbolOpInterface)) is not None
+        ):
+            sym_name = sym_interface.get_sym_attr_name(op)
+            if sym_name is not None:
+                index.symbols[sym_name.data] = op
+                self._symbol_names[op] = (table_op, sym_name.data)
+        if op is not table_op and (names := self._get_referenced_names(op)):
+            for name in names:
+                index.uses.setdefault(name, {})[op] = None
+            self._used_names[op] = (table_op, names)
+
+    def _remove_op(self, op: Operation):
+        """Forget the symbol and symbol uses recorded for an operation."""
+        if (entry := self._symbol_names.pop(op, None)) is not None:
+            table_op, name = entry
+            index = self._indices[table_op]
+            if index.symbols.get(name) is op:
+                del index.symbols[name]
+        if (uses := self._used_names.pop(op, None)) is not None:
+            table_op, names = uses
+            index = self._indices[table_op]
+            for name in names:
+                if (users := index.uses.get(name)) is not None:
+                    users.pop(op, None)
+
+    def _get_index(self, table_op: Operation) -> _SymbolTableIndex:
+        """Get the index of a SymbolTable operation, building it if needed."""
+        index = self._indices.get(table_op)
+        if index is None:
+            if not table_op.has_trait(SymbolTable):
+                raise ValueError(
+                    f"Operation {table_op.name} does not have a SymbolTable trait"
+                )
+            index = self._indices[table_op] = _SymbolTableIndex()
+            for region in table_op.regions:
+                for block in region.blocks:
+                    for op in block.ops:
+                        for nested_op in self._walk_table_ops(op):
+                            self._add_op(table_op, index, nested_op)
+        return index
+
+    def invalidate(self, table_op: Operation | None = None) -> None:
+        """
+        Forget the index of a SymbolTable operation, or of all SymbolTable operations
+        if `table_op` is `None`.
+        """
+        if table_op is None:
+            self._indices.clear()
+            self._symbol_names.clear()
+            self._used_names.clear()
+            return
+        if self._indices.pop(table_op, None) is None:
+            return
+        self._symbol_names = {
+            op: entry
+            for op, entry in self._symbol_names.items()
+            if entry[0] is not table_op
+        }
+        self._used_names = {
+            op: entry
+            for op, entry in self._used_names.items()
+            if entry[0] is not table_op
+        }
+
+    def lookup_symbol_in(
+        self, table_op: Operation, name: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """
+        Lookup a symbol by reference in a SymbolTable operation, resolving nested
+        references in the nested SymbolTable operations.
+        """
+        # import builtin here to avoid circular import
+        from xdsl.dialects.builtin import StringAttr
+
+        if isinstance(name, str):
+            return self._get_index(table_op).symbols.get(name)
+        if isinstance(name, StringAttr):
+            return self._get_index(table_op).symbols.get(name.data)
+        op = self._get_index(table_op).symbols.get(name.root_reference.data)
+        for nested_name in name.nested_references.data:
+            if op is None or not op.has_trait(SymbolTable):
+                return None
+            op = self._get_index(op).symbols.get(nested_name.data)
+        return op
+
+    def lookup_symbol(
+        self, op: Operation, name: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """
+        Lookup a symbol by reference, starting from a specific operation's closest
+        SymbolTable parent.
+        """
+        anchor: Operation | None = op
+        while anchor is not None and not anchor.has_trait(SymbolTable):
+            anchor = anchor.parent_op()
+        if anchor is None:
+            raise ValueError(f"Operation {op} has no SymbolTable ancestor")
+        return self.lookup_symbol_in(anchor, name)
+
+    def get_symbol_uses(
+        self, table_op: Operation, name: str | StringAttr
+    ) -> tuple[Operation, ...]:
+        """
+        Get the operations referencing the symbol `name` of a SymbolTable operation,
+        without the ones nested in other SymbolTable operations.
+        """
+        if not isinstance(name, str):
+            name = name.data
+        return tuple(self._get_index(table_op).uses.get(name, ()))
+
+    def insert_or_update(
+        self, symbol_table_op: Operation, symbol_op: Operation
+    ) -> Operation | None:
+        """
+        Same as `SymbolTable.insert_or_update`, using and updating the cached index of
+        `symbol_table_op`.
+        """
+        trait = symbol_op.get_trait(SymbolOpInterface)
+
+        if trait is None:
+            raise ValueError(
+                "Passed symbol_op does not have the SymbolOpInterface trait"
+            )
+
+        symbol_name = trait.get_sym_attr_name(symbol_op)
+
+        if symbol_name is None:
+            raise ValueError("Passed symbol_op does not have a symbol attribute name")
+
+        index = self._get_index(symbol_table_op)
+        defined_symbol = index.symbols.get(symbol_name.data)
+
+        if defined_symbol is None:
+            symbol_table_op.regions[0].blocks[0].add_op(symbol_op)
+        else:
+            self._handle_operation_removal(defined_symbol)
+            parent = defined_symbol.parent
+            assert parent is not None
+            parent.insert_op_after(symbol_op, defined_symbol)
+            parent.detach_op(defined_symbol)
+        self._handle_operation_insertion(symbol_op)
+        return defined_symbol
+
+    def _handle_operation_insertion(self, op: Operation) -> None:
+        """Record an inserted operation in the index of its parent table."""
+        if (table_op := self._get_parent_table(op)) is None or (
+            index := self._indices.get(table_op)
+        ) is None:
+            return
+        for nested_op in self._walk_table_ops(op):
+            self._add_op(table_op, index, nested_op)
+
+    def _handle_operation_removal(self, op: Operation) -> None:
+        """Forget a removed operation and its nested operations."""
+        for nested_op in op.walk():
+            self._remove_op(nested_op)
+            if nested_op is not op and nested_op in self._indices:
+                self.invalidate(nested_op)
+
+    def _handle_operation_modification(self, op: Operation) -> None:
+        """Record the new symbol and symbol uses of a modified operation."""
+        self._remove_op(op)
+        if (table_op := self._get_parent_table(op)) is not None and (
+            index := self._indices.get(table_op)
+        ) is not None:
+            self._add_op(table_op, index, op)
+
+    def get_listener(self) -> PatternRewriterListener:
+        """Get a listener that keeps the cached indices up to date with rewrites."""
+        # import pattern_rewriter here to avoid circular import
+        from xdsl.pattern_rewriter import PatternRewriterListener
+
+        return PatternRewriterListener(
+            operation_insertion_handler=[self._handle_operation_insertion],
+            operation_removal_handler=[self._handle_operation_removal],
+            operation_modification_handler=[self._handle_operation_modification],
+        )
+
+
 class CallableOpInterface(OpTrait, abc.ABC):
     """
     Interface for function-like Operations that can be called in a generic way.
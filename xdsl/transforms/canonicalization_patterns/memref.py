@@ -15,13 +15,15 @@ class MemrefSubviewOfSubviewFolding(RewritePattern):
         if not isinstance(source_subview, memref.Subview):
             return
 
-        if not all(stride.data == 1 for stride in op.static_strides.data):
+        if not all(stride == 1 for stride in op.static_strides.as_tuple()):
             return
 
-        if not all(stride.data == 1 for stride in source_subview.static_strides.data):
+        if not all(stride == 1 for stride in source_subview.static_strides.as_tuple()):
             return
 
-        if not len(op.static_offsets.data) == len(source_subview.static_offsets.data):
+        if not len(op.static_offsets.as_tuple()) == len(
+            source_subview.static_offsets.as_tuple()
+        ):
             return
 
         assert isa(source_subview.source.type, memref.MemRefType[Attribute])
@@ -41,14 +43,14 @@ class MemrefSubviewOfSubviewFolding(RewritePattern):
             return
 
         new_offsets = [
-            off1.data + off2.data
+            off1 + off2
             for off1, off2 in zip(
-                op.static_offsets.data, source_subview.static_offsets.data
+                op.static_offsets.as_tuple(), source_subview.static_offsets.as_tuple()
             )
         ]
 
-        current_sizes = [x.data for x in op.static_sizes.data]
-        current_strides = [x.data for x in op.static_strides.data]
+        current_sizes = list(op.static_sizes.as_tuple())
+        current_strides = list(op.static_strides.as_tuple())
 
         assert isa(new_offsets, list[int])
         assert isa(current_sizes, list[int])
@@ -24,10 +24,14 @@ class OperationInfo:
 
     This is to compare operations on their name, attributes, properties, results,
     operands, and matching region structure.
+    The hash is computed once and cached, so the operation should not be modified
+    while its OperationInfo is in use.
     """
 
     op: Operation
 
+    _hash: int | None = field(default=None, init=False, repr=False)
+
     @property
     def name(self):
         return (
@@ -37,15 +41,17 @@ class OperationInfo:
         )
 
     def __hash__(self):
-        return hash(
-            (
-                self.name,
-                sum(hash(i) for i in self.op.attributes.items()),
-                sum(hash(i) for i in self.op.properties.items()),
-                hash(self.op.result_types),
-                hash(self.op.operands),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.name,
+                    sum(hash(i) for i in self.op.attributes.items()),
+                    sum(hash(i) for i in self.op.properties.items()),
+                    hash(self.op.result_types),
+                    hash(self.op.operands),
+                )
             )
-        )
+        return self._hash
 
     def __eq__(self, other: object):
         return (
@@ -68,33 +74,76 @@ _D = TypeVar("_D")
 
 class KnownOps:
     """
-    Cache dictionary for known operations used in CSE.
+    Scoped cache dictionary for known operations used in CSE.
     It quacks like a dict[Operation, Operation], but uses OperationInfo of an Opetration
     as the actual key.
+
+    Entering a scope with `push_scope` records all subsequent changes, which are then
+    undone when leaving the scope with `pop_scope`, without copying the known
+    operations of the enclosing scopes.
     """
 
     _known_ops: dict[OperationInfo, Operation]
+    _op_infos: dict[Operation, OperationInfo]
+    """The OperationInfo of each looked up operation, caching its hash."""
+    _scopes: list[list[tuple[OperationInfo, Operation | None]]]
+    """
+    For each open scope, the keys that were changed in it, along with their value
+    before the change, if any.
+    """
+
+    def __init__(self):
+        self._known_ops = {}
+        self._op_infos = {}
+        self._scopes = []
+
+    def _get_info(self, op: Operation) -> OperationInfo:
+        info = self._op_infos.get(op)
+        if info is None:
+            info = self._op_infos[op] = OperationInfo(op)
+        return info
+
+    def _record(self, info: OperationInfo):
+        if self._scopes:
+            self._scopes[-1].append((info, self._known_ops.get(info)))
+
+    def invalidate(self, op: Operation):
+        """
+        Forget the cached hash of an operation. This should be called when the
+        operation is modified.
+        """
+        self._op_infos.pop(op, None)
+
+    def push_scope(self):
+        """Enter a new scope."""
+        self._scopes.append([])
 
-    def __init__(self, known_ops: "KnownOps | None" = None):
-        if known_ops is None:
-            self._known_ops = {}
-        else:
-            self._known_ops = dict(known_ops._known_ops)
+    def pop_scope(self):
+        """Leave the current scope, undoing all the changes done in it."""
+        for info, previous in reversed(self._scopes.pop()):
+            if previous is None:
+                self._known_ops.pop(info, None)
+            else:
+                self._known_ops[info] = previous
 
     def __getitem__(self, k: Operation):
-        return self._known_ops[OperationInfo(k)]
+        return self._known_ops[self._get_info(k)]
 
     def __setitem__(self, k: Operation, v: Operation):
-        self._known_ops[OperationInfo(k)] = v
+        info = self._get_info(k)
+        self._record(info)
+        self._known_ops[info] = v
 
     def __contains__(self, k: Operation):
-        return OperationInfo(k) in self._known_ops
+        return self._get_info(k) in self._known_ops
 
     def get(self, k: Operation, default: _D = None) -> Operation | _D:
-        return self._known_ops.get(OperationInfo(k), default)
+        return self._known_ops.get(self._get_info(k), default)
 
     def pop(self, k: Operation):
-        return self._known_ops.pop(OperationInfo(k))
+        info = self._get_info(k)
+        self._record(info)
+        return self._known_ops.pop(info)
 
 
 def has_other_side_effecting_op_in_between(
@@ -148,6 +197,9 @@ class CSEDriver:
 
         for o, n in zip(op.results, existing.results, strict=True):
             if all(wasVisited(u) for u in o.uses):
+                # The users' operands change, so their cached hashes are stale
+                for u in o.uses:
+                    self._known_ops.invalidate(u.operation)
                 o.replace_by(n)
 
         # If no uses remain, we can mark this operation for erasure
@@ -231,12 +283,11 @@ class CSEDriver:
             return
 
         if len(region.blocks) == 1:
-            old_scope = self._known_ops
-            self._known_ops = KnownOps(self._known_ops)
+            self._known_ops.push_scope()
 
             self._simplify_block(region.block)
 
-            self._known_ops = old_scope
+            self._known_ops.pop_scope()
 
     def simplify(self, thing: Operation | Block | Region):
         match thing:
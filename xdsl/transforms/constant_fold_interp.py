@@ -84,7 +84,7 @@ class ConstantFoldInterpPass(ModulePass):
     name = "constant-fold-interp"
 
     def apply(self, ctx: MLContext, op: builtin.ModuleOp) -> None:
-        interpreter = Interpreter(op)
+        interpreter = Interpreter(op, resources=ctx.resources)
         # Do not call wgpu interpreter functions for this pass
         # Do not call onnx interpreter function for this pass
         register_implementations(
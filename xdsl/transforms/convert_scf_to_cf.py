@@ -190,9 +190,7 @@ class SwitchLowering(RewritePattern):
             self._convert_region(region, continue_block, rewriter)
             for region in op.case_regions
         )
-        case_values: tuple[int, ...] = tuple(
-            cast(int, i.data) for i in op.cases.data.data
-        )
+        case_values = cast(tuple[int, ...], op.cases.as_tuple())
 
         # Convert the default region
         default_block = self._convert_region(
@@ -166,7 +166,7 @@ class ConvertAccessOpFromPrefetchPattern(RewritePattern):
         if (
             len(op.res.uses) == 1
             and isinstance(use := list(op.res.uses)[0].operation, tensor.ExtractSliceOp)
-            and tuple(d.data for d in use.static_sizes.data) == t_type.get_shape()[1:]
+            and use.static_sizes.as_tuple() == t_type.get_shape()[1:]
             and len(use.offsets) == 0
             and len(use.sizes) == 0
             and len(use.strides) == 0
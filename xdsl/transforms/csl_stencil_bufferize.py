@@ -354,7 +354,7 @@ class ArithConstBufferize(RewritePattern):
         assert isinstance(op.value, DenseIntOrFPElementsAttr)
         assert isa(op.value.type, TensorType[Attribute])
         typ = DenseIntOrFPElementsAttr(
-            [tensor_to_memref_type(op.value.type), op.value.data]
+            tensor_to_memref_type(op.value.type), op.value.data
         )
         rewriter.replace_matched_op(
             [
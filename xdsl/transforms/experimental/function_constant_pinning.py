@@ -1,4 +1,5 @@
 from collections.abc import Iterable
+from dataclasses import dataclass, field
 from typing import cast
 
 from xdsl.context import MLContext
@@ -13,12 +14,19 @@ from xdsl.pattern_rewriter import (
     op_type_rewrite_pattern,
 )
 from xdsl.rewriter import InsertPoint
-from xdsl.traits import SymbolTable
+from xdsl.traits import SymbolTable, SymbolTableCollection
 
 PIN_CONSTANT_VALS = "pin_to_constants"
 
 
+@dataclass
 class FunctionConstantPinning(RewritePattern):
+    symbol_tables: SymbolTableCollection = field(default_factory=SymbolTableCollection)
+    """
+    The symbol tables used to generate unique function names. They should be notified
+    of the rewrites through their listener.
+    """
+
     @op_type_rewrite_pattern
     def match_and_rewrite(self, func_op: func.FuncOp, rewriter: PatternRewriter, /):
         # can't rewrite nested functions yet
@@ -50,7 +58,9 @@ class FunctionConstantPinning(RewritePattern):
         # grab the first value to pin:
         val = pinned_vals.pop()
         # generate the function containing pinned value:
-        new_func = generate_func_with_pinned_val(func_op, val, rewriter)
+        new_func = generate_func_with_pinned_val(
+            func_op, val, rewriter, self.symbol_tables
+        )
         # insert the specialized function after the generic function (the one we matched on)
         rewriter.insert_op_after_matched_op(new_func)
         # insert a compare to the value we specialize and, and branch on if we are equal
@@ -115,6 +125,7 @@ def generate_func_with_pinned_val(
     func_op: func.FuncOp,
     pin: Attribute,
     rewriter: PatternRewriter,
+    symbol_tables: SymbolTableCollection | None = None,
 ):
     """
     Specializes a function to pin a value to a compile time constant. Assumes the function is top-level
@@ -134,7 +145,7 @@ def generate_func_with_pinned_val(
     assert isinstance(module, builtin.ModuleOp), "func must be top-level functions!"
     # generate a new name and set it:
     new_func.sym_name = StringAttr(
-        unique_pinned_name(module, new_func.sym_name.data, "pinned")
+        unique_pinned_name(module, new_func.sym_name.data, "pinned", symbol_tables)
     )
 
     # find the first operation that is structurally equivalent, this will always give us the exact same operation
@@ -208,19 +219,29 @@ def ops_between_op_and_func_start(
         yield op
 
 
-def unique_pinned_name(module: builtin.ModuleOp, name: str, hint: str) -> str:
+def unique_pinned_name(
+    module: builtin.ModuleOp,
+    name: str,
+    hint: str,
+    symbol_tables: SymbolTableCollection | None = None,
+) -> str:
     """
-    Generate a new name that is unique to the module
+    Generate a new name that is unique to the module.
+    If `symbol_tables` is given, its cached index of the module is used for lookups.
     """
     # try just name + hint
     proposed_name = f"{name}_{hint}"
     # prepare a counter if needed
     counter = 1
     # grab symbol table
-    iface = module.get_trait(SymbolTable)
-    assert iface is not None, "ModuleOp must have symbol table trait!"
+    if symbol_tables is None:
+        iface = module.get_trait(SymbolTable)
+        assert iface is not None, "ModuleOp must have symbol table trait!"
+        lookup_symbol = iface.lookup_symbol
+    else:
+        lookup_symbol = symbol_tables.lookup_symbol_in
     # while name is not unique
-    while iface.lookup_symbol(module, proposed_name) is not None:
+    while lookup_symbol(module, proposed_name) is not None:
         # generate new name try
         proposed_name = f"{name}_{hint}_{counter}"
         counter += 1
@@ -289,4 +310,8 @@ class FunctionConstantPinningPass(ModulePass):
     name = "function-constant-pinning"
 
     def apply(self, ctx: MLContext, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(FunctionConstantPinning()).rewrite_module(op)
+        symbol_tables = SymbolTableCollection()
+        PatternRewriteWalker(
+            FunctionConstantPinning(symbol_tables),
+            listener=symbol_tables.get_listener(),
+        ).rewrite_module(op)
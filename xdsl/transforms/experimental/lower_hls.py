@@ -428,7 +428,7 @@ class LowerHLSExtractStencilValue(RewritePattern):
     def match_and_rewrite(
         self, op: HLSExtractStencilValue, rewriter: PatternRewriter, /
     ):
-        indices = [attr.data for attr in op.position.data]
+        indices = list(op.position.as_tuple())
         assert isa(indices, list[int])
 
         assert isinstance(op.container, OpResult)
@@ -1,4 +1,3 @@
-from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import TypeGuard, cast
 
@@ -15,10 +14,10 @@ from xdsl.dialects.arith import (
 )
 from xdsl.dialects.builtin import (
     AnyFloat,
+    AnyFloatAttr,
     ArrayAttr,
     ContainerType,
     DenseIntOrFPElementsAttr,
-    IntAttr,
     ModuleOp,
     ShapedType,
     TensorType,
@@ -79,12 +78,9 @@ def get_required_result_type(op: Operation) -> TensorType[Attribute] | None:
             if (
                 isinstance(use.operation, InsertSliceOp)
                 and is_tensor(use.operation.result.type)
-                and isa(use.operation.static_sizes.data, ArrayAttr[IntAttr])
+                and isa(sizes := use.operation.static_sizes.as_tuple(), tuple[int, ...])
             ):
-                return TensorType(
-                    use.operation.result.type.get_element_type(),
-                    use.operation.static_sizes.data,
-                )
+                return TensorType(use.operation.result.type.get_element_type(), sizes)
             for ret in use.operation.results:
                 if isa(r_type := ret.type, TensorType[Attribute]):
                     return r_type
@@ -196,8 +192,12 @@ class ArithOpTensorize(RewritePattern):
         If it is not a constant, create an empty tensor and `linalg.fill` it with the scalar value.
         """
         if isinstance(scalar_op, OpResult) and isinstance(scalar_op.op, Constant):
+            value = cast(AnyFloatAttr, scalar_op.op.value)
             tens_const = Constant(
-                DenseIntOrFPElementsAttr([dest_typ, ArrayAttr([scalar_op.op.value])])
+                DenseIntOrFPElementsAttr.from_list(
+                    cast(TensorType[AnyFloat], dest_typ),
+                    [value] * dest_typ.element_count(),
+                )
             )
             rewriter.insert_op(tens_const, InsertPoint.before(scalar_op.op))
             return tens_const.result
@@ -356,11 +356,8 @@ class ExtractSliceOpUpdateShape(RewritePattern):
     def match_and_rewrite(self, op: ExtractSliceOp, rewriter: PatternRewriter, /):
         if typ := get_required_result_type(op):
             if needs_update_shape(op.result.type, typ):
-                if isa(offsets := op.static_offsets.data.data, Sequence[IntAttr]):
-                    new_offsets = [o.data for o in offsets]
-                else:
-                    assert isa(offsets, Sequence[int])
-                    new_offsets = offsets
+                new_offsets = op.static_offsets.as_tuple()
+                assert isa(new_offsets, tuple[int, ...])
                 rewriter.replace_matched_op(
                     ExtractSliceOp.from_static_parameters(
                         op.source, new_offsets, typ.get_shape()
@@ -415,7 +412,7 @@ class ConstOpUpdateShape(RewritePattern):
                 if needs_update_shape(op.result.type, typ):
                     assert isinstance(op.value, DenseIntOrFPElementsAttr)
                     rewriter.replace_matched_op(
-                        Constant(DenseIntOrFPElementsAttr([typ, op.value.data]))
+                        Constant(DenseIntOrFPElementsAttr(typ, op.value.data))
                     )
 
 
@@ -75,9 +75,10 @@ class ConvertBinaryLinalgOp(RewritePattern):
             isinstance(op, OpResult)
             and isinstance(op.op, arith.Constant)
             and isa(val := op.op.value, DenseIntOrFPElementsAttr)
-            and val.data.data.count(val.data.data[0]) == len(val.data.data)
+            and val.get_num_elements()
+            and val.is_splat()
         ):
-            return val.data.data[0]
+            return val.get_attrs()[0]
 
 
 class ConvertLinalgAddPass(ConvertBinaryLinalgOp):
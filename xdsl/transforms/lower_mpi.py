@@ -1,6 +1,6 @@
 from abc import ABC
 from collections.abc import Sequence
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from math import prod
 from typing import TypeVar, cast
 
@@ -23,7 +23,7 @@ from xdsl.pattern_rewriter import (
     RewritePattern,
     op_type_rewrite_pattern,
 )
-from xdsl.traits import SymbolTable
+from xdsl.traits import SymbolTableCollection
 from xdsl.utils.hints import isa
 from xdsl.utils.isattr import isattr
 
@@ -738,6 +738,7 @@ class LowerMpiCommSize(_MPIToLLVMRewriteBase):
         ], [rank.dereferenced_value]
 
 
+@dataclass
 class MpiAddExternalFuncDefs(RewritePattern):
     """
     This rewriter adds all external function definitions for MPI calls to the module.
@@ -749,6 +750,13 @@ class MpiAddExternalFuncDefs(RewritePattern):
     this will match first and find no inserted MPI calls.
     """
 
+    symbol_tables: SymbolTableCollection = field(default_factory=SymbolTableCollection)
+    """
+    The symbol tables the definitions are inserted with, which can be shared across
+    pattern applications. They should be notified of the rewrites through their
+    listener.
+    """
+
     mpi_func_call_names = set(_MPIToLLVMRewriteBase.MPI_SYMBOL_NAMES.values())
 
     @op_type_rewrite_pattern
@@ -770,7 +778,9 @@ class MpiAddExternalFuncDefs(RewritePattern):
 
         # for each func found, add a FuncOp to the top of the module.
         for name, types in funcs_to_emit.items():
-            SymbolTable.insert_or_update(module, func.FuncOp.external(name, *types))
+            self.symbol_tables.insert_or_update(
+                module, func.FuncOp.external(name, *types)
+            )
 
 
 class LowerNullRequestOp(_MPIToLLVMRewriteBase):
@@ -864,7 +874,10 @@ class LowerMPIPass(ModulePass):
         )
 
         # add func.func to declare external functions
-        walker2 = PatternRewriteWalker(MpiAddExternalFuncDefs())
+        symbol_tables = SymbolTableCollection()
+        walker2 = PatternRewriteWalker(
+            MpiAddExternalFuncDefs(symbol_tables), listener=symbol_tables.get_listener()
+        )
 
         walker1.rewrite_module(op)
         walker2.rewrite_module(op)
@@ -66,9 +66,9 @@ class LowerSubviewOpPass(RewritePattern):
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: memref.Subview, rewriter: PatternRewriter, /):
         assert isa(op.source.type, MemRefType[Attribute])
-        assert len(op.static_sizes.data) == 1, "not implemented"
-        assert len(op.static_offsets.data) == 1, "not implemented"
-        assert len(op.static_strides.data) == 1, "not implemented"
+        assert len(op.static_sizes.as_tuple()) == 1, "not implemented"
+        assert len(op.static_offsets.as_tuple()) == 1, "not implemented"
+        assert len(op.static_strides.as_tuple()) == 1, "not implemented"
 
         last_op = op.source
         size_ops = self._update_sizes(op, last_op)
@@ -88,7 +88,7 @@ class LowerSubviewOpPass(RewritePattern):
         assert isa(subview.source.type, MemRefType[Attribute])
         ops = list[Operation]()
 
-        if subview.static_sizes.data.data[0].data == memref.Subview.DYNAMIC_INDEX:
+        if subview.static_sizes.as_tuple()[0] == memref.Subview.DYNAMIC_INDEX:
             ops.append(cast_op := arith.IndexCastOp(subview.sizes[0], csl.u16_value))
             ops.append(
                 curr_op := csl.SetDsdLengthOp.build(
@@ -100,7 +100,7 @@ class LowerSubviewOpPass(RewritePattern):
             ops.append(
                 len_op := arith.Constant(
                     IntegerAttr(
-                        cast(ArrayAttr[IntAttr], subview.static_sizes.data).data[0],
+                        cast(int, subview.static_sizes.as_tuple()[0]),
                         csl.u16_value,
                     )
                 )
@@ -119,7 +119,7 @@ class LowerSubviewOpPass(RewritePattern):
         assert isa(subview.source.type, MemRefType[Attribute])
         ops = list[Operation]()
 
-        if subview.static_strides.data.data[0].data == memref.Subview.DYNAMIC_INDEX:
+        if subview.static_strides.as_tuple()[0] == memref.Subview.DYNAMIC_INDEX:
             ops.append(
                 cast_op := arith.IndexCastOp(
                     subview.strides[0], IntegerType(8, Signedness.SIGNED)
@@ -135,7 +135,7 @@ class LowerSubviewOpPass(RewritePattern):
             ops.append(
                 stride_op := arith.Constant(
                     IntegerAttr(
-                        cast(ArrayAttr[IntAttr], subview.static_strides.data).data[0],
+                        cast(int, subview.static_strides.as_tuple()[0]),
                         IntegerType(8, Signedness.SIGNED),
                     )
                 )
@@ -154,7 +154,7 @@ class LowerSubviewOpPass(RewritePattern):
         assert isa(subview.source.type, MemRefType[Attribute])
         ops = list[Operation]()
 
-        if subview.static_offsets.data.data[0].data == memref.Subview.DYNAMIC_INDEX:
+        if subview.static_offsets.as_tuple()[0] == memref.Subview.DYNAMIC_INDEX:
             ops.append(cast_op := arith.IndexCastOp(subview.offsets[0], csl.i16_value))
             ops.append(
                 csl.IncrementDsdOffsetOp.build(
@@ -174,7 +174,7 @@ class LowerSubviewOpPass(RewritePattern):
             ops.append(
                 offset_op := arith.Constant(
                     IntegerAttr(
-                        cast(ArrayAttr[IntAttr], subview.static_offsets.data).data[0],
+                        cast(int, subview.static_offsets.as_tuple()[0]),
                         csl.i16_value,
                     )
                 )
@@ -32,6 +32,7 @@ class MLIROptPass(ModulePass):
         stream = StringIO()
         printer = Printer(print_generic_format=self.generic, stream=stream)
         printer.print(op)
+        printer.print_resources(ctx.resources)
 
         my_string = stream.getvalue()
 
@@ -1,3 +1,4 @@
+import functools
 import warnings
 from collections.abc import Callable
 from typing import ParamSpec, TypeVar
@@ -11,12 +12,19 @@ _P = ParamSpec("_P")
 
 
 def deprecated(reason: str):
-    """Deprecate the use of a method, and provide a warning message."""
+    """
+    Deprecate the use of a method, and provide a warning message.
+    Like `typing_extensions.deprecated`, calls emit a `DeprecationWarning` attributed
+    to the caller, and the decorated method keeps its name and docstring.
+    """
 
     def decorator(func: Callable[_P, _T]) -> Callable[_P, _T]:
+        @functools.wraps(func)
         def new_func(*args: _P.args, **kwargs: _P.kwargs) -> _T:
             warnings.warn(
-                f'Call to deprecated method {str(func).split(" ")[1]}: {reason}'
+                f"Call to deprecated method {func.__qualname__}: {reason}",
+                DeprecationWarning,
+                stacklevel=2,
             )
             return func(*args, **kwargs)
 
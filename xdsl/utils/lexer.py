@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
 from io import StringIO
@@ -32,31 +33,38 @@ class Input:
     def __len__(self):
         return self.len
 
+    def _get_line_starts(self) -> list[int]:
+        """
+        Get the offsets of the start of each line, computed on the first call.
+        """
+        if (line_starts := self.__dict__.get("_line_starts")) is None:
+            line_starts = [0]
+            line_starts.extend(m.end() for m in re.finditer("\n", self.content))
+            object.__setattr__(self, "_line_starts", line_starts)
+        return line_starts
+
     def get_lines_containing(self, span: Span) -> tuple[list[str], int, int] | None:
-        # A pointer to the start of the first line
-        start = 0
-        line_no = span.line_offset
+        if span.start > self.len:
+            return None
         source = self.content
-        while True:
-            next_start = source.find("\n", start)
-            line_no += 1
-            # Handle eof
+        # The index of the line containing the start of the span
+        line_starts = self._get_line_starts()
+        line_index = bisect_right(line_starts, span.start) - 1
+        # A pointer to the start of the first line
+        start = line_starts[line_index]
+        line_no = span.line_offset + line_index + 1
+        next_start = source.find("\n", span.start)
+        # Handle eof
+        if next_start == -1:
+            return [source[start:]], start, line_no
+        # If the whole span is on one line, we are good
+        if next_start >= span.end:
+            return [source[start:next_start]], start, line_no
+        while next_start < span.end:
+            next_start = source.find("\n", next_start + 1)
             if next_start == -1:
-                if span.start > len(source):
-                    return None
-                return [source[start:]], start, line_no
-            # As long as the next newline comes before the spans start we can continue
-            if next_start < span.start:
-                start = next_start + 1
-                continue
-            # If the whole span is on one line, we are good as well
-            if next_start >= span.end:
-                return [source[start:next_start]], start, line_no
-            while next_start < span.end:
-                next_start = source.find("\n", next_start + 1)
-                if next_start == -1:
-                    next_start = span.end
-            return source[start:next_start].split("\n"), start, line_no
+                next_start = span.end
+        return source[start:next_start].split("\n"), start, line_no
 
     def at(self, i: Position) -> str | None:
         if i >= self.len:
@@ -276,49 +284,27 @@ class Token:
 
         @staticmethod
         def get_punctuation_spelling_to_kind_dict() -> dict[str, Token.Kind]:
-            return {
-                "->": Token.Kind.ARROW,
-                ":": Token.Kind.COLON,
-                ",": Token.Kind.COMMA,
-                "...": Token.Kind.ELLIPSIS,
-                "=": Token.Kind.EQUAL,
-                ">": Token.Kind.GREATER,
-                "{": Token.Kind.L_BRACE,
-                "(": Token.Kind.L_PAREN,
-                "[": Token.Kind.L_SQUARE,
-                "<": Token.Kind.LESS,
-                "-": Token.Kind.MINUS,
-                "+": Token.Kind.PLUS,
-                "?": Token.Kind.QUESTION,
-                "}": Token.Kind.R_BRACE,
-                ")": Token.Kind.R_PAREN,
-                "]": Token.Kind.R_SQUARE,
-                "*": Token.Kind.STAR,
-                "|": Token.Kind.VERTICAL_BAR,
-                "{-#": Token.Kind.FILE_METADATA_BEGIN,
-                "#-}": Token.Kind.FILE_METADATA_END,
-            }
+            return dict(_PUNCTUATION_SPELLING_TO_KIND)
 
         def is_punctuation(self) -> bool:
-            punctuation_dict = Token.Kind.get_punctuation_spelling_to_kind_dict()
-            return self in punctuation_dict.values()
+            return self in _PUNCTUATION_KINDS
 
         @staticmethod
         def is_spelling_of_punctuation(
             spelling: str,
         ) -> TypeGuard[PunctuationSpelling]:
-            punctuation_dict = Token.Kind.get_punctuation_spelling_to_kind_dict()
-            return spelling in punctuation_dict.keys()
+            return spelling in _PUNCTUATION_SPELLING_TO_KIND
 
         @staticmethod
         def get_punctuation_kind_from_spelling(
             spelling: PunctuationSpelling,
         ) -> Token.Kind:
-            assert Token.Kind.is_spelling_of_punctuation(spelling), (
+            kind = _PUNCTUATION_SPELLING_TO_KIND.get(spelling)
+            assert kind is not None, (
                 "Kind.get_punctuation_kind_from_spelling: spelling is not a "
                 "valid punctuation spelling!"
             )
-            return Token.Kind.get_punctuation_spelling_to_kind_dict()[spelling]
+            return kind
 
     kind: Kind
 
@@ -363,6 +349,33 @@ class Token:
         return StringLiteral.from_span(self.span).string_contents
 
 
+_PUNCTUATION_SPELLING_TO_KIND: dict[str, Token.Kind] = {
+    "->": Token.Kind.ARROW,
+    ":": Token.Kind.COLON,
+    ",": Token.Kind.COMMA,
+    "...": Token.Kind.ELLIPSIS,
+    "=": Token.Kind.EQUAL,
+    ">": Token.Kind.GREATER,
+    "{": Token.Kind.L_BRACE,
+    "(": Token.Kind.L_PAREN,
+    "[": Token.Kind.L_SQUARE,
+    "<": Token.Kind.LESS,
+    "-": Token.Kind.MINUS,
+    "+": Token.Kind.PLUS,
+    "?": Token.Kind.QUESTION,
+    "}": Token.Kind.R_BRACE,
+    ")": Token.Kind.R_PAREN,
+    "]": Token.Kind.R_SQUARE,
+    "*": Token.Kind.STAR,
+    "|": Token.Kind.VERTICAL_BAR,
+    "{-#": Token.Kind.FILE_METADATA_BEGIN,
+    "#-}": Token.Kind.FILE_METADATA_END,
+}
+"""The kind of each punctuation token, indexed by its spelling."""
+
+_PUNCTUATION_KINDS = frozenset(_PUNCTUATION_SPELLING_TO_KIND.values())
+
+
 @dataclass
 class Lexer:
     input: Input
@@ -427,10 +440,105 @@ class Lexer:
         """
         return Token(kind, Span(start_pos, self.pos, self.input))
 
+    _SUFFIX_ID = r"(?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*)"
+
+    _token_regex = re.compile(
+        # Whitespace and comments preceding the token. Comments extend to the end of
+        # the line, so that backtracking cannot match a token inside them.
+        r"(?:\s|//[^\n]*(?![^\n]))*"
+        # Multi-character punctuation, which prefix other tokens
+        r"(?:(\{-\#)|(\#-\})|(->)|(\.\.\.)"
+        # Identifiers
+        r"|([a-zA-Z_][a-zA-Z0-9_$.]*)"
+        r"|(@[a-zA-Z_][a-zA-Z0-9_$.]*)"
+        rf"|(\#{_SUFFIX_ID})|(!{_SUFFIX_ID})|(\^{_SUFFIX_ID})|(%{_SUFFIX_ID})"
+        # String literals without escape sequences
+        r'|("[^"\\\n\v\f]*")'
+        # Number literals
+        r"|(0x[0-9a-fA-F]+)|([0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?)|([0-9]+)"
+        # Single-character punctuation
+        r"|(:)|(,)|(\()|(\))|(\{)|(\})|(\[)|(\])|(<)|(>)|(=)|(\+)|(-)|(\*)|(\?)"
+        r"|(\|))",
+        re.ASCII,
+    )
+    """
+    A regular expression matching the most common tokens, preceded by whitespace.
+    The index of the matched group corresponds to the token kind in `_token_kinds`.
+    """
+
+    _token_kinds = (
+        None,
+        Token.Kind.FILE_METADATA_BEGIN,
+        Token.Kind.FILE_METADATA_END,
+        Token.Kind.ARROW,
+        Token.Kind.ELLIPSIS,
+        Token.Kind.BARE_IDENT,
+        Token.Kind.AT_IDENT,
+        Token.Kind.HASH_IDENT,
+        Token.Kind.EXCLAMATION_IDENT,
+        Token.Kind.CARET_IDENT,
+        Token.Kind.PERCENT_IDENT,
+        Token.Kind.STRING_LIT,
+        Token.Kind.INTEGER_LIT,
+        Token.Kind.FLOAT_LIT,
+        Token.Kind.INTEGER_LIT,
+        Token.Kind.COLON,
+        Token.Kind.COMMA,
+        Token.Kind.L_PAREN,
+        Token.Kind.R_PAREN,
+        Token.Kind.L_BRACE,
+        Token.Kind.R_BRACE,
+        Token.Kind.L_SQUARE,
+        Token.Kind.R_SQUARE,
+        Token.Kind.LESS,
+        Token.Kind.GREATER,
+        Token.Kind.EQUAL,
+        Token.Kind.PLUS,
+        Token.Kind.MINUS,
+        Token.Kind.STAR,
+        Token.Kind.QUESTION,
+        Token.Kind.VERTICAL_BAR,
+    )
+    """The token kind of each group of `_token_regex`."""
+
     def lex(self) -> Token:
         """
         Lex a token from the input, and returns it.
         """
+        # Most tokens are matched by a single regular expression, the remaining
+        # tokens and errors are handled character by character.
+        match = self._token_regex.match(self.input.content, self.pos)
+        if match is None:
+            return self._lex_char_by_char()
+        index = cast(int, match.lastindex)
+        self.pos = end = match.end()
+        return Token(
+            self._token_kinds[index], Span(match.start(index), end, self.input)
+        )
+
+    _single_char_punctuation = {
+        ":": Token.Kind.COLON,
+        ",": Token.Kind.COMMA,
+        "(": Token.Kind.L_PAREN,
+        ")": Token.Kind.R_PAREN,
+        "}": Token.Kind.R_BRACE,
+        "[": Token.Kind.L_SQUARE,
+        "]": Token.Kind.R_SQUARE,
+        "<": Token.Kind.LESS,
+        ">": Token.Kind.GREATER,
+        "=": Token.Kind.EQUAL,
+        "+": Token.Kind.PLUS,
+        "*": Token.Kind.STAR,
+        "?": Token.Kind.QUESTION,
+        "|": Token.Kind.VERTICAL_BAR,
+    }
+    """The single-char punctuation that are not part of a multi-char token."""
+
+    def _lex_char_by_char(self) -> Token:
+        """
+        Lex a token from the input character by character, and returns it.
+        This handles all tokens, and raises errors for invalid inputs.
+        """
         # First, skip whitespaces
         self._consume_whitespace()
 
@@ -446,24 +554,8 @@ class Lexer:
             return self._lex_bare_identifier(start_pos)
 
         # single-char punctuation that are not part of a multi-char token
-        single_char_punctuation = {
-            ":": Token.Kind.COLON,
-            ",": Token.Kind.COMMA,
-            "(": Token.Kind.L_PAREN,
-            ")": Token.Kind.R_PAREN,
-            "}": Token.Kind.R_BRACE,
-            "[": Token.Kind.L_SQUARE,
-            "]": Token.Kind.R_SQUARE,
-            "<": Token.Kind.LESS,
-            ">": Token.Kind.GREATER,
-            "=": Token.Kind.EQUAL,
-            "+": Token.Kind.PLUS,
-            "*": Token.Kind.STAR,
-            "?": Token.Kind.QUESTION,
-            "|": Token.Kind.VERTICAL_BAR,
-        }
-        if current_char in single_char_punctuation:
-            return self._form_token(single_char_punctuation[current_char], start_pos)
+        if (kind := self._single_char_punctuation.get(current_char)) is not None:
+            return self._form_token(kind, start_pos)
 
         # '...'
         if current_char == ".":
@@ -0,0 +1,102 @@
+"""
+Read-only text streams over a range of a memory-mapped file, which are only decoded
+when read.
+"""
+
+from __future__ import annotations
+
+import io
+import mmap
+from os import PathLike
+from typing import TextIO
+
+
+class MappedTextIO(io.TextIOBase, TextIO):
+    """
+    A read-only text stream over a range of a buffer, either a string or a
+    memory-mapped UTF-8 file.
+    The range is only decoded when it is read, so that splitting a large file in
+    chunks does not copy it.
+    """
+
+    _buffer: str | mmap.mmap | bytes
+    """The underlying buffer."""
+
+    _start: int
+    """The start of the range of the stream in the buffer."""
+
+    _end: int
+    """The end of the range of the stream in the buffer."""
+
+    _stream: io.StringIO | None
+    """The decoded stream, created when the stream is not read all at once."""
+
+    def __init__(
+        self, buffer: str | mmap.mmap | bytes, start: int = 0, end: int | None = None
+    ):
+        super().__init__()
+        self._buffer = buffer
+        self._start = start
+        self._end = len(buffer) if end is None else end
+        self._stream = None
+
+    @staticmethod
+    def from_file(path: str | PathLike[str]) -> MappedTextIO:
+        """Create a stream over the memory-mapped contents of a UTF-8 file."""
+        with open(path, "rb") as f:
+            if not (size := f.seek(0, io.SEEK_END)):
+                # Empty files cannot be mapped
+                return MappedTextIO("")
+            # The mapping stays valid after the file is closed
+            return MappedTextIO(mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ))
+
+    def _decode(self) -> str:
+        if isinstance(self._buffer, str):
+            return self._buffer[self._start : self._end]
+        return str(memoryview(self._buffer)[self._start : self._end], "utf-8")
+
+    def read_bytes(self) -> bytes:
+        """Read the remaining contents of the stream without decoding them."""
+        if isinstance(self._buffer, str):
+            return self.read().encode()
+        data = self._buffer[self._start : self._end]
+        self._start = self._end
+        return data
+
+    def _get_stream(self) -> io.StringIO:
+        if self._stream is None:
+            self._stream = io.StringIO(self._decode())
+        return self._stream
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> str:
+        if self._stream is None and (size is None or size < 0):
+            # Reading everything at once does not need an intermediate stream
+            text = self._decode()
+            self._start = self._end
+            return text
+        return self._get_stream().read(size)
+
+    def readline(self, size: int | None = -1) -> str:
+        return self._get_stream().readline(size)
+
+    def split(self, separator: str) -> list[tuple[MappedTextIO, int]]:
+        """
+        Split the stream at each occurence of `separator`, without decoding it.
+        Return the streams of each chunk, with the number of lines preceding them.
+        """
+        buffer = self._buffer
+        sep = separator if isinstance(buffer, str) else separator.encode()
+        newline = "\n" if isinstance(buffer, str) else b"\n"
+
+        chunks: list[tuple[MappedTextIO, int]] = []
+        start = self._start
+        num_lines = 0
+        while (sep_start := buffer.find(sep, start, self._end)) != -1:  # pyright: ignore[reportArgumentType]
+            chunks.append((MappedTextIO(buffer, start, sep_start), num_lines))
+            num_lines += buffer[start:sep_start].count(newline)  # pyright: ignore[reportArgumentType]
+            start = sep_start + len(sep)
+        chunks.append((MappedTextIO(buffer, start, self._end), num_lines))
+        return chunks
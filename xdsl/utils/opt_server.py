@@ -0,0 +1,152 @@
+"""
+A server running xdsl-opt in a warm process, and its client.
+
+The client sends its command line arguments and working directory. The server forks a
+process per request, which runs the driver on these arguments, and asks the client for
+its standard input if the driver reads from it. The client then receives the exit code
+of the driver, and what it printed on stdout and stderr.
+
+Messages are sent as frames prefixed by their length, either raw bytes or JSON objects.
+"""
+
+from __future__ import annotations
+
+import io
+import json
+import os
+import socket
+import socketserver
+import struct
+import sys
+import traceback
+from collections.abc import Callable, Sequence
+from typing import IO, TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from xdsl.xdsl_opt_main import xDSLOptMain
+
+_FRAME_LENGTH = struct.Struct("!Q")
+
+
+def _send_frame(sock: socket.socket, data: bytes):
+    sock.sendall(_FRAME_LENGTH.pack(len(data)))
+    sock.sendall(data)
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    data = bytearray(size)
+    view = memoryview(data)
+    received = 0
+    while received < size:
+        if not (n := sock.recv_into(view[received:])):
+            raise ConnectionError("Connection closed in the middle of a message")
+        received += n
+    return bytes(data)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = _FRAME_LENGTH.unpack(_recv_exactly(sock, _FRAME_LENGTH.size))
+    return _recv_exactly(sock, size)
+
+
+def _send_message(sock: socket.socket, message: dict[str, Any]):
+    _send_frame(sock, json.dumps(message).encode())
+
+
+def _recv_message(sock: socket.socket) -> dict[str, Any]:
+    return json.loads(_recv_frame(sock))
+
+
+def _exit_code(e: SystemExit) -> int:
+    """Get the exit code of a process exiting with `e`, as the interpreter does."""
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+class _RequestHandler(socketserver.BaseRequestHandler):
+    server: OptServer
+    request: socket.socket
+
+    def handle(self):
+        message = _recv_message(self.request)
+        os.chdir(message["cwd"])
+
+        stdout = io.BytesIO()
+        stderr = io.BytesIO()
+        # The handler runs in a forked process, so the streams need not be restored
+        sys.stdout = io.TextIOWrapper(stdout, write_through=True)
+        sys.stderr = io.TextIOWrapper(stderr, write_through=True)
+        try:
+            main = self.server.create_main(message["args"])
+            if main.args.input_file is None:
+                _send_message(self.request, {"type": "stdin"})
+                sys.stdin = io.TextIOWrapper(io.BytesIO(_recv_frame(self.request)))
+            main.run()
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = _exit_code(e)
+        except Exception:
+            traceback.print_exc()
+            exit_code = 1
+
+        _send_message(self.request, {"type": "result", "exit_code": exit_code})
+        _send_frame(self.request, stdout.getvalue())
+        _send_frame(self.request, stderr.getvalue())
+
+
+class OptServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """
+    A server listening on a Unix socket, that processes each request in a process
+    forked from the server, so that everything loaded before serving is shared by
+    all requests.
+    """
+
+    socket_path: str
+    """The path of the socket the server listens on."""
+
+    create_main: Callable[[Sequence[str]], xDSLOptMain]
+    """Create the driver of a request from its command line arguments."""
+
+    def __init__(
+        self,
+        socket_path: str,
+        create_main: Callable[[Sequence[str]], xDSLOptMain],
+    ):
+        self.socket_path = socket_path
+        self.create_main = create_main
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+def run_client(
+    socket_path: str,
+    args: Sequence[str],
+    stdin: IO[bytes],
+    stdout: IO[bytes],
+    stderr: IO[bytes],
+) -> int:
+    """
+    Run xdsl-opt with the given arguments on the server listening on `socket_path`,
+    and return its exit code.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(socket_path)
+        _send_message(sock, {"args": list(args), "cwd": os.getcwd()})
+        while (message := _recv_message(sock))["type"] == "stdin":
+            _send_frame(sock, stdin.read())
+        output = _recv_frame(sock)
+        errors = _recv_frame(sock)
+
+    stdout.write(output)
+    stdout.flush()
+    stderr.write(errors)
+    stderr.flush()
+    return message["exit_code"]
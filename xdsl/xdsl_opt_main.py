@@ -2,10 +2,8 @@ import argparse
 import sys
 from collections.abc import Callable, Sequence
 from contextlib import redirect_stdout
-from importlib.metadata import version
 from io import StringIO
-from itertools import accumulate
-from typing import IO
+from typing import IO, Any
 
 from xdsl.context import MLContext
 from xdsl.dialects.builtin import ModuleOp
@@ -13,6 +11,7 @@ from xdsl.passes import ModulePass, PipelinePass
 from xdsl.printer import Printer
 from xdsl.tools.command_line_tool import CommandLineTool, get_all_passes
 from xdsl.utils.exceptions import DiagnosticException
+from xdsl.utils.mapped_text import MappedTextIO
 from xdsl.utils.parse_pipeline import parse_pipeline
 
 
@@ -28,6 +27,12 @@ class xDSLOptMain(CommandLineTool):
     stream.
     """
 
+    available_binary_targets: dict[str, Callable[[ModuleOp, IO[bytes]], None]]
+    """
+    A mapping from target names to functions that serialize a ModuleOp into a
+    binary stream.
+    """
+
     pipeline: PipelinePass
     """ The pass-pipeline to be applied. """
 
@@ -35,13 +40,22 @@ class xDSLOptMain(CommandLineTool):
         self,
         description: str = "xDSL modular optimizer driver",
         args: Sequence[str] | None = None,
+        ctx: MLContext | None = None,
     ):
+        """
+        If `ctx` is set, a copy of it is used instead of a new context in which all
+        dialects are registered.
+        """
         self.available_frontends = {}
         self.available_passes = {}
         self.available_targets = {}
+        self.available_binary_targets = {}
 
-        self.ctx = MLContext()
-        self.register_all_dialects()
+        if ctx is None:
+            self.ctx = MLContext()
+            self.register_all_dialects()
+        else:
+            self.ctx = ctx.clone()
         self.register_all_frontends()
         self.register_all_passes()
         self.register_all_targets()
@@ -59,24 +73,123 @@ class xDSLOptMain(CommandLineTool):
         """
         Executes the different steps.
         """
+        if self.args.server is not None:
+            self.serve(self.args.server)
+            return
         chunks, file_extension = self.prepare_input()
+        if self.args.target in self.available_binary_targets:
+            self._run_binary(chunks, file_extension)
+            return
         output_stream = self.prepare_output()
         try:
+            if self.args.jobs > 1 and len(chunks) > 1 and _can_fork():
+                self._run_parallel(chunks, file_extension, output_stream)
+                return
             for i, (chunk, offset) in enumerate(chunks):
-                try:
+                if i > 0:
+                    output_stream.write("// -----\n")
+                output_stream.write(self.process_chunk(chunk, file_extension, offset))
+                output_stream.flush()
+        finally:
+            if output_stream is not sys.stdout:
+                output_stream.close()
+
+    def process_chunk(self, chunk: IO[str], file_extension: str, offset: int) -> str:
+        """
+        Parse a chunk of the input, apply the passes on it, and return the resulting
+        program, or an empty string if a diagnostic was printed instead.
+        """
+        try:
+            module = self.parse_chunk(chunk, file_extension, offset)
+            if module is not None and self.apply_passes(module):
+                return self.output_resulting_program(module)
+            return ""
+        finally:
+            chunk.close()
+
+    def serve(self, socket_path: str):
+        """
+        Load all dialects and passes, then process the requests of `xdsl-opt-client`
+        received on the Unix socket `socket_path`, until interrupted.
+        """
+        from xdsl.utils.opt_server import OptServer
+
+        loaded_dialects = {dialect.name for dialect in self.ctx.loaded_dialects}
+        for dialect_name in tuple(self.ctx.registered_dialect_names):
+            if dialect_name not in loaded_dialects:
+                self.ctx.load_registered_dialect(dialect_name)
+        for pass_factory in self.available_passes.values():
+            pass_factory()
+
+        def create_main(args: Sequence[str]) -> xDSLOptMain:
+            return type(self)(args=args, ctx=self.ctx)
+
+        with OptServer(socket_path, create_main) as server:
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+    def _run_binary(self, chunks: list[tuple[IO[str], int]], file_extension: str):
+        """Process the input, and write the resulting program with a binary target."""
+        if len(chunks) != 1:
+            for chunk, _ in chunks:
+                chunk.close()
+            raise Exception(
+                f"Target '{self.args.target}' does not support split input files"
+            )
+        chunk, offset = chunks[0]
+        module = self.parse_chunk(chunk, file_extension, offset)
+        if module is None or not self.apply_passes(module):
+            return
+        output_target = self.available_binary_targets[self.args.target]
+        if self.args.output_file is None:
+            output_target(module, sys.stdout.buffer)
+            sys.stdout.buffer.flush()
+        else:
+            with open(self.args.output_file, "wb") as output:
+                output_target(module, output)
+
+    def _run_parallel(
+        self,
+        chunks: list[tuple[IO[str], int]],
+        file_extension: str,
+        output_stream: IO[str],
+    ):
+        """
+        Process the chunks in a pool of forked processes, each with its own copy of
+        the context, and write the results back in input order.
+        """
+        # Only imported when needed, as they are slow to import
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        mp_context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(
+            max_workers=self.args.jobs,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(self, chunks, file_extension),
+        ) as executor:
+            try:
+                results = executor.map(_process_chunk_in_worker, range(len(chunks)))
+                for i, (diagnostics, output, error) in enumerate(results):
                     if i > 0:
                         output_stream.write("// -----\n")
-                    module = self.parse_chunk(chunk, file_extension, offset)
-
-                    if module is not None:
-                        if self.apply_passes(module):
-                            output_stream.write(self.output_resulting_program(module))
                     output_stream.flush()
-                finally:
+                    # Diagnostics are printed on stdout, as in the serial mode
+                    sys.stdout.write(diagnostics)
+                    sys.stdout.flush()
+                    if error is not None:
+                        raise error
+                    output_stream.write(output)
+                    output_stream.flush()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+            finally:
+                for chunk, _ in chunks:
                     chunk.close()
-        finally:
-            if output_stream is not sys.stdout:
-                output_stream.close()
 
     def register_all_arguments(self, arg_parser: argparse.ArgumentParser):
         """
@@ -86,7 +199,7 @@ class xDSLOptMain(CommandLineTool):
         """
         super().register_all_arguments(arg_parser)
 
-        targets = [name for name in self.available_targets]
+        targets = [*self.available_targets, *self.available_binary_targets]
         arg_parser.add_argument(
             "-t",
             "--target",
@@ -142,6 +255,15 @@ class xDSLOptMain(CommandLineTool):
             " using `// -----`",
         )
 
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of processes used to process the chunks of "
+            "`--split-input-file` in parallel",
+        )
+
         arg_parser.add_argument(
             "--print-op-generic",
             default=False,
@@ -164,12 +286,41 @@ class xDSLOptMain(CommandLineTool):
         )
 
         arg_parser.add_argument(
-            "-v",
-            "--version",
-            action="version",
-            version=f"xdsl-opt built from xdsl version {version('xdsl')}\n",
+            "--elide-elementsattrs-if-larger",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Print dense elements attributes with more than N elements as an "
+            "elided `dense_resource` placeholder",
+        )
+
+        arg_parser.add_argument(
+            "--print-elementsattrs-with-hex-if-larger",
+            type=int,
+            default=None,
+            metavar="N",
+            help="Print dense elements attributes with more than N elements in the "
+            "hex form",
         )
 
+        arg_parser.add_argument(
+            "--print-aliases",
+            default=False,
+            action="store_true",
+            help="Print large attributes and types used several times as aliases",
+        )
+
+        arg_parser.add_argument(
+            "--server",
+            type=str,
+            default=None,
+            metavar="SOCKET",
+            help="Keep running with all dialects and passes loaded, and process the "
+            "requests of `xdsl-opt-client` received on the Unix socket SOCKET",
+        )
+
+        arg_parser.add_argument("-v", "--version", action=_VersionAction)
+
     def register_pass(
         self, pass_name: str, pass_factory: Callable[[], type[ModulePass]]
     ):
@@ -197,8 +348,14 @@ class xDSLOptMain(CommandLineTool):
                 print_generic_format=self.args.print_op_generic,
                 print_properties_as_attributes=self.args.print_no_properties,
                 print_debuginfo=self.args.print_debuginfo,
+                elide_elementsattrs_if_larger=self.args.elide_elementsattrs_if_larger,
+                print_elementsattrs_with_hex_if_larger=(
+                    self.args.print_elementsattrs_with_hex_if_larger
+                ),
+                print_aliases=self.args.print_aliases,
             )
             printer.print_op(prog)
+            printer.print_resources(self.ctx.resources)
             print("\n", file=output)
 
         def _output_riscv_asm(prog: ModuleOp, output: IO[str]):
@@ -247,6 +404,13 @@ class xDSLOptMain(CommandLineTool):
         self.available_targets["wat"] = _output_wat
         self.available_targets["csl"] = _print_to_csl
 
+        def _output_bytecode(prog: ModuleOp, output: IO[bytes]):
+            from xdsl.bytecode import BytecodeWriter
+
+            BytecodeWriter(output, self.ctx.resources).write_op(prog)
+
+        self.available_binary_targets["bytecode"] = _output_bytecode
+
     def setup_pipeline(self):
         """
         Creates a pipeline that consists of all the passes specified.
@@ -261,7 +425,16 @@ class xDSLOptMain(CommandLineTool):
                 module.verify()
             if self.args.print_between_passes:
                 print(f"IR after {previous_pass.name}:")
-                printer = Printer(stream=sys.stdout)
+                printer = Printer(
+                    stream=sys.stdout,
+                    elide_elementsattrs_if_larger=(
+                        self.args.elide_elementsattrs_if_larger
+                    ),
+                    print_elementsattrs_with_hex_if_larger=(
+                        self.args.print_elementsattrs_with_hex_if_larger
+                    ),
+                    print_aliases=self.args.print_aliases,
+                )
                 printer.print_op(module)
                 print("\n\n\n")
 
@@ -288,14 +461,9 @@ class xDSLOptMain(CommandLineTool):
         f, file_extension = self.get_input_stream()
         chunks = [(f, 0)]
         if self.args.split_input_file:
-            chunks_str = [chunk for chunk in f.read().split("// -----")]
-            chunks_off = accumulate(
-                [0, *[chunk.count("\n") for chunk in chunks_str[:-1]]]
-            )
-            chunks = [
-                (StringIO(chunk), off)
-                for chunk, off in zip(chunks_str, chunks_off, strict=True)
-            ]
+            # Split files by offset, so that each chunk is only decoded when parsed
+            text = f if isinstance(f, MappedTextIO) else MappedTextIO(f.read())
+            chunks = [(chunk, offset) for chunk, offset in text.split("// -----")]
             f.close()
         if self.args.frontend:
             file_extension = self.args.frontend
@@ -338,3 +506,66 @@ class xDSLOptMain(CommandLineTool):
 
         self.available_targets[self.args.target](prog, output)
         return output.getvalue()
+
+
+class _VersionAction(argparse.Action):
+    """
+    Print the version of xDSL and exit.
+    The version is only queried when requested, as `importlib.metadata` is slow to
+    import.
+    """
+
+    def __init__(self, option_strings: Sequence[str], dest: str, **kwargs: Any):
+        super().__init__(
+            option_strings,
+            dest=argparse.SUPPRESS,
+            default=argparse.SUPPRESS,
+            nargs=0,
+            help="show program's version number and exit",
+        )
+
+    def __call__(
+        self,
+        parser: argparse.ArgumentParser,
+        namespace: argparse.Namespace,
+        values: Any,
+        option_string: str | None = None,
+    ):
+        from importlib.metadata import version
+
+        print(f"xdsl-opt built from xdsl version {version('xdsl')}")
+        parser.exit()
+
+
+def _can_fork() -> bool:
+    """Return if worker processes can be forked on this platform."""
+    import multiprocessing
+
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+_worker_state: tuple[xDSLOptMain, list[tuple[IO[str], int]], str] | None = None
+"""The driver, input chunks, and file extension of a forked worker process."""
+
+
+def _init_worker(
+    main: xDSLOptMain, chunks: list[tuple[IO[str], int]], file_extension: str
+):
+    global _worker_state
+    _worker_state = (main, chunks, file_extension)
+
+
+def _process_chunk_in_worker(index: int) -> tuple[str, str, Exception | None]:
+    """
+    Process a chunk in a worker process, and return what was printed on stdout, the
+    resulting program, and the exception raised, if any.
+    """
+    assert _worker_state is not None
+    main, chunks, file_extension = _worker_state
+    chunk, offset = chunks[index]
+    with redirect_stdout(StringIO()) as diagnostics:
+        try:
+            output = main.process_chunk(chunk, file_extension, offset)
+        except Exception as e:
+            return diagnostics.getvalue(), "", e
+    return diagnostics.getvalue(), output, None